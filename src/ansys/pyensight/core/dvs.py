@@ -27,6 +27,7 @@ launch a local PyEnSight session, or connect to an existing one, and finally
 to send data from the clients to the servers.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import glob
 import io
 import logging
@@ -40,7 +41,7 @@ import tempfile
 import threading
 import time
 import traceback
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 import warnings
 
 from ansys.api.pyensight.dvs_api import dvs_base
@@ -52,6 +53,42 @@ if TYPE_CHECKING:
     from ansys.pyensight.core import Session
 
 
+def _wait_with_backoff(
+    ready: Callable[[], bool],
+    timeout: float,
+    initial_interval: float = 0.005,
+    max_interval: float = 0.1,
+) -> bool:
+    """Wait until a condition is met, polling with an exponential backoff.
+
+    Parameters
+    ----------
+    ready: Callable
+        the function checking the condition
+    timeout: float
+        the maximum time to wait for, in seconds
+    initial_interval: float
+        the first polling interval, in seconds. The interval doubles after each check
+    max_interval: float
+        the upper bound of the polling interval, in seconds
+
+    Returns
+    -------
+    bool
+        True if the condition was met within the timeout
+    """
+    start = time.time()
+    interval = initial_interval
+    while True:
+        if ready():
+            return True
+        remaining = timeout - (time.time() - start)
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, max_interval, remaining))
+        interval *= 2
+
+
 class DVS(dvs_base):
     """Create an instance of the DVS module.
 
@@ -72,6 +109,11 @@ class DVS(dvs_base):
     lib_folder: str
         The optional full path to a folder that contains the DVS libraries and Python
         bindings.
+    max_send_workers: int
+        The maximum number of clients data is sent to concurrently. The default is 8.
+    max_poll_interval: float
+        The upper bound, in seconds, of the interval used to poll the DVS servers
+        while waiting for them. The default is 0.1.
     """
 
     def __init__(
@@ -79,6 +121,8 @@ class DVS(dvs_base):
         session: Optional["Session"] = None,
         ansys_installation: Optional[str] = None,
         lib_folder: Optional[str] = None,
+        max_send_workers: int = 8,
+        max_poll_interval: float = 0.1,
     ) -> None:
         super().__init__(session=session)
         self._ansys_installation: Optional[str] = None
@@ -95,7 +139,7 @@ class DVS(dvs_base):
         self._connect_session = self._session
         self._servers: Dict[int, Dict[str, Union[str, int]]] = {}
         self._server_ids: List[int] = []
-        self._clients: Dict[int, Dict[str, Union[str, int, bool]]] = {}
+        self._clients: Dict[int, Dict[str, Union[str, int, bool, None]]] = {}
         self._client_count = 0
         self._attempt_dvs_python_bindings_import()
         self._parts: Dict[int, Any] = {}
@@ -116,6 +160,11 @@ class DVS(dvs_base):
             self._cache_folder = "/home/ensight/dvs_cache"
         self._dataset_name: Optional[str] = None
         self._secret_key: Optional[str] = None
+        self._max_send_workers = max(1, max_send_workers)
+        self._max_poll_interval = max_poll_interval
+        # Notified each time a client update begins (or fails to)
+        self._update_condition = threading.Condition()
+        self._wait_stats: Dict[str, Dict[str, float]] = {}
 
     @staticmethod
     def _is_windows():
@@ -329,13 +378,13 @@ class DVS(dvs_base):
                             {"server_uri": uri_to_save, "port": int(port.group(1))}
                         )
             self._total_ranks = ranks_per_server * len(self._server_ids)
-            started = False
             start = time.time()
-            while not started and time.time() - start < 60:
-                if not all([self.server_started(s) for s in self._server_ids]):
-                    time.sleep(0.5)
-                else:
-                    started = True
+            started = _wait_with_backoff(
+                lambda: all([self.server_started(s) for s in self._server_ids]),
+                60,
+                max_interval=self._max_poll_interval,
+            )
+            self._record_wait("servers_started", start)
             if not started:
                 raise RuntimeError("The DVS servers have not started in 60 seconds.")
         except Exception as e:
@@ -371,6 +420,7 @@ class DVS(dvs_base):
             "server_id": server_id,
             "rank": rank,
             "update_started": False,
+            "update_error": None,
         }
         self._client_count += 1
 
@@ -434,7 +484,11 @@ class DVS(dvs_base):
             self._start_dvs_client(int(server["server_id"]), rank, dedup=dedup)
 
     def _begin_update(
-        self, client_dict: Dict[str, Union[str, int, bool]], time: float, rank: int, chunk: int
+        self,
+        client_dict: Dict[str, Union[str, int, bool, None]],
+        time: float,
+        rank: int,
+        chunk: int,
     ):
         """Start an update.
 
@@ -451,10 +505,15 @@ class DVS(dvs_base):
         """
         try:
             _ = self.begin_update(client_dict["client_id"], self._update_num, time, rank, chunk)
-            client_dict["update_started"] = True
+            with self._update_condition:
+                client_dict["update_started"] = True
+                self._update_condition.notify_all()
         except Exception as e:
             traceback.print_exc()
-            raise RuntimeError(f"Couldn't begin update. Error: {e}")
+            with self._update_condition:
+                # the error is reported by wait_for_updates()
+                client_dict["update_error"] = str(e)
+                self._update_condition.notify_all()
 
     def begin_updates(self, time: float):
         """Begin an update on all the clients available for the input time value.
@@ -470,6 +529,10 @@ class DVS(dvs_base):
         time: float
             The time value for the current update. May be a time already used
         """
+        with self._update_condition:
+            for client_vals in self._clients.values():
+                client_vals["update_started"] = False
+                client_vals["update_error"] = None
         for _, client_vals in self._clients.items():
             thread = threading.Thread(
                 target=self._begin_update, args=(client_vals, time, client_vals["rank"], 0)
@@ -571,27 +634,92 @@ class DVS(dvs_base):
             self.add_var_info(client["client_id"], [var])
         self._vars[var_id] = var
 
-    def _check_updates_started(self):
+    def _record_wait(self, name: str, start: float):
+        """Add the time spent waiting since start to the named wait statistics.
+
+        Parameters
+        ----------
+        name: str
+            the name of the wait
+        start: float
+            the time the wait started at
+        """
+        elapsed = time.time() - start
+        stats = self._wait_stats.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        stats["count"] += 1
+        stats["total"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+
+    @property
+    def wait_statistics(self) -> Dict[str, Dict[str, float]]:
+        """The time spent waiting for the DVS servers and clients.
+
+        For each kind of wait ("servers_started", "updates_started" and "timestep_count")
+        a dictionary with the number of waits ("count"), the total time ("total") and the
+        longest wait ("max"), in seconds.
+        """
+        return {k: dict(v) for k, v in self._wait_stats.items()}
+
+    def _check_updates_started(self, timeout: float = 60.0):
         """Check that all the updates started successfully.
 
         This is required because the launch of the updates is threaded.
+        The update threads notify a condition as they complete, so this
+        returns as soon as the last update has begun.
+
+        Parameters
+        ----------
+        timeout: float
+            the maximum time to wait for, in seconds
         """
-        started = False
         start = time.time()
-        while not started and time.time() - start < 60:
+
+        def done():
+            clients = self._clients.values()
+            return all([v["update_started"] for v in clients]) or any(
+                [v.get("update_error") for v in clients]
+            )
+
+        with self._update_condition:
+            self._update_condition.wait_for(done, timeout=timeout)
             started = all([vals["update_started"] for c, vals in self._clients.items()])
-            if not started:
-                time.sleep(0.5)
+        self._record_wait("updates_started", start)
         if not started:
             for c, vals in self._clients.items():
                 update = vals["update_started"]
                 logging.debug(f"Client {c}, update: {update}")
+            errors = [v["update_error"] for v in self._clients.values() if v.get("update_error")]
+            if errors:
+                raise RuntimeError(f"Not all clients have begun the updates. Error: {errors[0]}")
             raise RuntimeError("Not all clients have begun the updates.")
 
+    def _send_to_clients(self, send: Callable[[int, Dict[str, Any]], None]):
+        """Call a send function for all the clients concurrently.
+
+        The calls are made from a pool of at most ``max_send_workers`` threads.
+        Any exception raised by a call is raised again once all the calls are done.
+
+        Parameters
+        ----------
+        send: Callable
+            the function to call. It is passed the client index and the client dictionary.
+        """
+        if self._client_count < 2 or self._max_send_workers < 2:
+            for c in range(self._client_count):
+                send(c, self._clients[c])
+            return
+        workers = min(self._max_send_workers, self._client_count)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(send, c, self._clients[c]) for c in range(self._client_count)]
+        for future in futures:
+            future.result()
+
     def send_coordinates(self, part_id: int, vertices: Union[List[float], numpy.ndarray]):
         """Send the coordinates data for the input part.
 
-        The full coordinates array will be sent across all the ranks.
+        The full coordinates array will be sent across all the ranks, unless
+        the connectivity of the part was sent with ``partition_nodes`` set.
+        In that case each rank receives only the vertices its elements use.
         The data will be used for building a mesh chunk in DVS.
         The data are assumed in the following format:
         [x0, y0, z0, x1, y1, z1, ...]
@@ -610,16 +738,23 @@ class DVS(dvs_base):
         if not isinstance(vertices, numpy.ndarray):
             vertices = numpy.array(vertices)
         reshaped_vertices = vertices.reshape(-1, 3)
-        x_coords = reshaped_vertices[:, 0]
-        y_coords = reshaped_vertices[:, 1]
-        z_coords = reshaped_vertices[:, 2]
+        rank_nodes = self._parts[part_id].get("rank_nodes")
         self._check_updates_started()
-        for c in range(self._client_count):
-            client = self._clients[c]
+
+        def send(c: int, client: Dict[str, Any]):
+            coords = reshaped_vertices
+            if rank_nodes is not None:
+                coords = reshaped_vertices[rank_nodes[c]]
             self.update_nodes(
-                client["client_id"], part_id=part_id, x=x_coords, y=y_coords, z=z_coords
+                client["client_id"],
+                part_id=part_id,
+                x=coords[:, 0],
+                y=coords[:, 1],
+                z=coords[:, 2],
             )
 
+        self._send_to_clients(send)
+
     def send_variable_data(
         self,
         var_id: int,
@@ -637,6 +772,8 @@ class DVS(dvs_base):
         values: List[int] or numpy array
             the variablle array. If the variable is a vector, the values are expected as
             [v1x, v1y, v1z, v2x, v2y, v2z ...]
+            If the connectivity of the part was sent with ``partition_nodes`` set, each
+            rank receives only the values of its own vertices or elements.
         """
         if not self._vars.get(var_id):
             raise RuntimeError(
@@ -659,12 +796,22 @@ class DVS(dvs_base):
             raise RuntimeError("Var type is not an integer")
         if isinstance(location, (str, bool, dict)):
             raise RuntimeError("Location is not an integer")
-        for c in range(self._client_count):
-            client = self._clients[c]
+        rank_nodes = self._parts[part_id].get("rank_nodes")
+        rank_elements = self._parts[part_id].get("rank_elements")
+        components = 3 if var_type == self.VARTYPE_VECTOR else 1
+        reshaped_values = values.reshape(-1, components)
+
+        def send(c: int, client: Dict[str, Any]):
+            client_values = values
+            if location == self.LOCATION_NODE and rank_nodes is not None:
+                client_values = reshaped_values[rank_nodes[c]].reshape(-1)
+            elif location == self.LOCATION_ELEMENT and rank_elements is not None:
+                start, end = rank_elements[c]
+                client_values = reshaped_values[start:end].reshape(-1)
             if var_type == self.VARTYPE_SCALAR:
                 if location == self.LOCATION_NODE:
                     self.update_var_node_scalar(
-                        client["client_id"], var_id=var_id, part_id=part_id, values=values
+                        client["client_id"], var_id=var_id, part_id=part_id, values=client_values
                     )
                 elif location == self.LOCATION_ELEMENT:
                     self.update_var_element_scalar(
@@ -672,12 +819,12 @@ class DVS(dvs_base):
                         var_id=var_id,
                         part_id=part_id,
                         elem_type=elem_type,
-                        values=values,
+                        values=client_values,
                     )
             elif var_type == self.VARTYPE_VECTOR:
                 if location == self.LOCATION_NODE:
                     self.update_var_node_vector(
-                        client["client_id"], var_id=var_id, part_id=part_id, values=values
+                        client["client_id"], var_id=var_id, part_id=part_id, values=client_values
                     )
                 elif location == self.LOCATION_ELEMENT:
                     self.update_var_element_vector(
@@ -685,33 +832,34 @@ class DVS(dvs_base):
                         var_id=var_id,
                         part_id=part_id,
                         elem_type=elem_type,
-                        values=values,
+                        values=client_values,
                     )
 
+        self._send_to_clients(send)
+
     @staticmethod
-    def _split_list(lst: Union[List[int], List[float]], num_parts: int):
-        """Split the input list in n parts.
+    def _split_ranges(n: int, num_parts: int) -> List[Tuple[int, int]]:
+        """Split the range [0, n) in num_parts contiguous ranges of near equal size.
 
-        lst: list
-            the list to be split
+        n: int
+            the number of items to split
         num_parts: int
-            the number of parts to split the list into
+            the number of parts to split the items into
 
         Returns
         -------
-        parts: list
-            A list containing the parts the original list was split into
+        ranges: list
+            A list containing the (start, end) indices of each part
         """
-        n = len(lst)
         part_size = n // num_parts
         remainder = n % num_parts
-        parts = []
+        ranges = []
         start = 0
         for i in range(num_parts):
             end = start + part_size + (1 if i < remainder else 0)
-            parts.append(lst[start:end])
+            ranges.append((start, end))
             start = end
-        return parts
+        return ranges
 
     def send_connectivity(
         self,
@@ -719,6 +867,7 @@ class DVS(dvs_base):
         offsets: Union[List, numpy.ndarray],
         faces: Union[List, numpy.ndarray],
         ghost=False,
+        partition_nodes=False,
     ):
         """Send the connectivity data for the input part.
 
@@ -741,6 +890,11 @@ class DVS(dvs_base):
             the connectivity value. The format is described above.
         ghost: bool
             True if the input data contains ghost elements.
+        partition_nodes: bool
+            If True, each rank only receives the vertices used by its own elements,
+            and the connectivity sent to it is renumbered accordingly. The following
+            ``send_coordinates()`` and ``send_variable_data()`` calls for the part
+            then send each rank only its own slice of the data.
         """
         if not self._clients:
             raise RuntimeError("No DVS clients started yet.")
@@ -748,15 +902,15 @@ class DVS(dvs_base):
             raise RuntimeError(
                 "Please create the part first via create_part() or the lower level add_part_info."
             )
-        if not isinstance(faces, numpy.ndarray):
-            faces = numpy.array(faces)
-        if not isinstance(offsets, numpy.ndarray):
-            offsets = numpy.array(offsets)
+        faces = numpy.asarray(faces)
+        offsets = numpy.asarray(offsets)
+        # The faces are kept as a flat connectivity array plus the number of vertices
+        # of each face.  The faces assigned to a rank are then a contiguous slice
+        # of the connectivity array, so no per-face arrays are ever built.
         vertices_per_face = numpy.diff(offsets)
-        connectivity_split = numpy.split(faces, numpy.cumsum(vertices_per_face[:-1]))
+        face_bounds = offsets - offsets[0]
         elem_type = self.ELEMTYPE_N_SIDED_POLYGON
-        all_same = numpy.all(numpy.array(vertices_per_face) == vertices_per_face[0])
-        if all_same:
+        if len(vertices_per_face) and numpy.all(vertices_per_face == vertices_per_face[0]):
             num_vertices = vertices_per_face[0]
             _elem_type = self._elem_type_map.get(num_vertices)
             if _elem_type:
@@ -764,17 +918,16 @@ class DVS(dvs_base):
         if ghost:
             elem_type += 1
         self._check_updates_started()
-        split_arrays = self._split_list(connectivity_split, self._total_ranks)
-        split_num_faces = self._split_list(vertices_per_face, self._total_ranks)
-        for c in range(self._client_count):
-            client = self._clients[c]
-            arrays = split_arrays[c]
-            if len(arrays) > 1:
-                indices = numpy.concatenate(arrays)
-            elif arrays:
-                indices = arrays[0]
-            else:
-                indices = numpy.array([])
+        rank_ranges = self._split_ranges(len(vertices_per_face), self._total_ranks)
+        rank_nodes: Dict[int, numpy.ndarray] = {}
+
+        def send(c: int, client: Dict[str, Any]):
+            start, end = rank_ranges[c]
+            indices = faces[face_bounds[start] : face_bounds[end]]
+            if partition_nodes:
+                # the sorted unique vertices of the rank become its local vertex list
+                rank_nodes[c], indices = numpy.unique(indices, return_inverse=True)
+                indices = indices.reshape(-1)
             if elem_type not in [
                 self.ELEMTYPE_N_SIDED_POLYGON,
                 self.ELEMTYPE_N_SIDED_POLYGON_GHOST,
@@ -783,14 +936,21 @@ class DVS(dvs_base):
                     client["client_id"], part_id=part_id, elem_type=elem_type, indices=indices
                 )
             else:
-                connectivity_num_faces = split_num_faces[c]
                 self.update_elements_polygon(
                     client["client_id"],
                     part_id=part_id,
                     elem_type=elem_type,
-                    nodes_per_polygon=numpy.array(connectivity_num_faces),
+                    nodes_per_polygon=vertices_per_face[start:end],
                     indices=indices,
                 )
+
+        self._send_to_clients(send)
+        if partition_nodes:
+            self._parts[part_id]["rank_nodes"] = rank_nodes
+            self._parts[part_id]["rank_elements"] = rank_ranges
+        else:
+            self._parts[part_id].pop("rank_nodes", None)
+            self._parts[part_id].pop("rank_elements", None)
         self._parts[part_id]["dvs_elem_type"] = elem_type
 
     def _check_timestep_count(self, timeout=120.0):
@@ -801,16 +961,17 @@ class DVS(dvs_base):
         timeout: float
             the timeout to set while checking for pending timesteps
         """
-        ready = False
-        start = time.time()
-        while not ready and time.time() - start < timeout:
+
+        def no_pending():
             vals = []
             for server_id in self._server_ids:
                 num_pending, num_complete = self.server_timestep_count(server_id)
                 vals.append(num_pending == 0)
-            ready = all(vals)
-            if not ready:
-                time.sleep(0.5)
+            return all(vals)
+
+        start = time.time()
+        ready = _wait_with_backoff(no_pending, timeout, max_interval=self._max_poll_interval)
+        self._record_wait("timestep_count", start)
         if not ready:
             raise RuntimeError(
                 f"There are still pending timesteps within the input timeout of {timeout} seconds"
@@ -834,7 +995,8 @@ class DVS(dvs_base):
         for c in range(self._client_count):
             client = self._clients[c]
             _ = self.end_update(client["client_id"])
-            client["update_started"] = False
+            with self._update_condition:
+                client["update_started"] = False
         self._update_num += 1
 
     def delete_item_on_clients(self, update_num, filter=""):
@@ -27,13 +27,14 @@ interface to the EnSight gRPC interface, including event streams.
 
 """
 
+from collections import deque
 from concurrent import futures
 import os
 import platform
 import sys
 import tempfile
 import threading
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Deque, List, Optional, Set, Tuple, Union
 import uuid
 
 from ansys.api.pyensight.v0 import dynamic_scene_graph_pb2_grpc, ensight_pb2, ensight_pb2_grpc
@@ -82,6 +83,11 @@ class EnSightGRPC(object):
     documentation for your installed product for additional information.
     """
 
+    #: Default maximum number of events queued on the instance
+    EVENT_QUEUE_SIZE = 10000
+    #: Supported policies when an event arrives and the queue is full
+    EVENT_OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
     def __init__(
         self,
         host: str = "127.0.0.1",
@@ -108,9 +114,17 @@ class EnSightGRPC(object):
         # Event (strings)
         self._event_stream = None
         self._event_thread: Optional[threading.Thread] = None
-        self._events: List[Any] = list()
-        # Callback for events (self._events not used)
+        self._events: Deque[str] = deque()
+        self._event_condition = threading.Condition()
+        self._event_queue_size = self.EVENT_QUEUE_SIZE
+        self._event_overflow = "drop_oldest"
+        self._event_coalesce = False
+        # tags of the queued events, used to coalesce identical events
+        self._event_tags: Set[str] = set()
+        self._events_dropped = 0
+        # Callback for events (the queued events are passed to it by a dispatch thread)
         self._event_callback: Optional[Callable] = None
+        self._event_dispatch_thread: Optional[threading.Thread] = None
         self._prefix: Optional[str] = None
         self._shmem_module = None
         self._shmem_filename: Optional[str] = None
@@ -277,7 +291,10 @@ class EnSightGRPC(object):
         options = [
             ("grpc.max_receive_message_length", -1),
             ("grpc.max_send_message_length", -1),
-            ("grpc.testing.fixed_reconnect_backoff_ms", 1100),
+            # reconnect quickly to a server that is starting, with jittered exponential backoff
+            ("grpc.initial_reconnect_backoff_ms", 100),
+            ("grpc.min_reconnect_backoff_ms", 100),
+            ("grpc.max_reconnect_backoff_ms", 2000),
         ]
         if self._grpc_use_tcp_sockets:
             host = self._host
@@ -503,8 +520,9 @@ class EnSightGRPC(object):
         This method makes a EnSightService::GetEventStream() gRPC call into EnSight, returning
         an ensightservice::EventReply stream.  The method creates a thread to hold this
         stream open and read new events from it.  The thread adds the event strings to
-        a list of events stored on this instance.  If callback is not None, the object
-        will be called with the event string, otherwise they can be retrieved using get_event().
+        a bounded queue of events stored on this instance (see event_queue_configure()).
+        If callback is not None, a second thread calls the object with each queued event
+        string, otherwise they can be retrieved using get_event().
         """
         if self._event_stream is not None:  # pragma: no cover
             return  # pragma: no cover
@@ -518,6 +536,55 @@ class EnSightGRPC(object):
         self._event_thread = threading.Thread(target=self._poll_events)
         self._event_thread.daemon = True
         self._event_thread.start()
+        if callback is not None:
+            self._event_dispatch_thread = threading.Thread(target=self._dispatch_events)
+            self._event_dispatch_thread.daemon = True
+            self._event_dispatch_thread.start()
+
+    def event_queue_configure(
+        self,
+        size: Optional[int] = None,
+        overflow: Optional[str] = None,
+        coalesce: Optional[bool] = None,
+    ) -> None:
+        """Configure the queue holding the incoming event strings
+
+        The events are buffered in a queue of bounded size until they are retrieved
+        via get_event() or passed to the event callback.  When the queue is full, the
+        overflow policy selects the event that is dropped: the oldest queued event
+        ("drop_oldest") or the incoming one ("drop_newest").  If coalesce is True, an
+        incoming event identical to an event still in the queue is dropped, so bursts of
+        identical events result in a single event.  Arguments that are None are left
+        unchanged.
+
+        Parameters
+        ----------
+        size: int, optional
+            Maximum number of queued events.
+        overflow: str, optional
+            One of EVENT_OVERFLOW_POLICIES.
+        coalesce: bool, optional
+            If True, coalesce identical queued events.
+        """
+        if size is not None and size < 1:
+            raise RuntimeError("The event queue size must be at least 1")
+        if overflow is not None and overflow not in self.EVENT_OVERFLOW_POLICIES:
+            raise RuntimeError(f"Unknown event overflow policy '{overflow}'")
+        with self._event_condition:
+            if size is not None:
+                self._event_queue_size = size
+                while len(self._events) > size:
+                    self._drop_event()
+            if overflow is not None:
+                self._event_overflow = overflow
+            if coalesce is not None:
+                self._event_coalesce = coalesce
+                self._event_tags = set(self._events) if coalesce else set()
+
+    @property
+    def events_dropped(self) -> int:
+        """The number of events dropped because the event queue was full"""
+        return self._events_dropped
 
     def event_stream_is_enabled(self) -> bool:
         """Check to see if the event stream is enabled
@@ -560,21 +627,64 @@ class EnSightGRPC(object):
         -------
             None or the oldest event string in the queue.
         """
-        try:
-            return self._events.pop(0)
-        except IndexError:
-            return None
+        with self._event_condition:
+            try:
+                tag = self._events.popleft()
+            except IndexError:
+                return None
+            self._event_tags.discard(tag)
+            return tag
+
+    def _drop_event(self) -> None:
+        """Drop the oldest event in the queue
+
+        The caller must hold the event condition lock.
+        """
+        self._event_tags.discard(self._events.popleft())
+        self._events_dropped += 1
 
     def _put_event(self, evt: "ensight_pb2.EventReply") -> None:
         """Add an event record to the event queue on this instance
 
         This method is used by threads to make the events they receive available to
-        calling applications via get_event().
+        calling applications via get_event() or the event callback.  The event queue
+        overflow and coalescing policies are applied here.
         """
-        if self._event_callback:  # pragma: no cover
-            self._event_callback(evt.tag)
-            return
-        self._events.append(evt.tag)  # pragma: no cover
+        tag = evt.tag
+        with self._event_condition:
+            if self._event_coalesce and tag in self._event_tags:
+                return
+            if len(self._events) >= self._event_queue_size:
+                if self._event_overflow == "drop_newest":
+                    self._events_dropped += 1
+                    return
+                self._drop_event()
+            self._events.append(tag)
+            if self._event_coalesce:
+                self._event_tags.add(tag)
+            self._event_condition.notify()
+
+    def _dispatch_events(self) -> None:
+        """Internal method to pass the queued events to the event callback
+
+        This method is called by a Python thread, so a slow callback does not hold
+        up the reading of the event stream.  It returns once the gRPC connection has
+        been closed and the queue is empty.
+        """
+        while True:
+            with self._event_condition:
+                while not self._events:
+                    if self._stub is None:
+                        self._event_dispatch_thread = None
+                        return
+                    self._event_condition.wait(timeout=1.0)
+            tag = self.get_event()
+            if tag is not None and self._event_callback:
+                try:
+                    self._event_callback(tag)
+                except Exception:  # pragma: no cover
+                    # a failing callback must not stop the event dispatch
+                    pass  # pragma: no cover
 
     def _poll_events(self) -> None:
         """Internal method to handle event streams
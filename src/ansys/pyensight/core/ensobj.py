@@ -26,7 +26,7 @@ The ensobj module provides the base class to all EnSight proxy objects
 
 """
 
-from typing import TYPE_CHECKING, Any, Optional, no_type_check
+from typing import TYPE_CHECKING, Any, Callable, Optional, no_type_check
 
 if TYPE_CHECKING:
     from ansys.pyensight.core import Session
@@ -95,8 +95,8 @@ class ENSOBJ(object):
         self._session = None
         if self._is_owned and tmp_session is not None and not tmp_session._already_closed:
             try:
-                cmd = f"ensight.objs.release_id('{tmp_session.name}', {self.__OBJID__})"
-                tmp_session.cmd(cmd, do_eval=False)
+                # the releases are sent to EnSight in batches
+                tmp_session._queue_release(self.__OBJID__)
             except Exception:  # pragma: no cover
                 # This could happen at any time, including outside
                 # the scope of the session, so we need to be
@@ -469,6 +469,41 @@ class ENSOBJ(object):
         """
         return self._session.cmd(f"{self._remote_obj()}.getmetatag({tag.__repr__()})")
 
+    def subscribe(self, attrid: list, callback: Callable, compress: bool = True) -> str:
+        """Subscribe to changes of attributes of the object
+
+        When any of the listed attributes change, the callback is called with this
+        object, the name of the attribute that changed and a dictionary of the new
+        values of the listed attributes, keyed by attribute name.  The values are
+        sent with the event, so the callback does not need to query them.
+
+        Parameters
+        ----------
+        attrid : list
+            The attributes to watch, as strings or enum values.
+        callback : Callable
+            Called as ``callback(obj, attr, values)`` when an attribute changes.
+        compress : bool
+            If True (the default), only the last of repeated events generated by
+            an action results in a callback.
+
+        Returns
+        -------
+        str
+            The subscription tag.  Pass it to ``session.remove_callback()`` to
+            end the subscription.
+
+        Examples
+        --------
+        >>> def changed(part, attr, values):
+        ...     print(part, attr, values["VISIBLE"], values["COLORBYRGB"])
+        >>> tag = part.subscribe(["VISIBLE", "COLORBYRGB"], changed)
+        >>> part.VISIBLE = False
+        >>> session.remove_callback(tag)
+
+        """
+        return self._session._add_subscription([self], attrid, callback, compress=compress)
+
     def destroy(self) -> None:
         """Destroy the EnSight object associated with this proxy object"""
         self._session.cmd(f"{self._remote_obj()}.destroy()")
@@ -41,7 +41,9 @@ Examples
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import enum
+import json
 import logging
 import os
 import platform
@@ -49,9 +51,10 @@ import shutil
 import subprocess
 import tempfile
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 import uuid
 import warnings
+import zipfile
 
 from ansys.api.pyensight.v0 import libuserd_pb2, libuserd_pb2_grpc
 from ansys.pyensight.core.common import (
@@ -103,6 +106,23 @@ PartHints = _build_enum("PartHints", libuserd_pb2.PartHints.items(), flag=True)
 UpdateHints = _build_enum("UpdateHints", libuserd_pb2.UpdateHints.items(), flag=True)
 RankValues = _build_enum("RankValues", libuserd_pb2.RankValues.items())
 
+# Called as allocate(index, size) to create the target of a streamed array read
+AllocateFunc = Callable[[int, int], Any]
+
+# The (values, total size, offset) field names of the chunked gRPC replies
+_NODES_FIELDS = [("xyz", "total_size", "offset")]
+_CONN_FIELDS = [("connectivity", "total_size", "offset")]
+_NSIDED_FIELDS = [
+    ("nodes_per_polygon", "nodes_total_size", "nodes_offset"),
+    ("node_indices", "indices_total_size", "indices_offset"),
+]
+_NFACED_FIELDS = [
+    ("faces_per_element", "face_total_size", "face_offset"),
+    ("nodes_per_face", "npf_total_size", "npf_offset"),
+    ("node_indices", "nodes_total_size", "nodes_offset"),
+]
+_VALUES_FIELDS = [("values", "total_size", "offset")]
+
 
 class LibUserdError(Exception):
     """
@@ -304,7 +324,57 @@ class Part(object):
     def __repr__(self):
         return f"<{self.__class__.__name__} object, id: {self.id}, name: '{self.name}'>"
 
-    def nodes(self, rank: Optional[int] = None) -> "numpy.array":
+    @staticmethod
+    def _read_chunks(
+        stream: Any,
+        fields: List[Tuple[str, str, str]],
+        dtype: Any,
+        allocate: Optional[AllocateFunc] = None,
+    ) -> List[Any]:
+        """
+        Assemble the arrays sent by a chunked gRPC reply stream.  Each chunk is
+        written into the output arrays as it arrives.
+
+        Parameters
+        ----------
+        stream
+            The gRPC reply stream.
+        fields : List[Tuple[str, str, str]]
+            For each output array, the names of the chunk fields holding the values,
+            the total array size and the offset of the values.
+        dtype
+            The numpy dtype of the output arrays.
+        allocate : Callable[[int, int], Any], optional
+            Called as ``allocate(index, size)`` to create each output array.
+
+        Returns
+        -------
+        List[Any]
+            The output arrays.
+        """
+        if allocate is None:
+
+            def allocate(index: int, size: int) -> "numpy.array":
+                return numpy.empty(size, dtype=dtype)
+
+        out: List[Any] = [None] * len(fields)
+        for chunk in stream:
+            for index, (name, total_name, offset_name) in enumerate(fields):
+                total = getattr(chunk, total_name)
+                if out[index] is None or len(out[index]) < total:
+                    out[index] = allocate(index, total)
+                values = getattr(chunk, name)
+                if len(values):
+                    offset = getattr(chunk, offset_name)
+                    out[index][offset : offset + len(values)] = numpy.array(values)
+        for index in range(len(out)):
+            if out[index] is None:
+                out[index] = numpy.empty(0, dtype=dtype)
+        return out
+
+    def nodes(
+        self, rank: Optional[int] = None, allocate: Optional[AllocateFunc] = None
+    ) -> "numpy.array":
         """
         Return the vertex array for the part.
 
@@ -313,6 +383,10 @@ class Part(object):
         rank : int, optional
             For a dataset using multiple ranks, the rank to return data from.  The
             default is RankValues.SINGLE_RANK.
+        allocate : Callable[[int, int], Any], optional
+            Called as ``allocate(index, size)`` to create the array-like object the
+            ``index``-th output array is streamed into, for example a ``numpy.memmap``.
+            The default allocates in-memory numpy arrays.
 
         Returns
         -------
@@ -335,16 +409,9 @@ class Part(object):
         pb.rank = rank
         try:
             stream = self._userd.stub.Part_nodes(pb, metadata=self._userd.metadata())
+            return self._read_chunks(stream, _NODES_FIELDS, numpy.float32, allocate)[0]
         except grpc.RpcError as e:
             raise self._userd.libuserd_exception(e)
-        nodes = numpy.empty(0, dtype=numpy.float32)
-        for chunk in stream:
-            if len(nodes) < chunk.total_size:
-                nodes = numpy.empty(chunk.total_size, dtype=numpy.float32)
-            offset = chunk.offset
-            values = numpy.array(chunk.xyz)
-            nodes[offset : offset + len(values)] = values
-        return nodes
 
     def num_elements(self, rank: Optional[int] = None) -> dict:
         """
@@ -386,7 +453,9 @@ class Part(object):
                 elements[key] = reply.element_count[key]
         return elements
 
-    def element_conn(self, elem_type: int, rank: Optional[int] = None) -> "numpy.array":
+    def element_conn(
+        self, elem_type: int, rank: Optional[int] = None, allocate: Optional[AllocateFunc] = None
+    ) -> "numpy.array":
         """
         For "zoo" element types, return the part element connectivity for the specified
         element type.
@@ -398,6 +467,10 @@ class Part(object):
         rank : int, optional
             For a dataset using multiple ranks, the rank to return data from.  The
             default is RankValues.SINGLE_RANK.
+        allocate : Callable[[int, int], Any], optional
+            Called as ``allocate(index, size)`` to create the array-like object the
+            ``index``-th output array is streamed into, for example a ``numpy.memmap``.
+            The default allocates in-memory numpy arrays.
 
         Returns
         -------
@@ -425,13 +498,7 @@ class Part(object):
         pb.rank = rank
         try:
             stream = self._userd.stub.Part_element_conn(pb, metadata=self._userd.metadata())
-            conn = numpy.empty(0, dtype=numpy.uint32)
-            for chunk in stream:
-                if len(conn) < chunk.total_size:
-                    conn = numpy.empty(chunk.total_size, dtype=numpy.uint32)
-                offset = chunk.offset
-                values = numpy.array(chunk.connectivity)
-                conn[offset : offset + len(values)] = values
+            conn = self._read_chunks(stream, _CONN_FIELDS, numpy.uint32, allocate)[0]
         except grpc.RpcError as e:
             error = self._userd.libuserd_exception(e)
             # if we get an "UNKNOWN" error, then return an empty array
@@ -442,7 +509,7 @@ class Part(object):
         return conn
 
     def element_conn_nsided(
-        self, elem_type: int, rank: Optional[int] = None
+        self, elem_type: int, rank: Optional[int] = None, allocate: Optional[AllocateFunc] = None
     ) -> List["numpy.array"]:
         """
         For an N-Sided element type (regular or ghost), return the connectivity information
@@ -464,6 +531,10 @@ class Part(object):
         rank : int, optional
             For a dataset using multiple ranks, the rank to return data from.  The
             default is RankValues.SINGLE_RANK.
+        allocate : Callable[[int, int], Any], optional
+            Called as ``allocate(index, size)`` to create the array-like object the
+            ``index``-th output array is streamed into, for example a ``numpy.memmap``.
+            The default allocates in-memory numpy arrays.
 
         Returns
         -------
@@ -478,27 +549,12 @@ class Part(object):
         pb.rank = rank
         try:
             stream = self._userd.stub.Part_element_conn_nsided(pb, metadata=self._userd.metadata())
-            nodes = numpy.empty(0, dtype=numpy.uint32)
-            indices = numpy.empty(0, dtype=numpy.uint32)
-            for chunk in stream:
-                if len(nodes) < chunk.nodes_total_size:
-                    nodes = numpy.empty(chunk.nodes_total_size, dtype=numpy.uint32)
-                if len(indices) < chunk.indices_total_size:
-                    indices = numpy.empty(chunk.indices_total_size, dtype=numpy.uint32)
-                if len(chunk.nodes_per_polygon):
-                    offset = chunk.nodes_offset
-                    values = numpy.array(chunk.nodes_per_polygon)
-                    nodes[offset : offset + len(values)] = values
-                if len(chunk.node_indices):
-                    offset = chunk.indices_offset
-                    values = numpy.array(chunk.node_indices)
-                    indices[offset : offset + len(values)] = values
+            return self._read_chunks(stream, _NSIDED_FIELDS, numpy.uint32, allocate)
         except grpc.RpcError as e:
             raise self._userd.libuserd_exception(e)
-        return [nodes, indices]
 
     def element_conn_nfaced(
-        self, elem_type: int, rank: Optional[int] = None
+        self, elem_type: int, rank: Optional[int] = None, allocate: Optional[AllocateFunc] = None
     ) -> List["numpy.array"]:
         """
         For an N-Faced element type (regular or ghost), return the connectivity information
@@ -522,6 +578,10 @@ class Part(object):
         rank : int, optional
             For a dataset using multiple ranks, the rank to return data from.  The
             default is RankValues.SINGLE_RANK.
+        allocate : Callable[[int, int], Any], optional
+            Called as ``allocate(index, size)`` to create the array-like object the
+            ``index``-th output array is streamed into, for example a ``numpy.memmap``.
+            The default allocates in-memory numpy arrays.
 
         Returns
         -------
@@ -536,31 +596,9 @@ class Part(object):
         pb.rank = rank
         try:
             stream = self._userd.stub.Part_element_conn_nfaced(pb, metadata=self._userd.metadata())
-            face = numpy.empty(0, dtype=numpy.uint32)
-            npf = numpy.empty(0, dtype=numpy.uint32)
-            nodes = numpy.empty(0, dtype=numpy.uint32)
-            for chunk in stream:
-                if len(face) < chunk.face_total_size:
-                    face = numpy.empty(chunk.face_total_size, dtype=numpy.uint32)
-                if len(npf) < chunk.npf_total_size:
-                    npf = numpy.empty(chunk.npf_total_size, dtype=numpy.uint32)
-                if len(nodes) < chunk.nodes_total_size:
-                    nodes = numpy.empty(chunk.nodes_total_size, dtype=numpy.uint32)
-                if len(chunk.faces_per_element):
-                    offset = chunk.face_offset
-                    values = numpy.array(chunk.faces_per_element)
-                    face[offset : offset + len(values)] = values
-                if len(chunk.nodes_per_face):
-                    offset = chunk.npf_offset
-                    values = numpy.array(chunk.nodes_per_face)
-                    npf[offset : offset + len(values)] = values
-                if len(chunk.node_indices):
-                    offset = chunk.nodes_offset
-                    values = numpy.array(chunk.node_indices)
-                    nodes[offset : offset + len(values)] = values
+            return self._read_chunks(stream, _NFACED_FIELDS, numpy.uint32, allocate)
         except grpc.RpcError as e:
             raise self._userd.libuserd_exception(e)
-        return [face, npf, nodes]
 
     def variable_values(
         self,
@@ -569,6 +607,7 @@ class Part(object):
         imaginary: bool = False,
         component: int = 0,
         rank: Optional[int] = None,
+        allocate: Optional[AllocateFunc] = None,
     ) -> "numpy.array":
         """
         Return a numpy array containing the value(s) of a variable.  If the variable is a
@@ -593,6 +632,10 @@ class Part(object):
         rank : int, optional
             For a dataset using multiple ranks, the rank to return data from.  The
             default is RankValues.SINGLE_RANK.
+        allocate : Callable[[int, int], Any], optional
+            Called as ``allocate(index, size)`` to create the array-like object the
+            ``index``-th output array is streamed into, for example a ``numpy.memmap``.
+            The default allocates in-memory numpy arrays.
 
         Returns
         -------
@@ -610,16 +653,129 @@ class Part(object):
         pb.rank = rank
         try:
             stream = self._userd.stub.Part_variable_values(pb, metadata=self._userd.metadata())
-            v = numpy.empty(0, dtype=numpy.float32)
-            for chunk in stream:
-                if len(v) < chunk.total_size:
-                    v = numpy.empty(chunk.total_size, dtype=numpy.float32)
-                offset = chunk.offset
-                values = numpy.array(chunk.values)
-                v[offset : offset + len(values)] = values
+            return self._read_chunks(stream, _VALUES_FIELDS, numpy.float32, allocate)[0]
         except grpc.RpcError as e:
             raise self._userd.libuserd_exception(e)
-        return v
+
+    def nodes_by_rank(self, ranks: Optional[List[int]] = None) -> Dict[int, "numpy.array"]:
+        """
+        Return the vertex arrays for the part from multiple ranks.  The requests
+        to the individual ranks are issued concurrently.
+
+        Parameters
+        ----------
+        ranks : List[int], optional
+            The ranks to read from.  The default is all of the ranks the
+            ``LibUserd`` instance was initialized with.
+
+        Returns
+        -------
+        Dict[int, numpy.array]
+            A dictionary mapping each rank number to the packed vertex array
+            of the part on that rank.
+        """
+        return self._userd.map_ranks(lambda r: self.nodes(rank=r), ranks=ranks)
+
+    def element_conn_by_rank(
+        self, elem_type: int, ranks: Optional[List[int]] = None
+    ) -> Dict[int, "numpy.array"]:
+        """
+        For "zoo" element types, return the part element connectivity from multiple
+        ranks.  The requests to the individual ranks are issued concurrently.
+
+        Parameters
+        ----------
+        elem_type : int
+            The element type.  All but NFACED and NSIDED element types are allowed.
+        ranks : List[int], optional
+            The ranks to read from.  The default is all of the ranks the
+            ``LibUserd`` instance was initialized with.
+
+        Returns
+        -------
+        Dict[int, numpy.array]
+            A dictionary mapping each rank number to the connectivity array of
+            the part on that rank.  The node indices are local to the rank.
+        """
+        return self._userd.map_ranks(lambda r: self.element_conn(elem_type, rank=r), ranks=ranks)
+
+    def variable_values_by_rank(
+        self,
+        variable: "Variable",
+        elem_type: int = 0,
+        imaginary: bool = False,
+        component: int = 0,
+        ranks: Optional[List[int]] = None,
+    ) -> Dict[int, "numpy.array"]:
+        """
+        Return the value(s) of a variable from multiple ranks.  The requests to the
+        individual ranks are issued concurrently.  See ``variable_values()`` for a
+        description of the returned values.
+
+        Parameters
+        ----------
+        variable : Variable
+            The variable to return the values for.
+        elem_type : int
+            Used only if the variable location is elemental, this keyword selects the element
+            type to return the variable values for.
+        imaginary : bool
+            If the variable is of type complex, setting this to True will select the imaginary
+            portion of the data.
+        component : int
+            Select the channel for a multivalued variable type.
+        ranks : List[int], optional
+            The ranks to read from.  The default is all of the ranks the
+            ``LibUserd`` instance was initialized with.
+
+        Returns
+        -------
+        Dict[int, numpy.array]
+            A dictionary mapping each rank number to the variable values on that rank.
+        """
+        return self._userd.map_ranks(
+            lambda r: self.variable_values(
+                variable, elem_type=elem_type, imaginary=imaginary, component=component, rank=r
+            ),
+            ranks=ranks,
+        )
+
+    def partitions(self, elem_type: int, ranks: Optional[List[int]] = None) -> "RankPartitions":
+        """
+        Read the vertices and the "zoo" element connectivity of the part from
+        multiple ranks concurrently.  The per-rank pieces are returned in a
+        ``RankPartitions`` instance that can assemble them into a single mesh.
+
+        Parameters
+        ----------
+        elem_type : int
+            The element type.  All but NFACED and NSIDED element types are allowed.
+        ranks : List[int], optional
+            The ranks to read from.  The default is all of the ranks the
+            ``LibUserd`` instance was initialized with.
+
+        Returns
+        -------
+        RankPartitions
+            The per-rank nodes and connectivity.
+
+        Examples
+        --------
+
+        >>> userd.initialize(number_of_ranks=4)
+        >>> data = userd.load_data(casefile)
+        >>> part = data.parts()[0]
+        >>> pieces = part.partitions(libuserd.ElementType.HEX08)
+        >>> nodes, conn = pieces.merge()
+        >>> pressure = pieces.merge_variable_values(part.variable_values_by_rank(var))
+
+        """
+        pieces = self._userd.map_ranks(
+            lambda r: (self.nodes(rank=r), self.element_conn(elem_type, rank=r)), ranks=ranks
+        )
+        nodes = {r: v[0] for r, v in pieces.items()}
+        conn = {r: v[1] for r, v in pieces.items()}
+        return RankPartitions(nodes, conn)
 
     def rigid_body_transform(self) -> dict:
         """
@@ -654,6 +810,514 @@ class Part(object):
         return out
 
 
+class RankPartitions(object):
+    """
+    This class holds the pieces of a part that were read from the individual
+    ranks of a decomposed dataset.  Methods are provided to assemble the pieces
+    into a single mesh and to assemble variable values to match that mesh.
+
+    Nodes on the boundaries between partitions are generally duplicated on each
+    rank that uses them.  When merging, these duplicates can be collapsed using
+    global node ids (if the caller has them) or by matching coordinates.
+
+    Parameters
+    ----------
+    nodes : Dict[int, numpy.array]
+        The packed x,y,z vertex array of each rank.
+    connectivity : Dict[int, numpy.array]
+        The element connectivity of each rank, with node indices local to the rank.
+
+    Attributes
+    ----------
+    ranks : List[int]
+        The rank numbers, in the order the pieces are assembled.
+    nodes : Dict[int, numpy.array]
+        The packed x,y,z vertex array of each rank.
+    connectivity : Dict[int, numpy.array]
+        The element connectivity of each rank.
+    node_map : Dict[int, numpy.array]
+        After ``merge()`` has been called, for each rank, the index of every
+        local node in the merged node array.
+    """
+
+    def __init__(
+        self, nodes: Dict[int, "numpy.array"], connectivity: Dict[int, "numpy.array"]
+    ) -> None:
+        self.ranks = sorted(nodes.keys())
+        self.nodes = nodes
+        self.connectivity = connectivity
+        self.node_map: Dict[int, "numpy.array"] = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} object, ranks: {self.ranks}>"
+
+    def merge(
+        self,
+        node_ids: Optional[Dict[int, "numpy.array"]] = None,
+        merge_duplicates: bool = True,
+        index_base: int = 1,
+    ) -> List["numpy.array"]:
+        """
+        Assemble the per-rank pieces into a single mesh.
+
+        Parameters
+        ----------
+        node_ids : Dict[int, numpy.array], optional
+            The global id of every node on each rank.  If provided, nodes with the same
+            global id are merged into a single node.
+        merge_duplicates : bool, optional
+            If no ``node_ids`` are provided, merge nodes with identical coordinates.  If
+            False, the node arrays are simply concatenated.  The default is True.
+        index_base : int, optional
+            The index of the first node in the connectivity arrays.  The default is 1.
+
+        Returns
+        -------
+        List[numpy.array]
+            Two numpy arrays: the packed x,y,z merged vertex array and the connectivity
+            array using indices into the merged vertex array.
+        """
+        xyz = [numpy.asarray(self.nodes[r]).reshape(-1, 3) for r in self.ranks]
+        counts = [len(v) for v in xyz]
+        all_xyz = numpy.concatenate(xyz) if xyz else numpy.empty((0, 3), dtype=numpy.float32)
+        if node_ids is not None:
+            keys = numpy.concatenate([numpy.asarray(node_ids[r]) for r in self.ranks])
+        elif merge_duplicates:
+            keys = all_xyz
+        else:
+            keys = None
+        if keys is None or len(all_xyz) == 0:
+            index = numpy.arange(len(all_xyz))
+            merged = all_xyz
+        else:
+            axis = 0 if keys.ndim > 1 else None
+            _, first, inverse = numpy.unique(
+                keys, axis=axis, return_index=True, return_inverse=True
+            )
+            # keep the merged nodes in the order of first occurrence
+            order = numpy.argsort(first)
+            position = numpy.empty_like(order)
+            position[order] = numpy.arange(len(order))
+            index = position[inverse.reshape(-1)]
+            merged = all_xyz[first[order]]
+        self.node_map = {}
+        conn = []
+        offset = 0
+        for rank, count in zip(self.ranks, counts):
+            self.node_map[rank] = index[offset : offset + count]
+            offset += count
+            local = numpy.asarray(self.connectivity[rank]).astype(numpy.int64) - index_base
+            conn.append(self.node_map[rank][local] + index_base)
+        out_conn = numpy.concatenate(conn) if conn else numpy.empty(0, dtype=numpy.int64)
+        return [merged.reshape(-1), out_conn.astype(numpy.uint32)]
+
+    def merge_variable_values(
+        self, values: Dict[int, "numpy.array"], nodal: bool = True
+    ) -> "numpy.array":
+        """
+        Assemble per-rank variable values to match the mesh returned by ``merge()``.
+
+        Parameters
+        ----------
+        values : Dict[int, numpy.array]
+            The variable values of each rank, for example as returned by
+            ``Part.variable_values_by_rank()``.
+        nodal : bool, optional
+            True if the values are nodal, in which case ``merge()`` must have been called
+            first.  Elemental values are concatenated in rank order.  The default is True.
+
+        Returns
+        -------
+        numpy.array
+            The assembled variable values.
+        """
+        if not nodal:
+            return numpy.concatenate([numpy.asarray(values[r]) for r in self.ranks])
+        if not self.node_map:
+            raise RuntimeError("merge() must be called before merging nodal values")
+        size = 0
+        for r in self.ranks:
+            if len(self.node_map[r]):
+                size = max(size, int(self.node_map[r].max()) + 1)
+        # vector and tensor values are (n, k) arrays or flat n*k arrays
+        arrays = {}
+        flat = False
+        for r in self.ranks:
+            array = numpy.asarray(values[r])
+            num_nodes = len(self.node_map[r])
+            if array.ndim == 1 and num_nodes and len(array) != num_nodes:
+                array = array.reshape(num_nodes, len(array) // num_nodes)
+                flat = True
+            arrays[r] = array
+        first = arrays[self.ranks[0]]
+        out = numpy.zeros((size,) + first.shape[1:], dtype=first.dtype)
+        for r in self.ranks:
+            out[self.node_map[r]] = arrays[r]
+        if flat:
+            return out.reshape(-1)
+        return out
+
+
+# The file formats supported by Reader.export_store()
+STORE_FORMATS = ("npy", "npz", "hdf5")
+
+
+def _import_h5py() -> Any:
+    try:
+        import h5py
+    except ModuleNotFoundError:  # pragma: no cover
+        raise RuntimeError("The h5py module must be installed to use HDF5 stores")
+    return h5py
+
+
+class _StoreWriter(object):
+    """
+    Write the arrays of a dataset store.  Arrays are created on disk at their
+    final size and the caller streams values into them, so only one chunk of
+    data needs to be held in memory at a time.
+
+    Parameters
+    ----------
+    path : str
+        The pathname of the store.
+    store_format : str
+        One of ``STORE_FORMATS``.
+    """
+
+    def __init__(self, path: str, store_format: str) -> None:
+        self._path = path
+        self._format = store_format
+        self._h5file: Any = None
+        self._root = path
+        if store_format == "hdf5":
+            self._h5file = _import_h5py().File(path, "w")
+        elif store_format == "npz":
+            # the arrays are staged as .npy files and zipped up in close()
+            self._root = tempfile.mkdtemp(prefix="pyensight_store_")
+        else:
+            os.makedirs(path, exist_ok=True)
+
+    def _filename(self, key: str) -> str:
+        filename = os.path.join(self._root, *key.split("/")) + ".npy"
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        return filename
+
+    def create(self, key: str, size: int, dtype: Any) -> Any:
+        """Create the array ``key`` in the store and return an array-like view of it"""
+        if self._h5file is not None:
+            if key in self._h5file:
+                del self._h5file[key]
+            return self._h5file.create_dataset(key, shape=(size,), dtype=dtype)
+        if size == 0:
+            # zero length files cannot be memory mapped
+            numpy.save(self._filename(key), numpy.empty(0, dtype=dtype))
+            return numpy.empty(0, dtype=dtype)
+        return numpy.lib.format.open_memmap(
+            self._filename(key), mode="w+", dtype=dtype, shape=(size,)
+        )
+
+    def write(self, key: str, values: "numpy.array") -> None:
+        """Write an in-memory array to the store"""
+        values = numpy.asarray(values)
+        target = self.create(key, len(values), values.dtype)
+        if len(values):
+            target[:] = values
+        self.flush(target)
+
+    @staticmethod
+    def flush(target: Any) -> None:
+        if isinstance(target, numpy.memmap):
+            target.flush()
+
+    def read(self, keys: List[str], dtype: Any, method: Callable, *args, **kwargs) -> None:
+        """
+        Stream the output of a ``Part`` read method into the store.
+
+        Parameters
+        ----------
+        keys : List[str]
+            The store key for each of the arrays returned by the read method.
+        dtype
+            The numpy dtype of the arrays.
+        method : Callable
+            The ``Part`` method to call.  It is called with the remaining positional and
+            keyword arguments along with an ``allocate`` keyword.
+        """
+        created: Dict[int, Any] = {}
+
+        def allocate(index: int, size: int) -> Any:
+            created[index] = self.create(keys[index], size, dtype)
+            return created[index]
+
+        output = method(*args, allocate=allocate, **kwargs)
+        if not isinstance(output, list):
+            output = [output]
+        for index, key in enumerate(keys):
+            if created.get(index) is None:
+                # nothing was streamed (e.g. no chunks were sent)
+                self.write(key, output[index])
+            else:
+                self.flush(created[index])
+
+    def close(self, manifest: Dict[str, Any]) -> None:
+        """Record the manifest and finish the store"""
+        text = json.dumps(manifest)
+        if self._h5file is not None:
+            self._h5file.attrs["manifest"] = text
+            self._h5file.close()
+            self._h5file = None
+            return
+        with open(os.path.join(self._root, "manifest.json"), "w") as f:
+            f.write(text)
+        if self._format == "npz":
+            with zipfile.ZipFile(self._path, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+                for dirpath, _, filenames in os.walk(self._root):
+                    for filename in filenames:
+                        pathname = os.path.join(dirpath, filename)
+                        arcname = os.path.relpath(pathname, self._root).replace(os.sep, "/")
+                        zf.write(pathname, arcname)
+            shutil.rmtree(self._root, ignore_errors=True)
+
+
+class DatasetStore(object):
+    """
+    This class provides lazy access to a dataset that was exported to disk with
+    ``Reader.export_store()``.  No server is needed to read a store.  Arrays are
+    only read when they are accessed.  For "npy" stores, the arrays are returned
+    as read-only memory maps and for "hdf5" stores as ``h5py.Dataset`` objects,
+    which can be sliced to read portions of the array.
+
+    Parameters
+    ----------
+    path : str
+        The pathname of the store.
+
+    Attributes
+    ----------
+    format : str
+        The store format: "npy", "npz" or "hdf5".
+    timevalues : numpy.array
+        The time values of the exported timesteps.
+    parts : List[dict]
+        The "id" and "name" of the exported parts.
+    variables : List[dict]
+        The "id", "name", "location", "type" and "number_of_components" of the
+        exported variables.
+    geometry_changing : bool
+        If False, the geometry and the variables that are not time varying were
+        only exported for the first timestep and are shared by all the timesteps.
+
+    Examples
+    --------
+
+    >>> data = userd.load_data(casefile)
+    >>> data.export_store("/tmp/case_store", store_format="npy")
+    >>> userd.shutdown()
+    >>> store = libuserd.DatasetStore("/tmp/case_store")
+    >>> nodes = store.nodes(store.parts[0]["id"], timestep=3)
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._npz: Any = None
+        self._h5file: Any = None
+        if os.path.isdir(path):
+            self.format = "npy"
+            with open(os.path.join(path, "manifest.json"), "r") as f:
+                manifest = json.load(f)
+        elif zipfile.is_zipfile(path):
+            self.format = "npz"
+            self._npz = numpy.load(path, allow_pickle=False)
+            manifest = json.loads(self._npz.zip.read("manifest.json"))
+        else:
+            self.format = "hdf5"
+            self._h5file = _import_h5py().File(path, "r")
+            manifest = json.loads(self._h5file.attrs["manifest"])
+        self.timevalues = numpy.array(manifest["timevalues"])
+        self.parts = manifest["parts"]
+        self.variables = manifest["variables"]
+        self.geometry_changing = manifest["geometry_changing"]
+        self._arrays: Dict[str, List[str]] = manifest["arrays"]
+        self._case_values: List[Dict[str, float]] = manifest["case_values"]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} object, format: {self.format}, path: '{self._path}'>"
+
+    def __enter__(self) -> "DatasetStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close any files held open by the store"""
+        if self._npz is not None:
+            self._npz.close()
+            self._npz = None
+        if self._h5file is not None:
+            self._h5file.close()
+            self._h5file = None
+
+    @staticmethod
+    def _group(timestep: int, part_id: int) -> str:
+        return f"t{timestep:04d}/p{part_id}"
+
+    def keys(self, part_id: int, timestep: int = 0) -> List[str]:
+        """
+        Return the names of the arrays stored for a part at a timestep.
+
+        Parameters
+        ----------
+        part_id : int
+            The id of the part.
+        timestep : int, optional
+            The index of the exported timestep.  The default is 0.
+
+        Returns
+        -------
+        List[str]
+            The array names.
+        """
+        names = list(self._arrays.get(self._group(timestep, part_id), []))
+        if not self.geometry_changing and timestep != 0:
+            names.extend(self._arrays.get(self._group(0, part_id), []))
+        return sorted(set(names))
+
+    def array(self, part_id: int, name: str, timestep: int = 0) -> Any:
+        """
+        Return an array stored for a part at a timestep.
+
+        Parameters
+        ----------
+        part_id : int
+            The id of the part.
+        name : str
+            The name of the array.  See ``keys()``.
+        timestep : int, optional
+            The index of the exported timestep.  The default is 0.
+
+        Returns
+        -------
+        Any
+            A numpy array, numpy memory map or h5py Dataset.
+        """
+        group = self._group(timestep, part_id)
+        if name not in self._arrays.get(group, []) and not self.geometry_changing:
+            group = self._group(0, part_id)
+        if name not in self._arrays.get(group, []):
+            raise KeyError(f"No array '{name}' for part {part_id} at timestep {timestep}")
+        key = f"{group}/{name}"
+        if self._h5file is not None:
+            return self._h5file[key]
+        if self._npz is not None:
+            return self._npz[key]
+        filename = os.path.join(self._path, *key.split("/")) + ".npy"
+        try:
+            return numpy.load(filename, mmap_mode="r")
+        except ValueError:
+            # empty arrays cannot be memory mapped
+            return numpy.load(filename)
+
+    def nodes(self, part_id: int, timestep: int = 0) -> Any:
+        """
+        Return the vertex array of a part: x,y,z,x,y,z, ...
+
+        Parameters
+        ----------
+        part_id : int
+            The id of the part.
+        timestep : int, optional
+            The index of the exported timestep.  The default is 0.
+        """
+        return self.array(part_id, "nodes", timestep=timestep)
+
+    def element_conn(self, part_id: int, elem_type: int, timestep: int = 0) -> Any:
+        """
+        Return the connectivity of a part for an element type.  The return value
+        matches that of ``Part.element_conn()``, ``Part.element_conn_nsided()`` or
+        ``Part.element_conn_nfaced()``, depending on the element type.
+
+        Parameters
+        ----------
+        part_id : int
+            The id of the part.
+        elem_type : int
+            The element type.
+        timestep : int, optional
+            The index of the exported timestep.  The default is 0.
+        """
+        name = f"conn_{ElementType(elem_type).name}"  # type: ignore
+        fields = _store_conn_fields(elem_type)
+        if fields is None:
+            return self.array(part_id, name, timestep=timestep)
+        return [self.array(part_id, f"{name}_{f[0]}", timestep=timestep) for f in fields]
+
+    def variable_values(
+        self,
+        part_id: int,
+        variable: Union[str, int],
+        elem_type: int = 0,
+        component: int = 0,
+        timestep: int = 0,
+    ) -> Any:
+        """
+        Return the values of a variable on a part.
+
+        Parameters
+        ----------
+        part_id : int
+            The id of the part.
+        variable : Union[str, int]
+            The name or id of the variable.
+        elem_type : int, optional
+            For elemental variables, the element type to return the values for.
+        component : int, optional
+            The component of a multivalued variable.
+        timestep : int, optional
+            The index of the exported timestep.  The default is 0.
+        """
+        info = self._variable_info(variable)
+        name = _store_variable_name(info["id"], info["location"], elem_type, component)
+        return self.array(part_id, name, timestep=timestep)
+
+    def case_value(self, variable: Union[str, int], timestep: int = 0) -> float:
+        """
+        Return the value of a dataset ("case") variable.
+
+        Parameters
+        ----------
+        variable : Union[str, int]
+            The name or id of the variable.
+        timestep : int, optional
+            The index of the exported timestep.  The default is 0.
+        """
+        info = self._variable_info(variable)
+        return self._case_values[timestep][str(info["id"])]
+
+    def _variable_info(self, variable: Union[str, int]) -> Dict[str, Any]:
+        for info in self.variables:
+            if variable in (info["name"], info["id"]):
+                return info
+        raise KeyError(f"Unknown variable: {variable}")
+
+
+def _store_conn_fields(elem_type: int) -> Optional[List[Tuple[str, str, str]]]:
+    """The chunk fields of a connectivity read or None for "zoo" element types"""
+    if elem_type in (ElementType.NSIDED, ElementType.NSIDED_GHOST):  # type: ignore
+        return _NSIDED_FIELDS
+    if elem_type in (ElementType.NFACED, ElementType.NFACED_GHOST):  # type: ignore
+        return _NFACED_FIELDS
+    return None
+
+
+def _store_variable_name(var_id: int, location: int, elem_type: int, component: int) -> str:
+    """The name of the array holding a component of a variable in a store"""
+    if location == VariableLocation.ELEMENT:  # type: ignore
+        return f"var_{var_id}_{ElementType(elem_type).name}_c{component}"  # type: ignore
+    return f"var_{var_id}_c{component}"
+
+
 class Reader(object):
     """
     This class represents is an instance of a user-defined reader that is actively reading a
@@ -1025,6 +1689,159 @@ class Reader(object):
             raise self._userd.libuserd_exception(e)
         return reply.value
 
+    def export_store(
+        self,
+        path: str,
+        store_format: str = "npy",
+        parts: Optional[List[Part]] = None,
+        variables: Optional[List[Variable]] = None,
+        timesteps: Optional[List[int]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> str:
+        """
+        Export the dataset to an on-disk store that can be read later, without a
+        server, using ``DatasetStore``.  The data is organized by timestep and part.
+        The node, connectivity and variable arrays are streamed from the server into
+        the store chunk by chunk, so datasets larger than memory can be exported.
+
+        The supported store formats are:
+
+        - "npy" : a directory of ``.npy`` files that are memory mapped when read.
+        - "npz" : a single uncompressed ``.npz`` archive.
+        - "hdf5" : a single HDF5 file.  This requires the ``h5py`` module.
+
+        Parameters
+        ----------
+        path : str
+            The pathname of the store to create.
+        store_format : str, optional
+            The store format.  The default is "npy".
+        parts : List[Part], optional
+            The parts to export.  The default is all parts.
+        variables : List[Variable], optional
+            The variables to export.  The default is all variables.
+        timesteps : List[int], optional
+            The timesteps (in the common timeset) to export.  The default is all timesteps.
+        progress : Callable[[int, int], None], optional
+            Called as ``progress(done, total)`` after each timestep is exported.
+
+        Returns
+        -------
+        str
+            The pathname of the store.
+
+        Examples
+        --------
+
+        >>> data = userd.load_data(casefile)
+        >>> data.export_store("/tmp/case.h5", store_format="hdf5")
+        >>> with libuserd.DatasetStore("/tmp/case.h5") as store:
+        ...     print(store.timevalues, store.parts)
+
+        """
+        if store_format not in STORE_FORMATS:
+            raise RuntimeError(
+                f"Unknown store format '{store_format}'.  Use one of {STORE_FORMATS}"
+            )
+        if parts is None:
+            parts = self.parts()
+        if variables is None:
+            variables = self.variables()
+        all_times = self.timevalues()
+        if timesteps is None:
+            timesteps = list(range(len(all_times)))
+        geometry_changing = self.is_geometry_changing()
+        writer = _StoreWriter(path, store_format)
+        manifest: Dict[str, Any] = dict(
+            timevalues=[float(all_times[t]) for t in timesteps],
+            parts=[dict(id=p.id, name=p.name) for p in parts],
+            variables=[
+                dict(
+                    id=v.id,
+                    name=v.name,
+                    location=int(v.location),
+                    type=int(v.type),
+                    number_of_components=v.number_of_components,
+                )
+                for v in variables
+            ],
+            geometry_changing=geometry_changing,
+            arrays={},
+            case_values=[],
+        )
+        steps = timesteps if len(timesteps) else [None]
+        # static geometry and variables are exported with the first timestep only
+        part_element_types: Dict[int, List[int]] = {}
+        for index, step in enumerate(steps):
+            if step is not None:
+                self.set_timestep(step)
+            case_values = {}
+            for var in variables:
+                if var.location == VariableLocation.DATASET:  # type: ignore
+                    case_values[str(var.id)] = self.variable_value(var)
+            manifest["case_values"].append(case_values)
+            for part in parts:
+                group = f"t{index:04d}/p{part.id}"
+                names = manifest["arrays"].setdefault(group, [])
+                with_geometry = geometry_changing or index == 0
+                if with_geometry:
+                    element_types = list(part.num_elements().keys())
+                    part_element_types[part.id] = element_types
+                    names.append("nodes")
+                    writer.read([f"{group}/nodes"], numpy.float32, part.nodes)
+                    for etype in element_types:
+                        names.extend(self._export_connectivity(writer, group, part, etype))
+                else:
+                    element_types = part_element_types[part.id]
+                for var in variables:
+                    if not with_geometry and not var.time_varying:
+                        continue
+                    names.extend(self._export_variable(writer, group, part, var, element_types))
+            if progress:
+                progress(index + 1, len(steps))
+        writer.close(manifest)
+        return path
+
+    @staticmethod
+    def _export_connectivity(writer: _StoreWriter, group: str, part: Part, etype: int) -> List[str]:
+        """Stream the connectivity of one element type of a part into a store"""
+        name = f"conn_{ElementType(etype).name}"  # type: ignore
+        fields = _store_conn_fields(etype)
+        if fields is None:
+            names = [name]
+            method: Callable = part.element_conn
+        else:
+            names = [f"{name}_{f[0]}" for f in fields]
+            method = part.element_conn_nfaced
+            if fields is _NSIDED_FIELDS:
+                method = part.element_conn_nsided
+        writer.read([f"{group}/{n}" for n in names], numpy.uint32, method, etype)
+        return names
+
+    @staticmethod
+    def _export_variable(
+        writer: _StoreWriter, group: str, part: Part, var: Variable, element_types: List[int]
+    ) -> List[str]:
+        """Stream the values of a variable on a part into a store"""
+        if var.location in (VariableLocation.NODE, VariableLocation.PART):  # type: ignore
+            element_types = [0]
+        elif var.location != VariableLocation.ELEMENT:  # type: ignore
+            return []
+        names = []
+        for etype in element_types:
+            for component in range(max(var.number_of_components, 1)):
+                name = _store_variable_name(var.id, var.location, etype, component)
+                writer.read(
+                    [f"{group}/{name}"],
+                    numpy.float32,
+                    part.variable_values,
+                    var,
+                    elem_type=etype,
+                    component=component,
+                )
+                names.append(name)
+        return names
+
 
 class ReaderInfo(object):
     """
@@ -1625,6 +2442,46 @@ class LibUserd(object):
             )
         return int(rank)
 
+    @property
+    def number_of_ranks(self) -> int:
+        """The number of ranks the dataset reader is using"""
+        return self._number_of_ranks
+
+    def map_ranks(
+        self,
+        func: Callable[[int], Any],
+        ranks: Optional[List[int]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[int, Any]:
+        """
+        Call a function once for each of a number of ranks.  The calls are made
+        concurrently from a pool of threads, so that requests to the individual
+        ranks are serviced in parallel by the server.
+
+        Parameters
+        ----------
+        func : Callable[[int], Any]
+            The function to call.  It is passed the rank number.
+        ranks : List[int], optional
+            The ranks to call the function for.  The default is all the ranks.
+        max_workers : int, optional
+            The maximum number of concurrent calls.  The default is one per rank.
+
+        Returns
+        -------
+        Dict[int, Any]
+            A dictionary mapping each rank number to the value returned by the function.
+        """
+        if ranks is None:
+            ranks = list(range(max(self._number_of_ranks, 1)))
+        ranks = [self.rank_check(r) for r in ranks]
+        if len(ranks) < 2:
+            return {r: func(r) for r in ranks}
+        workers = min(max_workers or len(ranks), len(ranks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {r: pool.submit(func, r) for r in ranks}
+            return {r: f.result() for r, f in futures.items()}
+
     """
     gRPC method bindings
     """
@@ -1858,8 +2715,9 @@ class LibUserd(object):
         Parameters
         ----------
         number_of_ranks : int, optional
-            The degree of I/O parallelism to read data with.  Zero is serial I/O.  Note: this
-            option is not currently implemented and 0 should be used.
+            The degree of I/O parallelism to read data with.  Zero is serial I/O.  When
+            multiple ranks are used, methods like ``Part.nodes_by_rank()`` and
+            ``Part.partitions()`` can be used to read from the ranks concurrently.
         """
         self.connect_check()
         pb = libuserd_pb2.Libuserd_initializeRequest()
@@ -31,6 +31,7 @@ import fnmatch
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     List,
     Optional,
     SupportsIndex,
@@ -239,6 +240,45 @@ class ensobjlist(List[T]):  # noqa: N801
             return value
         return [default] * len(objid_list)  # pragma: no cover
 
+    def subscribe(self, attr_list: list, callback: Callable, compress: bool = True) -> str:
+        """Subscribe to attribute changes on all contained objects
+
+        Walk the items in this object.  A change of any of the listed attributes on any
+        of the ENSOBJ subclasses results in a call to the callback with the object that
+        changed, the name of the attribute that changed and a dictionary of the new
+        values of the listed attributes, keyed by attribute name.  All the objects are
+        subscribed to with a single call into EnSight.
+
+        Parameters
+        ----------
+        attr_list: list
+            The attributes to watch, as strings or enum values.
+        callback: Callable
+            Called as ``callback(obj, attr, values)`` when an attribute changes.
+        compress: bool, optional
+            If True (the default), only the last of repeated events generated by
+            an action results in a callback.
+
+        Returns
+        -------
+        str
+            The subscription tag.  Pass it to ``session.remove_callback()`` to
+            end the subscription.
+
+        Examples
+        --------
+        >>> def changed(part, attr, values):
+        ...     print(part, attr, values)
+        >>> tag = session.ensight.objs.core.PARTS.subscribe(["VISIBLE"], changed)
+
+        """
+        objects = [x for x in self if isinstance(x, ENSOBJ)]
+        if not objects:
+            raise RuntimeError("The list contains no objects to subscribe to")
+        return objects[0]._session._add_subscription(
+            objects, attr_list, callback, compress=compress
+        )
+
     @overload
     def __getitem__(self, index: SupportsIndex) -> T: ...  # noqa: E704
 
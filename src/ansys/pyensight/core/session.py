@@ -33,21 +33,29 @@ ansys.pyensight.Session
 
 """
 
+import ast
 import atexit
+from collections import OrderedDict, deque
+import hashlib
 import importlib.util
+import json
 from os import listdir
 import os.path
 import platform
+import random
+import re
 import socket
 import sys
 import textwrap
+import threading
 import time
 import types
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
 from urllib.request import url2pathname
 import uuid
 import warnings
+import weakref
 import webbrowser
 
 from ansys.pyensight.core.enscontext import EnsContext
@@ -77,6 +85,185 @@ class InvalidEnSightVersion(Exception):
     pass
 
 
+# Proxy class names of the classes whose proxy class depends on an attribute value,
+# by value of the differentiating attribute
+_SUBTYPE_TABLES: Dict[str, Dict[int, str]] = {
+    "ENS_PART": {
+        0: "ENS_PART_MODEL",
+        1: "ENS_PART_CLIP",
+        2: "ENS_PART_CONTOUR",
+        3: "ENS_PART_DISCRETE_PARTICLE",
+        4: "ENS_PART_FRAME",
+        5: "ENS_PART_ISOSURFACE",
+        6: "ENS_PART_PARTICLE_TRACE",
+        7: "ENS_PART_PROFILE",
+        8: "ENS_PART_VECTOR_ARROW",
+        9: "ENS_PART_ELEVATED_SURFACE",
+        10: "ENS_PART_DEVELOPED_SURFACE",
+        15: "ENS_PART_BUILT_UP",
+        16: "ENS_PART_TENSOR_GLYPH",
+        17: "ENS_PART_FX_VORTEX_CORE",
+        18: "ENS_PART_FX_SHOCK",
+        19: "ENS_PART_FX_SEP_ATT",
+        20: "ENS_PART_MAT_INTERFACE",
+        21: "ENS_PART_POINT",
+        22: "ENS_PART_AXISYMMETRIC",
+        24: "ENS_PART_VOF",
+        25: "ENS_PART_AUX_GEOM",
+        26: "ENS_PART_FILTER",
+    },
+    "ENS_ANNOT": {
+        0: "ENS_ANNOT_TEXT",
+        1: "ENS_ANNOT_LINE",
+        2: "ENS_ANNOT_LOGO",
+        3: "ENS_ANNOT_LGND",
+        4: "ENS_ANNOT_MARKER",
+        5: "ENS_ANNOT_ARROW",
+        6: "ENS_ANNOT_DIAL",
+        7: "ENS_ANNOT_GAUGE",
+        8: "ENS_ANNOT_SHAPE",
+    },
+    "ENS_TOOL": {
+        0: "ENS_TOOL_CURSOR",
+        1: "ENS_TOOL_LINE",
+        2: "ENS_TOOL_PLANE",
+        3: "ENS_TOOL_BOX",
+        4: "ENS_TOOL_CYLINDER",
+        5: "ENS_TOOL_CONE",
+        6: "ENS_TOOL_SPHERE",
+        7: "ENS_TOOL_REVOLUTION",
+    },
+}
+
+# Metadata read from the on-disk cache in this process, by cache file pathname
+_METADATA_MEMO: Dict[str, Dict[str, Any]] = dict()
+
+
+class _ProxyTable:
+    """Table of the ``ENSOBJ`` proxy instances of a session, indexed by object ID.
+
+    The most recently used proxies are held in an LRU list of bounded capacity.
+    Once the capacity is reached, the least recently used proxy is dropped for
+    every new one. Dropped proxies that are still referenced elsewhere are
+    found through weak references, so there is never more than one proxy for
+    an object ID.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of proxies held by the table.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._lru: "OrderedDict[int, Any]" = OrderedDict()
+        self._weak: "weakref.WeakValueDictionary[int, Any]" = weakref.WeakValueDictionary()
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def __contains__(self, objid: object) -> bool:
+        # a proxy found through its weak reference is held again until it is used
+        return self.get(objid) is not None  # type: ignore
+
+    def __setitem__(self, objid: int, obj: Any) -> None:
+        self._lru[objid] = obj
+        self._lru.move_to_end(objid)
+        try:
+            self._weak[objid] = obj
+        except TypeError:  # pragma: no cover
+            pass  # pragma: no cover
+        self.evict()
+
+    def get(self, objid: int, default: Any = None) -> Any:
+        """Return the proxy for an object ID, marking it as the most recently used."""
+        obj = self._lru.get(objid)
+        if obj is not None:
+            self._lru.move_to_end(objid)
+            return obj
+        obj = self._weak.get(objid)
+        if obj is None:
+            return default
+        self[objid] = obj
+        return obj
+
+    def pop(self, objid: int) -> Any:
+        """Remove the proxy for an object ID from the table and return it."""
+        self._weak.pop(objid, None)
+        return self._lru.pop(objid, None)
+
+    def evict(self) -> None:
+        """Drop the least recently used proxies until the capacity is respected."""
+        while len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all the proxies held by the table.
+
+        Proxies still referenced elsewhere remain available.
+        """
+        self._lru.clear()
+
+
+class _CallbackTable(Dict[str, Tuple[Any, Any]]):
+    """Table of the event callbacks of a session, indexed by tag.
+
+    In addition to the mapping of tags to ``(callback_id, method)`` tuples, the
+    tags are stored in a prefix trie, so an event is matched to its callback
+    in a single walk over the characters of the event tag.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._root: Dict[str, Any] = dict()
+
+    def __setitem__(self, tag: str, value: Tuple[Any, Any]) -> None:
+        super().__setitem__(tag, value)
+        node = self._root
+        for char in tag:
+            node = node.setdefault(char, dict())
+        # the empty key cannot be a character, it holds the value of the node
+        node[""] = value
+
+    def __delitem__(self, tag: str) -> None:
+        super().__delitem__(tag)
+        path = [self._root]
+        for char in tag:
+            path.append(path[-1][char])
+        del path[-1][""]
+        # prune the branches that no longer lead to a tag
+        for depth in range(len(tag), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][tag[depth - 1]]
+
+    def clear(self) -> None:
+        super().clear()
+        self._root.clear()
+
+    def match(self, tag: str) -> Optional[Tuple[Any, Any]]:
+        """Return the callback registered for the longest prefix of a tag.
+
+        Parameters
+        ----------
+        tag : str
+            Tag of the event, as extracted from the event URL.
+
+        Returns
+        -------
+        Tuple[Any, Any]
+            ``(callback_id, method)`` tuple, or ``None`` if there is no match.
+        """
+        node = self._root
+        value = node.get("")
+        for char in tag:
+            node = node.get(char)  # type: ignore
+            if node is None:
+                break
+            value = node.get("", value)
+        return value
+
+
 class Session:
     """Provides for accessing an EnSight ``Session`` instance.
 
@@ -195,11 +382,23 @@ class Session:
         self._dsg_session: Optional["DSGSession"] = None
         self._session_name = str(uuid.uuid1())
         # when objects come into play, we can reuse them, so hash ID to instance here
-        self._ensobj_hash: Dict[int, "ENSOBJ"] = {}
+        self._ensobj_hash = _ProxyTable(self.DEFAULT_PROXY_CACHE_SIZE)
+        # object IDs waiting to be released in EnSight, see _queue_release()
+        self._release_queue: Deque[int] = deque()
+        self._release_lock = threading.RLock()
+        self._release_event = threading.Event()
+        self._release_thread: Optional[threading.Thread] = None
+        self._release_thread_lock = threading.Lock()
+        # number of gRPC commands in flight, see _grpc_command_begin()
+        self._grpc_commands = 0
+        self._grpc_commands_lock = threading.Lock()
         self._language = "en"
         self._rest_api_enabled = rest_api
         self._sos_enabled = sos
         self._timeout = timeout
+        self._startup_timings: Dict[str, float] = dict()
+        # phases are only timed while the constructor runs
+        self._timing_startup = True
         self._cei_home = ""
         self._cei_suffix = ""
         self._hostname = host
@@ -219,7 +418,8 @@ class Session:
         self._grpc_disable_tls = grpc_disable_tls
         self._grpc_uds_pathname = grpc_uds_pathname
         self._halt_ensight_on_close = True
-        self._callbacks: Dict[str, Tuple[int, Any]] = dict()
+        self._callbacks = _CallbackTable()
+        self._subscription_count = 0
         self._webui_port = webui_port
         self._disable_grpc_options = disable_grpc_options
         self._deeppixel_supported = False
@@ -258,20 +458,24 @@ class Session:
 
         # establish the connection with retry
         self._establish_connection(validate=True)
-        # update the enums to match current EnSight instance
-        cmd = "{key: getattr(ensight.objs.enums, key) for key in dir(ensight.objs.enums)}"
-        new_enums = self.cmd(cmd)
-        for key, value in new_enums.items():
-            if key.startswith("__") and (key != "__OBJID__"):
-                continue
-            setattr(self._ensight.objs.enums, key, value)
-
-        # create ensight.core
-        self._ensight.objs.core = self.cmd("ensight.objs.core")
-
         # get the remote Python interpreter version
+        phase_start = time.perf_counter()
         self.cmd("import platform", do_eval=False)
         self._ensight_python_version = self.cmd("platform.python_version_tuple()")
+        # the build of EnSight, so that the metadata cache follows patched installations
+        self._ensight_build = self.cmd("ensight.version()")
+
+        # enums and subtype tables, from the cache for this EnSight version if possible
+        self._metadata: Dict[str, Any] = {}
+        self._subtype_tables: Dict[str, Dict[int, str]] = {}
+        self._apply_metadata(self._load_metadata())
+        self._record_startup_phase("metadata", phase_start)
+
+        # create ensight.core
+        phase_start = time.perf_counter()
+        self._ensight.objs.core = self.cmd("ensight.objs.core")
+        self._record_startup_phase("core", phase_start)
+        self._timing_startup = False
 
         # Because this session can have allocated significant external resources
         # we very much want a chance to close it up cleanly. It is legal to
@@ -279,53 +483,6 @@ class Session:
         self._already_closed = False
         atexit.register(self.close)
 
-        # Speed up subtype lookups:
-        self._subtype_tables = {}
-        part_lookup_dict = dict()
-        part_lookup_dict[0] = "ENS_PART_MODEL"
-        part_lookup_dict[1] = "ENS_PART_CLIP"
-        part_lookup_dict[2] = "ENS_PART_CONTOUR"
-        part_lookup_dict[3] = "ENS_PART_DISCRETE_PARTICLE"
-        part_lookup_dict[4] = "ENS_PART_FRAME"
-        part_lookup_dict[5] = "ENS_PART_ISOSURFACE"
-        part_lookup_dict[6] = "ENS_PART_PARTICLE_TRACE"
-        part_lookup_dict[7] = "ENS_PART_PROFILE"
-        part_lookup_dict[8] = "ENS_PART_VECTOR_ARROW"
-        part_lookup_dict[9] = "ENS_PART_ELEVATED_SURFACE"
-        part_lookup_dict[10] = "ENS_PART_DEVELOPED_SURFACE"
-        part_lookup_dict[15] = "ENS_PART_BUILT_UP"
-        part_lookup_dict[16] = "ENS_PART_TENSOR_GLYPH"
-        part_lookup_dict[17] = "ENS_PART_FX_VORTEX_CORE"
-        part_lookup_dict[18] = "ENS_PART_FX_SHOCK"
-        part_lookup_dict[19] = "ENS_PART_FX_SEP_ATT"
-        part_lookup_dict[20] = "ENS_PART_MAT_INTERFACE"
-        part_lookup_dict[21] = "ENS_PART_POINT"
-        part_lookup_dict[22] = "ENS_PART_AXISYMMETRIC"
-        part_lookup_dict[24] = "ENS_PART_VOF"
-        part_lookup_dict[25] = "ENS_PART_AUX_GEOM"
-        part_lookup_dict[26] = "ENS_PART_FILTER"
-        self._subtype_tables["ENS_PART"] = part_lookup_dict
-        annot_lookup_dict = dict()
-        annot_lookup_dict[0] = "ENS_ANNOT_TEXT"
-        annot_lookup_dict[1] = "ENS_ANNOT_LINE"
-        annot_lookup_dict[2] = "ENS_ANNOT_LOGO"
-        annot_lookup_dict[3] = "ENS_ANNOT_LGND"
-        annot_lookup_dict[4] = "ENS_ANNOT_MARKER"
-        annot_lookup_dict[5] = "ENS_ANNOT_ARROW"
-        annot_lookup_dict[6] = "ENS_ANNOT_DIAL"
-        annot_lookup_dict[7] = "ENS_ANNOT_GAUGE"
-        annot_lookup_dict[8] = "ENS_ANNOT_SHAPE"
-        self._subtype_tables["ENS_ANNOT"] = annot_lookup_dict
-        tool_lookup_dict = dict()
-        tool_lookup_dict[0] = "ENS_TOOL_CURSOR"
-        tool_lookup_dict[1] = "ENS_TOOL_LINE"
-        tool_lookup_dict[2] = "ENS_TOOL_PLANE"
-        tool_lookup_dict[3] = "ENS_TOOL_BOX"
-        tool_lookup_dict[4] = "ENS_TOOL_CYLINDER"
-        tool_lookup_dict[5] = "ENS_TOOL_CONE"
-        tool_lookup_dict[6] = "ENS_TOOL_SPHERE"
-        tool_lookup_dict[7] = "ENS_TOOL_REVOLUTION"
-        self._subtype_tables["ENS_TOOL"] = tool_lookup_dict
         self._scheduler_session = False
 
     def _build_liben_vnc_ws(self, vnc_port):
@@ -357,27 +514,106 @@ class Session:
         ----------
         validate : bool
             If true, actually try to communicate with EnSight. By default false.
+            The phases of the validated connection are recorded in ``startup_timings``.
         """
-        time_start = time.time()
-        while time.time() - time_start < self._timeout:  # pragma: no cover
-            if self._grpc.is_connected():
-                try:
-                    if validate:
-                        self._cei_home = self.cmd("ensight.version('CEI_HOME')")
-                        self._cei_suffix = self.cmd("ensight.version('suffix')")
-                    self._check_rest_connection()
-                    return
-                except OSError:  # pragma: no cover
-                    pass  # pragma: no cover
-            self._grpc.connect(timeout=self._timeout)
+        deadline = time.time() + self._timeout
+        attempt = 0
+        while time.time() < deadline:  # pragma: no cover
+            if not self._grpc.is_connected():
+                # wait for the channel to be ready, gRPC backs off between attempts
+                phase_start = time.perf_counter()
+                self._grpc.connect(timeout=max(deadline - time.time(), 0.0))
+                if validate:
+                    self._record_startup_phase("grpc_connect", phase_start)
+                continue
+            try:
+                if validate:
+                    # the first commands double as the readiness probe of the service,
+                    # their own (unvalidated) connection checks are not timed
+                    phase_start = time.perf_counter()
+                    self._cei_home = self.cmd("ensight.version('CEI_HOME')")
+                    self._cei_suffix = self.cmd("ensight.version('suffix')")
+                    self._record_startup_phase("grpc_probe", phase_start)
+                phase_start = time.perf_counter()
+                self._check_rest_connection(deadline=deadline)
+                if validate:
+                    self._record_startup_phase("rest_probe", phase_start)
+                return
+            except OSError:  # pragma: no cover
+                self._backoff(attempt, deadline)  # pragma: no cover
+                attempt += 1  # pragma: no cover
         raise RuntimeError("Unable to establish a gRPC connection to EnSight.")  # pragma: no cover
 
-    def _check_rest_connection(self) -> None:
+    #: Delay in seconds before the first retry of a connection probe
+    CONNECT_BACKOFF_INITIAL = 0.05
+    #: Maximum delay in seconds between two retries of a connection probe
+    CONNECT_BACKOFF_MAX = 2.0
+
+    def _backoff(self, attempt: int, deadline: float) -> None:
+        """Wait before retrying a connection probe.
+
+        The delay grows exponentially with the number of attempts, up to
+        ``CONNECT_BACKOFF_MAX``, and is jittered so that many sessions started
+        together do not probe in lockstep.  The wait never extends past the deadline.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of failed attempts so far.
+        deadline : float
+            Time (as returned by ``time.time()``) after which retrying is pointless.
+        """
+        delay = min(self.CONNECT_BACKOFF_MAX, self.CONNECT_BACKOFF_INITIAL * 2**attempt)
+        delay = random.uniform(delay / 2, delay)
+        time.sleep(max(min(delay, deadline - time.time()), 0.0))
+
+    def _record_startup_phase(self, phase: str, start: float) -> None:
+        """Accumulate the time spent in a phase of the session startup.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase.
+        start : float
+            Start of the phase, as returned by ``time.perf_counter()``.
+        """
+        if not self._timing_startup:
+            return
+        elapsed = time.perf_counter() - start
+        self._startup_timings[phase] = self._startup_timings.get(phase, 0.0) + elapsed
+
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """Time in seconds spent in each phase of the session startup.
+
+        The phases are:
+
+        * ``grpc_connect``: waiting for the gRPC channel to be ready
+        * ``grpc_probe``: first commands run by EnSight
+        * ``rest_probe``: waiting for the REST API, if enabled
+        * ``metadata``: loading the EnSight API metadata
+        * ``core``: creating the ``ensight.objs.core`` proxy
+
+        Examples
+        --------
+        >>> from ansys.pyensight.core import LocalLauncher
+        >>> session = LocalLauncher().start()
+        >>> session.startup_timings
+        {'grpc_connect': 1.52, 'grpc_probe': 0.01, 'rest_probe': 0.0, 'metadata': 0.02, 'core': 0.01}
+        """
+        return dict(self._startup_timings)
+
+    def _check_rest_connection(self, deadline: Optional[float] = None) -> None:
         """Validate the REST API connection works
 
         Use requests to see if the REST API is up and running (it takes time
         for websocketserver to make a gRPC connection as well).
 
+        Parameters
+        ----------
+        deadline : float, optional
+            Time (as returned by ``time.time()``) to stop trying. By default, the
+            session timeout from now.
         """
         if not self.rest_api:
             return
@@ -389,20 +625,47 @@ class Session:
         # Thus, here we use 'http', the private hostname, and the html port
         # (which is the same on the proxy server).
         url = f"http://{self._hostname}:{self.html_port}/ensight/v1/session/exec"
-        time_start = time.time()
-        while time.time() - time_start < self._timeout:
+        if deadline is None:
+            deadline = time.time() + self._timeout
+        attempt = 0
+        while time.time() < deadline:
             try:
                 _ = requests.put(
                     url,
                     json="enscl.rest_test = 30*20",
                     headers=dict(Authorization=f"Bearer {self.secret_key}"),
+                    timeout=max(deadline - time.time(), 0.1),
                 )
                 return
             except Exception:
                 pass
-            time.sleep(0.5)
+            self._backoff(attempt, deadline)
+            attempt += 1
         raise RuntimeError("Unable to establish a REST connection to EnSight.")  # pragma: no cover
 
+    DEFAULT_PROXY_CACHE_SIZE: int = 1000000
+
+    @property
+    def proxy_cache_size(self) -> int:
+        """Maximum number of ``ENSOBJ`` proxy instances held by the session.
+
+        The least recently used proxies are dropped once this limit is reached.
+        A dropped proxy that is still referenced is reused if the same EnSight
+        object is returned again. The default is ``1000000``.
+
+        Examples
+        --------
+        >>> session.proxy_cache_size = 100000
+        """
+        return self._ensobj_hash.capacity
+
+    @proxy_cache_size.setter
+    def proxy_cache_size(self, value: int) -> None:
+        if value < 1:
+            raise RuntimeError("The proxy cache size must be at least 1")
+        self._ensobj_hash.capacity = value
+        self._ensobj_hash.evict()
+
     @property
     def name(self) -> str:
         """The session name is a unique identifier for this Session instance.  It
@@ -1017,7 +1280,15 @@ class Session:
 
         return render
 
-    def cmd(self, value: str, do_eval: bool = True) -> Any:
+    # Evaluate the command in EnSight and encode the value as JSON there. ENSOBJ
+    # instances become {"__ensobj__": repr} references and arrays become lists.
+    _JSON_COMMAND = (
+        "__import__('json').dumps({{'result': {}}}, default=lambda o: "
+        "{{'__ensobj__': repr(o)}} if hasattr(o, '__OBJID__') else "
+        "(o.tolist() if hasattr(o, 'tolist') else repr(o)))"
+    )
+
+    def cmd(self, value: str, do_eval: bool = True, json: bool = False) -> Any:
         """Run a command in EnSight and return the results.
 
         Parameters
@@ -1026,6 +1297,12 @@ class Session:
             String of the command to run
         do_eval : bool, optional
             Whether to perform an evaluation. The default is ``True``.
+        json : bool, optional
+            Whether to return the result as JSON instead of Python source code.
+            The default is ``False``. The result is decoded without calling
+            ``eval()``. ``ENSOBJ`` instances are returned as proxy objects, tuples and
+            arrays as lists, and other values that JSON does not support as their
+            ``repr()`` string. This parameter is ignored if ``do_eval`` is ``False``.
 
 
         Returns
@@ -1038,13 +1315,21 @@ class Session:
 
         >>> print(session.cmd("10+4"))
             14
+        >>> parts = session.cmd("ensight.objs.core.PARTS", json=True)
         """
-        if self._dsg_session:
-            self._dsg_session._pyensight_grpc_coming = True
-        self._establish_connection()
-        ret = self._grpc.command(value, do_eval=do_eval)
-        if self._dsg_session:
-            self._dsg_session._pyensight_grpc_coming = False
+        self._grpc_command_begin()
+        try:
+            self._establish_connection()
+            if self._release_queue:
+                self._flush_releases()
+            if do_eval and json:
+                ret = self._grpc.command(self._JSON_COMMAND.format(value), json=True)
+            else:
+                ret = self._grpc.command(value, do_eval=do_eval)
+        finally:
+            self._grpc_command_end()
+        if do_eval and json:
+            return self._decode_json(ret)
         if do_eval:
             ret = self._convert_ctor(ret)
             value = eval(ret, dict(session=self, ensobjlist=ensobjlist))
@@ -1116,16 +1401,111 @@ class Session:
         obj_str = ""
         if object_id:  # pragma: no cover
             obj_str = f", id={object_id}"  # pragma: no cover
+            self._ensobj_hash.pop(object_id)  # pragma: no cover
+        else:
+            # the proxies still in use are kept through their weak references
+            self._ensobj_hash.clear()
         cmd = f"ensight.objs.release_id('{self.name}'{obj_str})"
         _ = self.cmd(cmd, do_eval=False)
 
+    def _grpc_command_begin(self) -> None:
+        """Tell the DSG session, if any, that a gRPC command is about to be sent.
+
+        Commands can be sent by more than one thread, so the DSG session is only
+        told that they are done by the last call to ``_grpc_command_end()``.
+        """
+        with self._grpc_commands_lock:
+            self._grpc_commands += 1
+            if self._dsg_session:
+                self._dsg_session._pyensight_grpc_coming = True
+
+    def _grpc_command_end(self) -> None:
+        """Tell the DSG session, if any, that a gRPC command has been sent."""
+        with self._grpc_commands_lock:
+            self._grpc_commands -= 1
+            if self._dsg_session and not self._grpc_commands:
+                self._dsg_session._pyensight_grpc_coming = False
+
+    RELEASE_BATCH_SIZE: int = 256
+    RELEASE_INTERVAL: float = 1.0
+
+    def _queue_release(self, objid: int) -> None:
+        """Queue the release of an owned ``ENSOBJ`` instance in EnSight.
+
+        This method is called by ``ENSOBJ.__del__()``, possibly during garbage
+        collection, so it never makes a remote call itself. The queued releases are
+        sent in a single command by a background thread, every ``RELEASE_INTERVAL``
+        seconds or as soon as ``RELEASE_BATCH_SIZE`` releases are queued. They are
+        also sent before the next command and when the session is closed. The
+        thread stops once an interval passes with nothing queued.
+
+        Parameters
+        ----------
+        objid : int
+            ID of the ``ENSOBJ`` object.
+        """
+        self._release_queue.append(objid)
+        with self._release_thread_lock:
+            if self._release_thread is None:
+                self._release_thread = threading.Thread(target=self._release_worker, daemon=True)
+                self._release_thread.start()
+        if len(self._release_queue) >= self.RELEASE_BATCH_SIZE:
+            self._release_event.set()
+
+    def _release_worker(self) -> None:
+        """Send the queued releases until the session is closed or nothing is queued."""
+        while not self._already_closed:
+            self._release_event.wait(self.RELEASE_INTERVAL)
+            self._release_event.clear()
+            if self._already_closed:
+                break
+            with self._release_thread_lock:
+                if not self._release_queue:
+                    self._release_thread = None
+                    return
+            if not self._grpc.is_connected():
+                # never reconnect from here, the next cmd() or close() sends them
+                continue
+            try:
+                self._flush_releases()
+            except Exception:  # pragma: no cover
+                # the connection may be gone, there is nobody to report it to
+                pass  # pragma: no cover
+
+    def _flush_releases(self) -> None:
+        """Send all the queued releases to EnSight in a single command.
+
+        The lock makes sure that the releases queued before a command reach
+        EnSight before it, whichever thread sends them.
+        """
+        with self._release_lock:
+            objids = []
+            while self._release_queue:
+                objids.append(self._release_queue.popleft())
+            if not objids:
+                return
+            cmd = f"for _id in {objids}: ensight.objs.release_id('{self.name}', _id)"
+            self._grpc_command_begin()
+            try:
+                self._grpc.command(cmd, do_eval=False)
+            finally:
+                self._grpc_command_end()
+
     def close(self) -> None:
         """Close the session.
 
         Close the current session and its gRPC connection.
         """
         if not self._already_closed:
+            try:
+                self._flush_releases()
+            except Exception:  # pragma: no cover
+                pass  # pragma: no cover
             self._already_closed = True
+            self._release_event.set()
+            thread = self._release_thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout=self._timeout)
             if self._launcher and self._halt_ensight_on_close:
                 self._launcher.close(self)
             else:
@@ -1550,9 +1930,92 @@ class Session:
             raise RuntimeError(f"A callback for tag '{tag}' does not exist")
         callback_id = self._callbacks[tag][0]
         del self._callbacks[tag]
-        cmd = f"ensight.objs.removecallback({callback_id})"
+        if isinstance(callback_id, list):
+            # subscriptions hold one EnSight callback per target object
+            cmd = f"for _id in {callback_id}: ensight.objs.removecallback(_id)"
+        else:
+            cmd = f"ensight.objs.removecallback({callback_id})"
         _ = self.cmd(cmd, do_eval=False)
 
+    def _add_subscription(
+        self, objects: List["ENSOBJ"], attr_list: list, method: Callable, compress: bool = True
+    ) -> str:
+        """Subscribe to attribute changes on a collection of objects.
+
+        An EnSight callback is registered on every object for the listed attributes.
+        The callback tag carries a macro for each attribute, so the event includes
+        the new attribute values and the callback does not need to query them.
+        The callback is made with the object that changed, the name of the
+        attribute that changed and a dictionary of the attribute values keyed by
+        attribute name.
+
+        Parameters
+        ----------
+        objects : list
+            ``ENSOBJ`` instances to watch.
+        attr_list : list
+            Attributes (enums or names) of the objects to watch.
+        method : Callable
+            Callable that is called as ``method(obj, attr, values)``.
+        compress : bool, optional
+            Whether to call only the last event if a repeated event is generated
+            as a result of an action. The default is ``True``.
+
+        Returns
+        -------
+        str
+            Tag of the subscription, to be passed to the :func:`remove_callback
+            <ansys.pyensight.core.Session.remove_callback>` method.
+        """
+        self._establish_connection()
+        names = [a if isinstance(a, str) else objects[0].attrinfo(a)["name"] for a in attr_list]
+        short_tag = f"pyensight_subscription_{self._subscription_count}"
+        self._subscription_count += 1
+        macros = "&".join(f"{name}={{{{{name}}}}}" for name in names)
+        flags = ""
+        if compress:
+            flags = ",flags=ensight.objs.EVENTMAP_FLAG_COMP_GLOBAL"
+        objids = [obj.__OBJID__ for obj in objects]
+        cmd = "[ensight.objs.addcallback(ensight.objs.wrap_id(_id),None,"
+        cmd += f"'{self._grpc.prefix()}{short_tag}?{macros}',attrs={repr(names)}{flags})"
+        cmd += f" for _id in {objids}]"
+        callback_ids = self.cmd(cmd)
+        targets = {obj.__OBJID__: obj for obj in objects}
+
+        def _notify(url: str) -> None:
+            query = parse_qs(urlparse(url).query)
+            values = {}
+            for name in names:
+                if name in query:
+                    values[name] = self._decode_macro(query[name][0])
+            objid = int(query.get("uid", ["0"])[0])
+            obj = targets.get(objid, None) or self.obj_instance(objid)
+            method(obj, query.get("enum", [""])[0], values)
+
+        if len(self._callbacks) == 0:
+            self._grpc.event_stream_enable(callback=self._event_callback)
+        self._callbacks[short_tag] = (list(callback_ids), _notify)
+        return short_tag
+
+    @staticmethod
+    def _decode_macro(value: str) -> Any:
+        """Convert the text of an attribute value returned by an event macro.
+
+        Parameters
+        ----------
+        value : str
+            Attribute value, as formatted by EnSight.
+
+        Returns
+        -------
+        Any
+            The value as a Python literal, or the text if it is not one.
+        """
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+
     def _event_callback(self, cmd: str) -> None:
         """Pass the URL back to the registered callback.
 
@@ -1574,13 +2037,17 @@ class Session:
         idx_enum = cmd.find("?enum=")
         if idx_question < idx_enum:
             cmd = cmd.replace("?enum=", "&enum=")
-        parse = urlparse(cmd)
-        tag = parse.path[1:]
-        for key, value in self._callbacks.items():
-            # remember "key" is a shortened version of tag
-            if tag.startswith(key):
-                value[1](cmd)
-                return
+        # the tag is the URL path, between the session guid and the query block
+        idx_scheme = cmd.find("://")
+        idx_path = cmd.find("/", idx_scheme + 3 if idx_scheme >= 0 else 0)
+        tag = ""
+        if idx_path >= 0:
+            tag = cmd[idx_path + 1 :].partition("?")[0].partition("#")[0]
+        # remember the keys of the table are shortened versions of the tags
+        value = self._callbacks.match(tag)
+        if value is not None:
+            value[1](cmd)
+            return
         print(f"Unhandled event: {cmd}")
 
     # Object API helper functions
@@ -1604,9 +2071,8 @@ class Session:
     def _prune_hash(self) -> None:
         """Prune the ``ENSOBJ`` hash table.
 
-        The ``ENSOBJ`` hash table may need flushing if it gets too big. Do that here."""
-        if len(self._ensobj_hash) > 1000000:
-            self._ensobj_hash = {}
+        The least recently used proxies are dropped if the table is over its capacity."""
+        self._ensobj_hash.evict()
 
     def add_ensobj_instance(self, obj: "ENSOBJ") -> None:
         """Add a new ``ENSOBJ`` object instance to the hash table.
@@ -1629,6 +2095,165 @@ class Session:
         """
         return self._ensobj_hash.get(ensobjid, None)
 
+    #: Version of the layout of the metadata cache files
+    METADATA_CACHE_FORMAT = 1
+
+    @staticmethod
+    def metadata_cache_dir() -> Optional[str]:
+        """Directory of the on-disk cache of EnSight API metadata.
+
+        The enums and subtype tables of an EnSight version are cached in this
+        directory, so later sessions with the same version do not need to query
+        them.  The directory is set by the ``PYENSIGHT_METADATA_CACHE`` environment
+        variable and defaults to ``~/.cache/pyensight``.  Setting the variable to
+        an empty string disables the cache.
+
+        Returns
+        -------
+        str
+            Pathname of the directory or ``None`` if the cache is disabled.
+        """
+        pathname = os.environ.get("PYENSIGHT_METADATA_CACHE")
+        if pathname is None:
+            return os.path.join(os.path.expanduser("~"), ".cache", "pyensight")
+        return pathname or None
+
+    def _metadata_cache_key(self) -> str:
+        """Identify the EnSight version the metadata belongs to."""
+        from ansys.pyensight.core import __version__  # pylint: disable=import-outside-toplevel
+
+        key = [self.METADATA_CACHE_FORMAT, __version__, self._cei_home, self._cei_suffix]
+        key += [self._ensight_build, self._ensight_python_version]
+        return json.dumps([str(value) for value in key])
+
+    def _metadata_cache_pathname(self) -> Optional[str]:
+        """Pathname of the cache file for the metadata of this EnSight version."""
+        cache_dir = self.metadata_cache_dir()
+        if cache_dir is None:
+            return None
+        digest = hashlib.sha256(self._metadata_cache_key().encode("utf-8")).hexdigest()
+        return os.path.join(cache_dir, f"ensight_metadata_{digest[:16]}.json")
+
+    def _fetch_metadata(self) -> Dict[str, Any]:
+        """Query the enums and subtype tables of the EnSight instance.
+
+        Returns
+        -------
+        dict
+            ``enums`` and ``subtype_tables`` dictionaries.
+        """
+        cmd = "{key: getattr(ensight.objs.enums, key) for key in dir(ensight.objs.enums)}"
+        new_enums = self.cmd(cmd)
+        enums = dict()
+        for key, value in new_enums.items():
+            if key.startswith("__") and (key != "__OBJID__"):
+                continue
+            enums[key] = value
+        # EnSight has no query for the subtype tables, the built-in ones are recorded
+        return dict(enums=enums, subtype_tables=_SUBTYPE_TABLES)
+
+    def _load_metadata(self) -> Dict[str, Any]:
+        """Get the enums and subtype tables of the EnSight instance.
+
+        The metadata is read from the cache for this EnSight version, if there is
+        one.  Otherwise, it is queried from EnSight and the cache is written.
+
+        Returns
+        -------
+        dict
+            ``enums`` and ``subtype_tables`` dictionaries.
+        """
+        pathname = self._metadata_cache_pathname()
+        if pathname is None:
+            return self._fetch_metadata()
+        metadata = _METADATA_MEMO.get(pathname)
+        if metadata is None:
+            try:
+                with open(pathname, "r") as fp:
+                    metadata = json.load(fp)
+                if metadata.pop("key", None) != self._metadata_cache_key():
+                    metadata = None
+            except (OSError, ValueError, AttributeError):
+                metadata = None
+        if metadata is None:
+            metadata = self._fetch_metadata()
+            self._save_metadata(pathname, metadata)
+        _METADATA_MEMO[pathname] = metadata
+        return metadata
+
+    def _save_metadata(self, pathname: str, metadata: Dict[str, Any]) -> None:
+        """Write the metadata to a cache file.
+
+        The cache is an optimization, so failing to write it is not an error.
+
+        Parameters
+        ----------
+        pathname : str
+            Pathname of the cache file.
+        metadata : dict
+            ``enums`` and ``subtype_tables`` dictionaries.
+        """
+        try:
+            text = json.dumps(dict(key=self._metadata_cache_key(), **metadata))
+            os.makedirs(os.path.dirname(pathname), exist_ok=True)
+            # write a complete file under its final name, sessions may share the cache
+            tmp_pathname = f"{pathname}.{os.getpid()}.tmp"
+            with open(tmp_pathname, "w") as fp:
+                fp.write(text)
+            os.replace(tmp_pathname, pathname)
+        except (OSError, TypeError, ValueError):  # pragma: no cover
+            pass  # pragma: no cover
+
+    def _apply_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Update the API proxies with the enums and subtype tables of the EnSight instance.
+
+        Parameters
+        ----------
+        metadata : dict
+            ``enums`` and ``subtype_tables`` dictionaries.
+        """
+        self._metadata = metadata
+        for key, value in metadata["enums"].items():
+            setattr(self._ensight.objs.enums, key, value)
+        # JSON object keys are strings
+        self._subtype_tables = {
+            classname: {int(value): name for value, name in table.items()}
+            for classname, table in metadata["subtype_tables"].items()
+        }
+
+    def validate_metadata_cache(self) -> bool:
+        """Check the cached EnSight API metadata against the EnSight instance.
+
+        The enums and subtype tables of an EnSight version are cached on disk (see
+        :func:`metadata_cache_dir<ansys.pyensight.core.Session.metadata_cache_dir>`)
+        and are not queried again by later sessions.  This method queries them from
+        EnSight and, if they differ from the cached values, updates the session
+        and the cache.
+
+        Returns
+        -------
+        bool
+            ``True`` if the cached metadata matched the EnSight instance.
+
+        Examples
+        --------
+        >>> from ansys.pyensight.core import LocalLauncher
+        >>> session = LocalLauncher().start()
+        >>> session.validate_metadata_cache()
+        True
+        """
+        metadata = self._fetch_metadata()
+        # compare in the JSON form of the cache
+        current = json.dumps(self._metadata, sort_keys=True, default=repr)
+        if json.dumps(metadata, sort_keys=True, default=repr) == current:
+            return True
+        self._apply_metadata(metadata)
+        pathname = self._metadata_cache_pathname()
+        if pathname is not None:
+            self._save_metadata(pathname, metadata)
+            _METADATA_MEMO[pathname] = metadata
+        return False
+
     def _obj_attr_subtype(self, classname: str) -> Tuple[Optional[int], Optional[dict]]:
         """Get subtype information for a given class.
 
@@ -1658,6 +2283,105 @@ class Session:
 
         return None, None
 
+    # "Class: {classname}, ... CvfObjID: {objid}, cached:{yes|no}", never spanning two objects
+    _CTOR_PATTERN = re.compile(
+        r"Class: (?P<body>(?:(?!Class: ).)*?)CvfObjID: (?P<objid>\d+), cached:(?:yes|no)"
+    )
+    _CTOR_SUBTYPE = re.compile(r"(?:PartType|AnnotType|ToolType):\s*(-?\d+)")
+
+    def _ctor_args(self, body: str, objid: int) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get the proxy class and constructor keywords for an object repl block.
+
+        Parameters
+        ----------
+        body : str
+            Text of the block between ``"Class: "`` and ``"CvfObjID:"``.
+        objid : int
+            ID of the ``ENSOBJ`` object.
+
+        Returns
+        -------
+        Optional[Tuple[str, Dict[str, Any]]]
+            ``None`` if a proxy object for the ID already exists, otherwise the name
+            of the proxy class and the extra keywords for its constructor.
+        """
+        if objid in self._ensobj_hash:
+            return None
+        classname = body.split(",", 1)[0]
+        kwargs: Dict[str, Any] = {}
+        # pick the subclass based on the classname
+        attr_id, classname_lookup = self._obj_attr_subtype(classname)
+        if attr_id is not None:
+            # Subtype (PartType:, AnnotType:, ToolType:)
+            subtype = self._CTOR_SUBTYPE.search(body)
+            if subtype is not None:
+                # the 2024 R2 interface includes the subtype
+                value = int(subtype.group(1))
+                if (classname_lookup is not None) and (value in classname_lookup):
+                    classname = classname_lookup[value]
+                    kwargs = dict(attr_id=attr_id, attr_value=value)
+            elif classname_lookup is not None:  # pragma: no cover
+                # if a "subclass" case and no subclass attrid value, ask for it...
+                remote_name = self.remote_obj(objid)
+                cmd = f"{remote_name}.getattr({attr_id})"
+                attr_value = self.cmd(cmd)
+                if attr_value in classname_lookup:
+                    classname = classname_lookup[attr_value]
+                    kwargs = dict(attr_id=attr_id, attr_value=attr_value)
+        # Owned flag
+        if "Owned," in body:
+            kwargs["owned"] = True
+        return classname, kwargs
+
+    def _decode_json(self, s: str) -> Any:
+        """Decode the reply of a command run with ``json=True``.
+
+        Parameters
+        ----------
+        s : str
+            JSON reply of the command.
+
+        Returns
+        -------
+        Any
+            The result of the command, with the ``ENSOBJ`` references converted
+            into proxy objects.
+        """
+        self._prune_hash()
+        value = json.loads(s, object_hook=self._json_object_hook)
+        # The reply may be the JSON encoding of the string built in EnSight
+        if isinstance(value, str):
+            value = json.loads(value, object_hook=self._json_object_hook)
+        result = value["result"]
+        if isinstance(result, list):
+            result = ensobjlist(result, session=self)
+        return result
+
+    def _json_object_hook(self, obj: Dict[str, Any]) -> Any:
+        """Convert ``{"__ensobj__": repr}`` references into proxy objects.
+
+        Parameters
+        ----------
+        obj : dict
+            A decoded JSON object.
+
+        Returns
+        -------
+        Any
+            The proxy object for a reference, otherwise the input dictionary.
+        """
+        if len(obj) != 1 or "__ensobj__" not in obj:
+            return obj
+        match = self._CTOR_PATTERN.search(obj["__ensobj__"])
+        if match is None:  # pragma: no cover
+            return obj["__ensobj__"]  # pragma: no cover
+        objid = int(match.group("objid"))
+        ctor = self._ctor_args(match.group("body"), objid)
+        if ctor is None:
+            return self.obj_instance(objid)
+        classname, kwargs = ctor
+        return getattr(self.ensight.objs, classname)(self, objid, **kwargs)
+
     def _convert_ctor(self, s: str) -> str:
         """Convert ENSOBJ object references into executable code in __repl__ strings.
 
@@ -1689,69 +2413,29 @@ class Session:
 
         """
         self._prune_hash()
-        offset = 0
-        while True:
-            # Find the object repl block to replace
-            id = s.find("CvfObjID:", offset)
-            if id == -1:
-                break
-            start = s.find("Class: ", offset)
-            if (start == -1) or (start > id):
-                break
-            tail_len = 11
-            tail = s.find(", cached:no", offset)
-            if tail == -1:
-                tail_len = 12
-                tail = s.find(", cached:yes", offset)
-            if tail == -1:  # pragma: no cover
-                break  # pragma: no cover
-            # just this object substring
-            tmp = s[start + 7 : tail]
-            # Subtype (PartType:, AnnotType:, ToolType:)
-            subtype = None
-            for name in ("PartType:", "AnnotType:", "ToolType:"):
-                location = tmp.find(name)
-                if location != -1:
-                    subtype = int(tmp[location + len(name) :].split(",")[0])
-                    break
-            # Owned flag
-            owned_flag = "Owned," in tmp
-            # isolate the block to replace
-            prefix = s[:start]
-            suffix = s[tail + tail_len :]
-            # parse out the object id and classname
-            objid = int(s[id + 9 : tail])
-            classname = s[start + 7 : tail]
-            comma = classname.find(",")
-            classname = classname[:comma]
-            # pick the subclass based on the classname
-            attr_id, classname_lookup = self._obj_attr_subtype(classname)
-            # generate the replacement text
-            if objid in self._ensobj_hash:
-                replace_text = f"session.obj_instance({objid})"
+        # Single pass over the object repl blocks
+        pieces = []
+        last = 0
+        for match in self._CTOR_PATTERN.finditer(s):
+            pieces.append(s[last : match.start()])
+            objid = int(match.group("objid"))
+            ctor = self._ctor_args(match.group("body"), objid)
+            if ctor is None:
+                pieces.append(f"session.obj_instance({objid})")
             else:
+                classname, kwargs = ctor
                 subclass_info = ""
-                if attr_id is not None:
-                    if subtype is not None:
-                        # the 2024 R2 interface includes the subtype
-                        if (classname_lookup is not None) and (subtype in classname_lookup):
-                            classname = classname_lookup[subtype]
-                            subclass_info = f",attr_id={attr_id}, attr_value={subtype}"
-                    elif classname_lookup is not None:  # pragma: no cover
-                        # if a "subclass" case and no subclass attrid value, ask for it...
-                        remote_name = self.remote_obj(objid)
-                        cmd = f"{remote_name}.getattr({attr_id})"
-                        attr_value = self.cmd(cmd)
-                        if attr_value in classname_lookup:
-                            classname = classname_lookup[attr_value]
-                            subclass_info = f",attr_id={attr_id}, attr_value={attr_value}"
-                if owned_flag:
+                if "attr_id" in kwargs:
+                    subclass_info = (
+                        f",attr_id={kwargs['attr_id']}, attr_value={kwargs['attr_value']}"
+                    )
+                if kwargs.get("owned"):
                     subclass_info += ",owned=True"
-                replace_text = f"session.ensight.objs.{classname}(session, {objid}{subclass_info})"
-            if replace_text is None:  # pragma: no cover
-                break  # pragma: no cover
-            offset = start + len(replace_text)
-            s = prefix + replace_text + suffix
+                pieces.append(f"session.ensight.objs.{classname}(session, {objid}{subclass_info})")
+            last = match.end()
+        if pieces:
+            pieces.append(s[last:])
+            s = "".join(pieces)
         s = s.strip()
         if s.startswith("[") and s.endswith("]"):
             s = f"ensobjlist({s}, session=session)"
@@ -20,14 +20,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import base64
 import glob
+import io
 import os
+import queue
+import shutil
 import tempfile
+import threading
 from types import ModuleType
-from typing import Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import uuid
 
 from PIL import Image
+from ansys.pyensight.core.utils.support import RemoteMethods
 import numpy
 
 try:
@@ -36,6 +42,19 @@ try:
 except ImportError:
     from ansys.api.pyensight import ensight_api
 
+if TYPE_CHECKING:
+    from ansys.pyensight.core import Session
+
+
+def _import_imageio() -> Any:
+    try:
+        import imageio
+    except ModuleNotFoundError:  # pragma: no cover
+        raise RuntimeError(
+            "The imageio and imageio-ffmpeg modules must be installed to encode animations locally"
+        )
+    return imageio
+
 
 class Export:
     """Provides the ``ensight.utils.export`` interface.
@@ -59,6 +78,8 @@ class Export:
 
     def __init__(self, interface: Union["ensight_api.ensight", "ensight"]):
         self._ensight = interface
+        # the remote functions work on EnSight-side files, so they never run locally
+        self._remote = RemoteMethods(interface, "export", self, local_fallback=False)
 
     def _remote_support_check(self):
         """Determine if ``ensight.utils.export`` exists on the remote system.
@@ -83,6 +104,78 @@ class Export:
             {ansys.pyensight.core.DEFAULT_ANSYS_VERSION} or higher installed to use this API."
             )
 
+    STREAM_CHUNK_SIZE: int = 16 * 1024 * 1024
+
+    def _read_chunk_remote(self, filename: str, offset: int, numbytes: int) -> bytes:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to read.
+        offset : int
+            Offset of the first byte to read.
+        numbytes : int
+            Maximum number of bytes to read.
+
+        Returns
+        -------
+        bytes
+            Bytes read. The result is empty at the end of the file.
+        """
+        with open(filename, "rb") as fp:
+            fp.seek(offset)
+            return fp.read(numbytes)
+
+    def _remove_remote(self, path: str) -> None:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        path : str
+            Temporary directory to remove with all of its content.
+        """
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _stream_file(
+        self,
+        remote_filename: str,
+        size: int,
+        filename: str,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Copy a file from the EnSight side to a local file, one chunk at a time.
+
+        Parameters
+        ----------
+        remote_filename : str
+            Name of the file on the EnSight side.
+        size : int
+            Size of the file in bytes.
+        filename : str
+            Name of the local file to write.
+        progress : Callable, optional
+            Called as ``progress(bytes_written, size)`` after each chunk.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
+        offset = 0
+        with open(filename, "wb") as fp:
+            while offset < size:
+                data = self._remote.call(
+                    "_read_chunk_remote", remote_filename, offset, self.STREAM_CHUNK_SIZE
+                )
+                if not data:  # pragma: no cover
+                    break  # pragma: no cover
+                fp.write(data)
+                offset += len(data)
+                if progress:
+                    progress(offset, size)
+        return offset
+
     TIFFTAG_IMAGEDESCRIPTION: int = 0x010E
 
     def image(
@@ -130,18 +223,18 @@ class Export:
         if height is None:
             height = win_size[1]
 
-        if isinstance(self._ensight, ModuleType):  # pragma: no cover
-            raw_image = self._image_remote(
-                width, height, passes, enhanced, raytrace
+        if self._remote.has("_image_buffers_remote"):
+            planes = self._image_data(width, height, passes, enhanced, raytrace)
+            pil_image = self._planes_to_pil(planes)
+            metadata = planes["metadata"]
+        else:  # pragma: no cover
+            raw_image = self._remote.call(
+                "_image_remote", width, height, passes, enhanced, raytrace
             )  # pragma: no cover
-        else:
-            cmd = f"ensight.utils.export._image_remote({width}, {height}, {passes}, "
-            cmd += f"{enhanced}, {raytrace})"
-            raw_image = self._ensight._session.cmd(cmd)
-
-        pil_image = self._dict_to_pil(raw_image)
+            pil_image = self._dict_to_pil(raw_image)  # pragma: no cover
+            metadata = raw_image["metadata"]  # pragma: no cover
         if enhanced:
-            tiffinfo_dir = {self.TIFFTAG_IMAGEDESCRIPTION: raw_image["metadata"]}
+            tiffinfo_dir = {self.TIFFTAG_IMAGEDESCRIPTION: metadata}
             pil_image[0].save(
                 filename,
                 save_all=True,
@@ -151,6 +244,484 @@ class Export:
         else:
             pil_image[0].save(filename)
 
+    def image_data(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        passes: int = 4,
+        enhanced: bool = False,
+        raytrace: bool = False,
+    ) -> Dict[str, Any]:
+        """Render an image of the current EnSight scene and return its channels.
+
+        The channels are numpy arrays sharing a single buffer received from EnSight,
+        with the first row at the top of the image.
+
+        Parameters
+        ----------
+        width : int, optional
+            Width of the image in pixels. The default is ``None``, in which case
+            ``ensight.objs.core.WINDOWSIZE[0]`` is used.
+        height : int, optional
+            Height of the image in pixels. The default is ``None``, in which case
+            ``ensight.objs.core.WINDOWSIZE[1]`` is used.
+        passes : int, optional
+            Number of antialiasing passes. The default is ``4``.
+        enhanced : bool, optional
+            Whether to include the per-pixel object and variable channels.
+            The default is ``False``.
+        raytrace : bool, optional
+            Whether to render the image with the raytracing engine. The default is ``False``.
+
+        Returns
+        -------
+        dict
+            The ``"pixeldata"``, ``"pickdata"`` and ``"variabledata"`` arrays (``None``
+            if not available) and the image ``"metadata"``.
+
+        Examples
+        --------
+        >>> s = LocalLauncher().start()
+        >>> s.load_data(f"{s.cei_home}/ensight{s.cei_suffix}/data/cube/cube.case")
+        >>> rgb = s.ensight.utils.export.image_data(enhanced=True)["pixeldata"]
+
+        """
+        self._remote_support_check()
+        win_size = self._ensight.objs.core.WINDOWSIZE
+        if width is None:
+            width = win_size[0]
+        if height is None:
+            height = win_size[1]
+        return self._image_data(width, height, passes, enhanced, raytrace)
+
+    def render_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        chunk_size: int = 8,
+        sessions: Optional[List["Session"]] = None,
+    ) -> Iterator[Tuple[int, List[Image.Image]]]:
+        """Render a set of images, each with its own view, timestep and size.
+
+        The jobs are sent to EnSight in chunks of ``chunk_size``. Each chunk is
+        rendered by EnSight in a single request, and the images are yielded as
+        soon as the chunk is received. The view and timestep of the session are
+        restored once each chunk is rendered.
+
+        Each job is a dictionary with these optional keys:
+
+        * ``"view"``: Name of a view stored in ``ensight.utils.views.views_dict`` or a
+          ``(vportindex, coretransform)`` tuple, as stored in that dictionary.
+          The default is the current view.
+        * ``"timestep"``: Timestep to render. The default is the current timestep.
+        * ``"width"``, ``"height"``: Size of the image in pixels. The default is
+          ``ensight.objs.core.WINDOWSIZE``.
+        * ``"passes"``, ``"enhanced"``, ``"raytrace"``: As for the ``image()`` method.
+          The defaults are ``4``, ``False`` and ``False``.
+
+        Parameters
+        ----------
+        jobs : list
+            List of jobs to render.
+        chunk_size : int, optional
+            Number of jobs rendered by each request. The default is ``8``.
+        sessions : list, optional
+            Sessions to spread the chunks across. Each session must have the same
+            dataset loaded. The default is ``None``, in which case only this session
+            is used.
+
+        Returns
+        -------
+        Iterator
+            ``(index, images)`` tuples, where ``index`` is the position of the job in
+            ``jobs`` and ``images`` is the list of one or three image objects,
+            [RGB {, pick, variable}]. When several sessions are used, the images
+            are yielded in the order they are rendered.
+
+        Examples
+        --------
+        >>> s = LocalLauncher().start()
+        >>> s.load_data(f"{s.cei_home}/ensight{s.cei_suffix}/data/guard_rail/crash.case")
+        >>> views = s.ensight.utils.views
+        >>> views.set_view_direction(1, 1, 1, name="iso")
+        >>> views.set_view_direction(0, 0, 1, name="front")
+        >>> jobs = [dict(view=v, timestep=t) for v in ("iso", "front") for t in range(10)]
+        >>> for index, images in s.ensight.utils.export.render_batch(jobs):
+        ...     images[0].save(f"image_{index:04}.png")
+
+        """
+        if chunk_size < 1:
+            raise RuntimeError("chunk_size must be at least 1")
+        self._remote_support_check()
+        win_size = self._ensight.objs.core.WINDOWSIZE
+        views_dict = self._ensight.utils.views.views_dict
+        normalized = [self._render_job(job, win_size, views_dict) for job in jobs]
+        chunks = [
+            list(range(start, min(start + chunk_size, len(normalized))))
+            for start in range(0, len(normalized), chunk_size)
+        ]
+        if not sessions:
+            for indices in chunks:
+                replies = self._render_jobs([normalized[i] for i in indices])
+                for index, reply in zip(indices, replies):
+                    yield index, self._planes_to_pil(self._unpack_image(reply))
+            return
+        pending: queue.Queue = queue.Queue()
+        for indices in chunks:
+            pending.put(indices)
+        results: queue.Queue = queue.Queue()
+
+        def worker(session: "Session") -> None:
+            export = session.ensight.utils.export
+            try:
+                while True:
+                    try:
+                        indices = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    replies = export._render_jobs([normalized[i] for i in indices])
+                    results.put((indices, replies))
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(None)
+
+        def cancel_pending() -> None:
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+
+        threads = [threading.Thread(target=worker, args=(s,), daemon=True) for s in sessions]
+        for thread in threads:
+            thread.start()
+        running = len(threads)
+        error: Optional[Exception] = None
+        try:
+            while running:
+                item = results.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    error = item
+                    cancel_pending()
+                elif error is None:
+                    indices, replies = item
+                    for index, reply in zip(indices, replies):
+                        yield index, self._planes_to_pil(self._unpack_image(reply))
+        finally:
+            # on errors or an abandoned generator, stop the workers after their current chunk
+            cancel_pending()
+            for thread in threads:
+                thread.join()
+        if error is not None:
+            raise RuntimeError(f"Unable to render batch: {error}") from error
+
+    @staticmethod
+    def _render_job(
+        job: Dict[str, Any], win_size: List[int], views_dict: Dict[str, Tuple[int, List[float]]]
+    ) -> Dict[str, Any]:
+        """Validate a ``render_batch()`` job and fill in the defaults.
+
+        Parameters
+        ----------
+        job : dict
+            The job to validate.
+        win_size : list
+            The default image size.
+        views_dict : dict
+            The stored views, used to resolve view names.
+
+        Returns
+        -------
+        dict
+            The job, using only values that support ``repr()``.
+        """
+        unknown = set(job) - {
+            "view",
+            "timestep",
+            "width",
+            "height",
+            "passes",
+            "enhanced",
+            "raytrace",
+        }
+        if unknown:
+            raise RuntimeError(f"Unknown render job keys: {sorted(unknown)}")
+        view = job.get("view")
+        if isinstance(view, str):
+            if view not in views_dict:
+                raise RuntimeError(f"View {view} not available")
+            view = views_dict[view]
+        viewport, transform = (0, None) if view is None else view
+        timestep = job.get("timestep")
+        return dict(
+            viewport=int(viewport),
+            transform=None if transform is None else [float(v) for v in transform],
+            timestep=None if timestep is None else int(timestep),
+            width=int(job.get("width", win_size[0])),
+            height=int(job.get("height", win_size[1])),
+            passes=int(job.get("passes", 4)),
+            enhanced=bool(job.get("enhanced", False)),
+            raytrace=bool(job.get("raytrace", False)),
+        )
+
+    def _render_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Render a chunk of normalized ``render_batch()`` jobs.
+
+        Parameters
+        ----------
+        jobs : list
+            The jobs, as returned by ``_render_job()``.
+
+        Returns
+        -------
+        list
+            The images packed by ``_pack_image_remote()``.
+        """
+        if self._remote.has("_render_batch_remote"):
+            return self._remote.call("_render_batch_remote", jobs)
+
+        # older EnSight: set the view and the timestep from here
+        def render(job: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover
+            raw_image = self._remote.call(
+                "_image_remote",
+                job["width"],
+                job["height"],
+                job["passes"],
+                job["enhanced"],
+                job["raytrace"],
+            )
+            arrays = {
+                name: self._numpy_from_dict(raw_image.get(name)) for name in self.IMAGE_PLANES
+            }
+            return self._pack_planes(raw_image["metadata"], arrays)
+
+        return self._run_render_jobs(jobs, render)  # pragma: no cover
+
+    def _run_render_jobs(
+        self, jobs: List[Dict[str, Any]], render: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Set the view and the timestep of each job, render it, and restore the session.
+
+        The jobs that do not specify a view or a timestep use the ones of the session
+        when the chunk starts, so that each chunk renders the same way on any session.
+
+        Parameters
+        ----------
+        jobs : list
+            The jobs, as returned by ``_render_job()``.
+        render : Callable
+            Called with each job once the view and the timestep are set. It returns
+            the packed image.
+
+        Returns
+        -------
+        list
+            The images returned by ``render``.
+        """
+        core = self._ensight.objs.core
+        timestep = core.TIMESTEP
+        transforms = {}
+        for job in jobs:
+            if job["viewport"] not in transforms:
+                transforms[job["viewport"]] = core.VPORTS[job["viewport"]].CORETRANSFORM
+        current = dict(transforms)
+        replies = []
+        try:
+            for job in jobs:
+                viewport = job["viewport"]
+                transform = job["transform"]
+                if transform is None:
+                    transform = transforms[viewport]
+                if transform != current[viewport]:
+                    core.VPORTS[viewport].CORETRANSFORM = transform
+                    current[viewport] = transform
+                step = timestep if job["timestep"] is None else job["timestep"]
+                if step != core.TIMESTEP:
+                    core.TIMESTEP = step
+                replies.append(render(job))
+        finally:
+            for viewport, transform in transforms.items():
+                if transform != current[viewport]:
+                    core.VPORTS[viewport].CORETRANSFORM = transform
+            if core.TIMESTEP != timestep:
+                core.TIMESTEP = timestep
+        return replies
+
+    def _render_batch_remote(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        jobs : list
+            The jobs, as returned by ``_render_job()``.
+
+        Returns
+        -------
+        list
+            The images packed by ``_pack_image_remote()``.
+        """
+
+        def render(job: Dict[str, Any]) -> Dict[str, Any]:
+            img = self._render_remote(
+                job["width"], job["height"], job["passes"], job["enhanced"], job["raytrace"]
+            )
+            return self._pack_image_remote(img)
+
+        return self._run_render_jobs(jobs, render)
+
+    IMAGE_PLANES = ("pixeldata", "pickdata", "variabledata")
+
+    def _image_data(
+        self, width: int, height: int, passes: int, enhanced: bool, raytrace: bool
+    ) -> Dict[str, Any]:
+        """Render an image with ``_image_buffers_remote()`` and unpack its channels.
+
+        Parameters
+        ----------
+        width : int
+            Width of the image in pixels.
+        height : int
+            Height of the image in pixels.
+        passes : int
+            Number of antialiasing passes.
+        enhanced : bool
+            Whether to include the per-pixel object and variable channels.
+        raytrace :
+            Whether to render the image with the raytracing engine.
+
+        Returns
+        -------
+        dict
+            The channels, as numpy arrays over the received buffer, and the metadata.
+        """
+        reply = self._remote.call(
+            "_image_buffers_remote", width, height, passes, enhanced, raytrace
+        )
+        return self._unpack_image(reply)
+
+    def _unpack_image(self, reply: Dict[str, Any]) -> Dict[str, Any]:
+        """Unpack an image packed by ``_pack_image_remote()``.
+
+        Parameters
+        ----------
+        reply : dict
+            The packed image.
+
+        Returns
+        -------
+        dict
+            The channels, as numpy arrays over the decoded buffer, and the metadata.
+        """
+        buffer = base64.b64decode(reply["data"])
+        output: Dict[str, Any] = {name: None for name in self.IMAGE_PLANES}
+        output["metadata"] = reply["metadata"]
+        for name, shape, dtype, offset in reply["planes"]:
+            count = int(numpy.prod(shape))
+            output[name] = numpy.frombuffer(
+                buffer, dtype=dtype, count=count, offset=offset
+            ).reshape(shape)
+        return output
+
+    def _planes_to_pil(self, planes: Dict[str, Any]) -> list:
+        """Convert the channels returned by ``_image_data()`` into PIL images.
+
+        Parameters
+        ----------
+        planes : dict
+            The channels returned by ``_image_data()``.
+
+        Returns
+        -------
+        list
+            List of one or three image objects, [RGB {, pick, variable}].
+        """
+        # The arrays are contiguous, so PIL uses them without a copy
+        images = [Image.fromarray(planes["pixeldata"])]
+        if planes["variabledata"] is not None and planes["pickdata"] is not None:
+            images.append(Image.fromarray(planes["pickdata"]))
+            images.append(Image.fromarray(planes["variabledata"]))
+        return images
+
+    def _image_buffers_remote(
+        self, width: int, height: int, passes: int, enhanced: bool, raytrace: bool
+    ) -> dict:
+        """EnSight-side implementation.
+
+        The channels are flipped so that the first row is at the top of the image,
+        and packed into a single base64 encoded buffer. This is much cheaper to transfer
+        and to parse than the ``repr()`` of one ``bytes`` object per channel.
+
+        Parameters
+        ----------
+        width : int
+            Width of the image in pixels.
+        height : int
+            Height of the image in pixels.
+        passes : int
+            Number of antialiasing passes.
+        enhanced : bool
+            Whether to include the per-pixel object and variable channels.
+        raytrace :
+            Whether to render the image with the raytracing engine.
+
+        Returns
+        -------
+        dict
+            The image metadata, the list of (name, shape, dtype, offset) of the channels
+            and the base64 encoded buffer.
+        """
+        img = self._render_remote(width, height, passes, enhanced, raytrace)
+        return self._pack_image_remote(img)
+
+    def _pack_image_remote(self, img: Any) -> dict:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        img : enve.image
+            The rendered image.
+
+        Returns
+        -------
+        dict
+            The image metadata, the list of (name, shape, dtype, offset) of the channels
+            and the base64 encoded buffer.
+        """
+        arrays = {name: getattr(img, name) for name in self.IMAGE_PLANES}
+        return self._pack_planes(img.metadata, arrays)
+
+    def _pack_planes(self, metadata: str, arrays: Dict[str, Any]) -> dict:
+        """Flip the image channels and pack them into a single base64 encoded buffer.
+
+        Parameters
+        ----------
+        metadata : str
+            The image metadata.
+        arrays : dict
+            The channels, bottom row first, or ``None`` for the missing ones.
+
+        Returns
+        -------
+        dict
+            The image metadata, the list of (name, shape, dtype, offset) of the channels
+            and the base64 encoded buffer.
+        """
+        planes = []
+        chunks = []
+        offset = 0
+        for name in self.IMAGE_PLANES:
+            array = arrays.get(name)
+            if array is None:
+                continue
+            array = numpy.ascontiguousarray(array[::-1])
+            planes.append((name, array.shape, array.dtype.str, offset))
+            chunks.append(array.tobytes())
+            offset += array.nbytes
+        data = base64.b64encode(b"".join(chunks)).decode("ascii")
+        return dict(metadata=metadata, planes=planes, data=data)
+
     def _dict_to_pil(self, data: dict) -> list:
         """Convert the contents of the dictionary into a PIL image.
 
@@ -239,6 +810,38 @@ class Export:
         dict
             Dictionary of the various channels.
         """
+        img = self._render_remote(width, height, passes, enhanced, raytrace)
+        # get the channels from the enve.image instance
+        output = dict(width=width, height=height, metadata=img.metadata)
+        # extract the channels from the image
+        output["pixeldata"] = self._numpy_to_dict(img.pixeldata)
+        output["variabledata"] = self._numpy_to_dict(img.variabledata)
+        output["pickdata"] = self._numpy_to_dict(img.pickdata)
+        return output
+
+    def _render_remote(
+        self, width: int, height: int, passes: int, enhanced: bool, raytrace: bool
+    ) -> Any:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        width : int
+            Width of the image in pixels.
+        height : int
+            Height of the image in pixels.
+        passes : int
+            Number of antialiasing passes.
+        enhanced : bool
+            Whether to include the per-pixel object and variable channels.
+        raytrace :
+            Whether to render the image with the raytracing engine.
+
+        Returns
+        -------
+        enve.image
+            The rendered image.
+        """
         if not raytrace:
             img = ensight.render(x=width, y=height, num_samples=passes, enhanced=enhanced)
         else:
@@ -257,13 +860,7 @@ class Export:
                 ensight.file.save_image()
                 img = enve.image()
                 img.load(f"{tmpfilename}.png")
-        # get the channels from the enve.image instance
-        output = dict(width=width, height=height, metadata=img.metadata)
-        # extract the channels from the image
-        output["pixeldata"] = self._numpy_to_dict(img.pixeldata)
-        output["variabledata"] = self._numpy_to_dict(img.variabledata)
-        output["pickdata"] = self._numpy_to_dict(img.pickdata)
-        return output
+        return img
 
     ANIM_TYPE_SOLUTIONTIME: int = 0
     ANIM_TYPE_ANIMATEDTRACES: int = 1
@@ -282,6 +879,8 @@ class Export:
         frames_per_second: float = 60.0,
         format_options: Optional[str] = "",
         raytrace: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        encode_locally: bool = False,
     ) -> None:
         """Generate an MPEG4 animation file.
 
@@ -329,6 +928,16 @@ class Export:
             More specific options for the MPEG4 encoder. The default is ``""``.
         raytrace : bool, optional
             Whether to render the image with the raytracing engine. The default is ``False``.
+        progress : Callable, optional
+            Called as ``progress(done, total)`` while the animation is copied to the local
+            file, in bytes, or in frames if ``encode_locally`` is ``True``.
+        encode_locally : bool, optional
+            Whether to render the frames in EnSight and encode them into the MPEG4 file
+            locally, in a background thread. This requires the ``imageio`` and
+            ``imageio-ffmpeg`` modules. ``format_options`` is ignored in this case.
+            The default is ``False``, in which case EnSight encodes the animation and
+            the file is copied to the local file in chunks. EnSight sessions that cannot
+            copy files in chunks always encode the animation and return it in one reply.
 
         Examples
         --------
@@ -370,27 +979,123 @@ class Export:
             raise RuntimeError("No frames selected. Perhaps a static dataset SOLUTIONTIME request \
                  or no FLIPBOOK/KEYFRAME defined.")  # pragma: no cover
 
-        if isinstance(self._ensight, ModuleType):  # pragma: no cover
-            raw_mpeg4 = self._animation_remote(  # pragma: no cover
-                width,
-                height,
-                passes,
-                anim_type,
-                starting_frame,
-                num_frames,
-                frames_per_second,
-                format_options,
-                raytrace,
-            )
-        else:
-            cmd = f"ensight.utils.export._animation_remote({width}, {height}, {passes}, "
-            cmd += f"{anim_type}, {starting_frame}, {num_frames}, "
-            cmd += f"{frames_per_second}, '{format_options}', {raytrace})"
-            raw_mpeg4 = self._ensight._session.cmd(cmd)
+        args = (
+            width,
+            height,
+            passes,
+            anim_type,
+            starting_frame,
+            num_frames,
+            frames_per_second,
+            format_options,
+            raytrace,
+        )
+        streaming = self._remote.has("_animation_file_remote") and self._remote.has(
+            "_read_chunk_remote"
+        )
+        if not streaming:
+            # older EnSight sessions can only return the encoded MPEG4 in one reply
+            self._animation_single_reply(filename, args)
+            return
+        if encode_locally:
+            self._animation_encode_locally(filename, args, progress)
+            return
+        tmpdirname, files = self._remote.call("_animation_file_remote", *args, "mpeg4")
+        try:
+            if not files:  # pragma: no cover
+                raise IOError("Animation export was not successful")  # pragma: no cover
+            self._stream_file(files[0][0], files[0][1], filename, progress)
+        finally:
+            self._remote.call("_remove_remote", tmpdirname)
+
+    def _animation_single_reply(self, filename: str, args: Tuple) -> None:
+        """Export the animation with a single command returning all of the MPEG4 bytes.
 
+        This is used with EnSight sessions that do not provide ``_animation_file_remote()``.
+
+        Parameters
+        ----------
+        filename : str
+            Name for the MPEG4 file to save to local disk.
+        args : tuple
+            Positional arguments for ``_animation_remote()``.
+        """
+        raw_mpeg4 = self._remote.call("_animation_remote", *args)
         with open(filename, "wb") as fp:
             fp.write(raw_mpeg4)
 
+    def _animation_encode_locally(
+        self,
+        filename: str,
+        args: Tuple,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Render the animation frames in EnSight and encode them into MPEG4 locally.
+
+        The frames are rendered as PNG images. Each one is copied to the local
+        system and handed to an encoder running in a background thread, so
+        copying and encoding overlap.
+
+        Parameters
+        ----------
+        filename : str
+            Name for the MPEG4 file to save to local disk.
+        args : tuple
+            Positional arguments for ``_animation_file_remote()``, except the format.
+        progress : Callable, optional
+            Called as ``progress(frames_done, frames_total)`` after each frame.
+        """
+        imageio = _import_imageio()
+        fps = args[6]
+        frame_queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=8)
+        errors: List[Exception] = []
+
+        def encode_frames() -> None:
+            writer = None
+            while True:
+                data = frame_queue.get()
+                if data is None:
+                    break
+                if errors:
+                    # keep draining the queue so the producer never blocks
+                    continue
+                try:
+                    if writer is None:
+                        writer = imageio.get_writer(filename, format="FFMPEG", mode="I", fps=fps)
+                    with Image.open(io.BytesIO(data)) as image:
+                        writer.append_data(numpy.asarray(image.convert("RGB")))
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)  # pragma: no cover
+            if writer is not None:
+                writer.close()
+
+        encoder = threading.Thread(target=encode_frames, daemon=True)
+        encoder.start()
+        tmpdirname = None
+        try:
+            tmpdirname, files = self._remote.call("_animation_file_remote", *args, "png")
+            for count, (remote_filename, size) in enumerate(files):
+                chunks: List[bytes] = []
+                offset = 0
+                while offset < size:
+                    data = self._remote.call(
+                        "_read_chunk_remote", remote_filename, offset, self.STREAM_CHUNK_SIZE
+                    )
+                    if not data:  # pragma: no cover
+                        break  # pragma: no cover
+                    chunks.append(data)
+                    offset += len(data)
+                frame_queue.put(b"".join(chunks))
+                if progress:
+                    progress(count + 1, len(files))
+        finally:
+            frame_queue.put(None)
+            encoder.join()
+            if tmpdirname:
+                self._remote.call("_remove_remote", tmpdirname)
+        if errors:  # pragma: no cover
+            raise RuntimeError(f"Unable to encode the animation: {errors[0]}")  # pragma: no cover
+
     def _animation_remote(
         self,
         width: int,
@@ -432,12 +1137,68 @@ class Export:
             MPEG4 stream in bytes.
         """
 
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            tmpfilename = os.path.join(tmpdirname, str(uuid.uuid1()) + ".mp4")
+        tmpdirname, files = self._animation_file_remote(
+            width, height, passes, anim_type, start, frames, fps, options, raytrace, "mpeg4"
+        )
+        try:
+            with open(files[0][0], "rb") as fp:
+                mp4_data = fp.read()
+        finally:
+            self._remove_remote(tmpdirname)
+        return mp4_data
+
+    def _animation_file_remote(
+        self,
+        width: int,
+        height: int,
+        passes: int,
+        anim_type: int,
+        start: int,
+        frames: int,
+        fps: float,
+        options: str,
+        raytrace: bool,
+        anim_format: str = "mpeg4",
+    ) -> Tuple[str, List[Tuple[str, int]]]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        width : int
+            Width of the image in pixels.
+        height : int
+            Height of the image in pixels.
+        passes : int
+            Number of antialiasing passes.
+        anim_type : int
+            Type of animation to save.
+        start : int
+            First frame number to save.
+        frames : int
+            Number of frames to save.
+        fps : float
+            Output framerate.
+        options : str
+            MPEG4 configuration options.
+        raytrace : bool
+            Whether to render the image with the raytracing engine.
+        anim_format : str
+            ``"mpeg4"`` to save a single MPEG4 file, ``"png"`` to save one PNG file per frame.
+
+        Returns
+        -------
+        tuple
+            The temporary directory holding the saved files, to remove with
+            ``_remove_remote()``, and the list of (filename, size) of the saved files.
+        """
+        tmpdirname = tempfile.mkdtemp()
+        try:
+            extension = ".mp4" if anim_format == "mpeg4" else f".{anim_format}"
+            tmpfilename = os.path.join(tmpdirname, str(uuid.uuid1()) + extension)
             self._ensight.file.animation_rend_offscreen("ON")
             self._ensight.file.animation_screen_tiling(1, 1)
-            self._ensight.file.animation_format("mpeg4")
-            if options:
+            self._ensight.file.animation_format(anim_format)
+            if options and anim_format == "mpeg4":
                 self._ensight.file.animation_format_options(options)
             self._ensight.file.animation_frame_rate(fps)
             self._ensight.file.animation_rend_offscreen("ON")
@@ -449,7 +1210,10 @@ class Export:
             self._ensight.file.animation_window_xy(width, height)
             self._ensight.file.animation_frames(frames)
             self._ensight.file.animation_start_number(start)
-            self._ensight.file.animation_multiple_images("OFF")
+            if anim_format == "mpeg4":
+                self._ensight.file.animation_multiple_images("OFF")
+            else:
+                self._ensight.file.animation_multiple_images("ON")
             if raytrace:
                 self._ensight.file.animation_raytrace_it("ON")
             else:
@@ -480,11 +1244,13 @@ class Export:
                 self._ensight.file.animation_reset_flipbook("ON")
 
             self._ensight.file.save_animation()
-
-            with open(tmpfilename, "rb") as fp:
-                mp4_data = fp.read()
-
-        return mp4_data
+            # with multiple images, the frame number is added to the file name
+            base, extension = os.path.splitext(tmpfilename)
+            names = sorted(glob.glob(f"{base}*{extension}"))
+        except Exception:  # pragma: no cover
+            shutil.rmtree(tmpdirname, ignore_errors=True)  # pragma: no cover
+            raise  # pragma: no cover
+        return tmpdirname, [(name, os.path.getsize(name)) for name in names]
 
     GEOM_EXPORT_GLTF = "gltf2"
     GEOM_EXPORT_AVZ = "avz"
@@ -540,6 +1306,42 @@ class Export:
                     rawdata_list.append(rawdata)
         return rawdata_list
 
+    def _geometry_step_remote(  # pragma: no cover
+        self, format: str, timestep: int
+    ) -> Tuple[str, List[Tuple[str, int]]]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        format : str
+            The format to export
+        timestep: int
+            The timestep to export
+
+        Returns
+        -------
+        tuple
+            The temporary directory holding the exported files, to remove with
+            ``_remove_remote()``, and the list of (filename, size) of the exported files
+        """
+        extension = self.extension_map.get(format)
+        if not extension:
+            raise RuntimeError("The geometry export format provided is not supported.")
+        tmpdirname = tempfile.mkdtemp()
+        try:
+            self._ensight.part.select_all()
+            self._ensight.savegeom.format(format)
+            self._ensight.savegeom.begin_step(timestep)
+            self._ensight.savegeom.end_step(timestep)
+            self._ensight.savegeom.step_by(1)
+            tmpfilename = os.path.join(tmpdirname, str(uuid.uuid1()))
+            self._ensight.savegeom.save_geometric_entities(tmpfilename)
+            files = sorted(glob.glob(f"{tmpfilename}*{extension}"))
+        except Exception:
+            shutil.rmtree(tmpdirname, ignore_errors=True)
+            raise
+        return tmpdirname, [(name, os.path.getsize(name)) for name in files]
+
     def geometry(
         self,
         filename: str,
@@ -547,9 +1349,13 @@ class Export:
         starting_timestep: Optional[int] = None,
         frames: Optional[int] = 1,
         delta_timestep: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
     ) -> None:
         """Export a geometry file.
 
+        Each timestep is exported and copied to the local disk in chunks before the
+        next one is exported, see ``geometry_stream()``.
+
         Parameters
         ----------
         filename: str
@@ -562,6 +1368,8 @@ class Export:
             Number of timesteps to save. If None, defaults from the current timestep to the last
         delta_timestep: int
             The delta timestep to use when exporting
+        progress : Callable, optional
+            Called as ``progress(timesteps_done, timesteps_total)`` after each timestep.
 
         Examples
         --------
@@ -570,6 +1378,104 @@ class Export:
         >>> s.ensight.objs.ensxml_restore_file(data)
         >>> s.ensight.utils.export.geometry("local_file.glb", format=s.ensight.utils.export.GEOM_EXPORT_GLTF)
         """
+        self._remote_support_check()
+        if not self._remote.has("_geometry_step_remote"):  # pragma: no cover
+            self._geometry_single_reply(filename, format, starting_timestep, frames, delta_timestep)
+            return
+        for _ in self.geometry_stream(
+            filename,
+            format=format,
+            starting_timestep=starting_timestep,
+            frames=frames,
+            delta_timestep=delta_timestep,
+            progress=progress,
+        ):
+            pass
+
+    def geometry_stream(
+        self,
+        filename: str,
+        format: str = GEOM_EXPORT_GLTF,
+        starting_timestep: Optional[int] = None,
+        frames: Optional[int] = 1,
+        delta_timestep: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[str]:
+        """Export geometry files, one timestep at a time.
+
+        Each timestep is exported and copied to the local file in chunks before
+        the next timestep is exported, so the exported files can be consumed while
+        the export is in progress. The parameters are the same as for ``geometry()``.
+
+        Parameters
+        ----------
+        filename: str
+            The location where to export the geometry
+        format : str
+            The format to export
+        starting_timestep: int
+            The first timestep to export. If None, defaults to the current timestep
+        frames: int
+            Number of timesteps to save. If None, defaults from the current timestep to the last
+        delta_timestep: int
+            The delta timestep to use when exporting
+        progress : Callable, optional
+            Called as ``progress(timesteps_done, timesteps_total)`` after each timestep.
+
+        Returns
+        -------
+        Iterator[str]
+            The names of the local files, as soon as each one is complete.
+
+        Examples
+        --------
+        >>> export = s.ensight.utils.export
+        >>> for name in export.geometry_stream("local_file.glb", frames=-1):
+        >>>     print(f"{name} is ready")
+        """
+        if starting_timestep is None:
+            starting_timestep = int(self._ensight.objs.core.TIMESTEP)
+        if frames is None or frames == -1:
+            # Timesteps are 0-indexed so frames need to be increased of 1
+            frames = int(self._ensight.objs.core.TIMESTEP_LIMITS[1]) + 1
+        if not delta_timestep:
+            delta_timestep = 1
+        self._remote_support_check()
+        if not isinstance(self._ensight, ModuleType):
+            self._ensight._session.ensight_version_check("2024 R2")
+        timesteps = list(range(starting_timestep, starting_timestep + frames, delta_timestep))
+        filename_base, extension = os.path.splitext(filename)
+        index = 0
+        for count, timestep in enumerate(timesteps):
+            tmpdirname, files = self._remote.call("_geometry_step_remote", format, timestep)
+            try:
+                for remote_filename, size in files:
+                    _filename = filename
+                    if len(timesteps) > 1 or len(files) > 1:
+                        _filename = f"{filename_base}{str(index).zfill(3)}{extension}"
+                    self._stream_file(remote_filename, size, _filename)
+                    index += 1
+                    yield _filename
+            finally:
+                self._remote.call("_remove_remote", tmpdirname)
+            if progress:
+                progress(count + 1, len(timesteps))
+        if index == 0:  # pragma: no cover
+            raise IOError("Export was not successful")  # pragma: no cover
+
+    def _geometry_single_reply(  # pragma: no cover
+        self,
+        filename: str,
+        format: str,
+        starting_timestep: Optional[int],
+        frames: Optional[int],
+        delta_timestep: Optional[int],
+    ) -> None:
+        """Export the geometry files of all the timesteps with a single command.
+
+        This is used with EnSight sessions that do not provide ``_geometry_step_remote()``.
+        The parameters are the same as for ``geometry()``.
+        """
         if starting_timestep is None:
             starting_timestep = int(self._ensight.objs.core.TIMESTEP)
         if frames is None or frames == -1:
@@ -38,8 +38,13 @@ Example for selecting all 3D parts:
 
 """
 
+import base64
+import bisect
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+from ansys.pyensight.core.utils.support import RemoteMethods
+import numpy
 
 try:
     import ensight
@@ -78,6 +83,58 @@ def convert_variable(
     return None  # pragma: no cover
 
 
+class _PartIndex:
+    """Lookup tables of the parts of an EnSight session.
+
+    The index is empty until it is first updated.
+    """
+
+    def __init__(self) -> None:
+        self.rows: Dict[int, Tuple["ENS_PART", int, str, Dict[str, Any]]] = {}
+        self.by_id: Dict[int, List["ENS_PART"]] = {}
+        self.by_name: Dict[str, List["ENS_PART"]] = {}
+        self.by_tag: Dict[str, Dict[Any, List["ENS_PART"]]] = {}
+
+    def update(
+        self,
+        rows: List[Tuple["ENS_PART", int, str, Dict[str, Any]]],
+        order: Optional[List[int]] = None,
+    ) -> None:
+        """Add or replace some rows and rebuild the lookup tables.
+
+        Parameters
+        ----------
+        rows : list
+            ``(part, partnumber, description, metadata)`` tuples of the new and
+            changed parts.
+        order : list, optional
+            Object ids of all the parts, in the order of ``ensight.objs.core.PARTS``.
+            The parts not in this list are removed. The default is ``None``, in
+            which case the list of parts did not change.
+        """
+        for row in rows:
+            self.rows[row[0].__OBJID__] = row
+        if order is not None:
+            self.rows = {objid: self.rows[objid] for objid in order if objid in self.rows}
+        self.by_id = {}
+        self.by_name = {}
+        self.by_tag = {}
+        for part, partnumber, description, metadata in self.rows.values():
+            self.by_id.setdefault(partnumber, []).append(part)
+            self.by_name.setdefault(description, []).append(part)
+            for tag, value in metadata.items():
+                values = self.by_tag.setdefault(tag, {})
+                try:
+                    values.setdefault(value, []).append(part)
+                except TypeError:  # pragma: no cover
+                    values.setdefault(repr(value), []).append(part)  # pragma: no cover
+
+    @property
+    def parts(self) -> List["ENS_PART"]:
+        """All the parts, in the order of ``ensight.objs.core.PARTS``."""
+        return [row[0] for row in self.rows.values()]
+
+
 class Parts:
     """Controls the parts in the current EnSight ``Session`` instance."""
 
@@ -163,8 +220,179 @@ class Parts:
             self.NUM_POINTS = num_points
             self.DISTRIB_TYPE = part_kind
 
+    # number of part changes EnSight keeps for the incremental index updates
+    PART_CHANGE_LOG_SIZE = 10000
+
     def __init__(self, ensight: Union["ensight_api.ensight", "ensight"]):
         self.ensight = ensight
+        self._remote = RemoteMethods(ensight, "parts", self)
+        self._index = _PartIndex()
+        # change generation the index is up to date with, -1 to fetch all the parts
+        self._index_generation = -1
+        # EnSight side: (generation, objid) log of the part changes, filled by the
+        # callbacks registered by _watch_parts(). None until they are registered.
+        self._change_log: Optional[List[Tuple[int, int]]] = None
+        self._generation = 0
+        # oldest generation the log still has all the changes since
+        self._log_start = 0
+        self._part_objids: Set[int] = set()
+
+    @staticmethod
+    def _part_row(part: "ENS_PART") -> Tuple["ENS_PART", int, str, Dict[str, Any]]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        part : ENS_PART
+            The part to describe.
+
+        Returns
+        -------
+        tuple
+            The ``(part, partnumber, description, metadata)`` row of the part.
+        """
+        try:
+            metadata = dict(part.METADATA)
+        except Exception:  # pragma: no cover
+            metadata = {}  # pragma: no cover
+        return part, int(part.PARTNUMBER), str(part.DESCRIPTION), metadata
+
+    def _part_rows_remote(
+        self, objids: Optional[List[int]] = None
+    ) -> List[Tuple["ENS_PART", int, str, Dict[str, Any]]]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        objids : list, optional
+            Object ids of the parts to return. The default is ``None``, in which
+            case all the parts are returned.
+
+        Returns
+        -------
+        list
+            ``(part, partnumber, description, metadata)`` tuples.
+        """
+        if objids is None:
+            return [self._part_row(part) for part in self.ensight.objs.core.PARTS]
+        return [self._part_row(self.ensight.objs.wrap_id(objid)) for objid in objids]
+
+    def _watch_parts(self) -> bool:
+        """EnSight-side implementation.
+
+        Register the callbacks that log the part changes for ``_part_changes_remote()``.
+        The callbacks run inside EnSight, so they do not send any event to the clients.
+
+        Returns
+        -------
+        bool
+            ``True`` if the part changes are logged.
+        """
+        try:
+            self._part_objids = {part.__OBJID__ for part in self.ensight.objs.core.PARTS}
+            self.ensight.objs.addcallback(
+                self.ensight.objs.core, None, self._on_parts_changed, attrs=["PARTS"]
+            )
+            self.ensight.objs.addcallback(
+                self.ensight.objs.ENS_PART,
+                None,
+                self._on_part_changed,
+                attrs=["PARTNUMBER", "DESCRIPTION", "METADATA"],
+            )
+        except Exception:  # pragma: no cover
+            return False  # pragma: no cover
+        self._change_log = []
+        self._log_start = self._generation
+        return True
+
+    def _log_part_change(self, objid: int) -> None:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        objid : int
+            Object id of the part that changed, ``-1`` if the list of parts changed.
+        """
+        if self._change_log is None:  # pragma: no cover
+            return  # pragma: no cover
+        self._generation += 1
+        self._change_log.append((self._generation, objid))
+        if len(self._change_log) > self.PART_CHANGE_LOG_SIZE:
+            del self._change_log[: len(self._change_log) // 2]
+            self._log_start = self._change_log[0][0] - 1
+
+    def _on_parts_changed(self, target: Any, attr: Any) -> None:
+        """EnSight-side callback for the changes of ``ensight.objs.core.PARTS``."""
+        objids = {part.__OBJID__ for part in self.ensight.objs.core.PARTS}
+        for objid in objids - self._part_objids:
+            self._log_part_change(objid)
+        self._part_objids = objids
+        self._log_part_change(-1)
+
+    def _on_part_changed(self, target: "ENS_PART", attr: Any) -> None:
+        """EnSight-side callback for the changes of the id, name and metadata of a part."""
+        self._log_part_change(target.__OBJID__)
+
+    def _part_changes_remote(
+        self, generation: int
+    ) -> Tuple[int, Optional[List[int]], List[Tuple["ENS_PART", int, str, Dict[str, Any]]]]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        generation : int
+            Change generation the index of the caller is up to date with, ``-1``
+            if it is empty.
+
+        Returns
+        -------
+        tuple
+            The current generation, the object ids of all the parts in the order of
+            ``ensight.objs.core.PARTS`` or ``None`` if the list of parts did not
+            change, and the rows of the parts that are new or changed since
+            ``generation``. The generation is ``-1`` if the changes are not logged,
+            in which case all the parts are returned.
+        """
+        if self._change_log is None and not self._watch_parts():
+            rows = self._part_rows_remote()  # pragma: no cover
+            return -1, [row[0].__OBJID__ for row in rows], rows  # pragma: no cover
+        if generation < self._log_start or generation > self._generation:
+            rows = self._part_rows_remote()
+            return self._generation, [row[0].__OBJID__ for row in rows], rows
+        log = self._change_log or []
+        changed = {objid for _, objid in log[bisect.bisect_right(log, (generation + 1, -2)) :]}
+        order = None
+        if -1 in changed:
+            changed.discard(-1)
+            order = [part.__OBJID__ for part in self.ensight.objs.core.PARTS]
+        objids = [objid for objid in changed if objid in self._part_objids]
+        return self._generation, order, self._part_rows_remote(objids)
+
+    def _part_index(self) -> _PartIndex:
+        """Return the index of the parts, bringing it up to date first.
+
+        EnSight logs the changes of the list of parts and of the id, name and
+        metadata of every part under an increasing generation, so each call costs
+        a single request and only the new or changed parts are sent back.
+
+        Returns
+        -------
+        _PartIndex
+            The index of the parts.
+        """
+        if not self._remote.has("_part_changes_remote"):  # pragma: no cover
+            rows = self._remote.call("_part_rows_remote")  # pragma: no cover
+            self._index = _PartIndex()  # pragma: no cover
+            self._index.update(rows)  # pragma: no cover
+            return self._index  # pragma: no cover
+        generation, order, rows = self._remote.call("_part_changes_remote", self._index_generation)
+        if generation < 0 or self._index_generation < 0:
+            # not an incremental update
+            self._index = _PartIndex()
+        if order is not None or rows:
+            self._index.update(rows, order)
+        self._index_generation = generation
+        return self._index
 
     def select_parts_by_dimension(self, dimension: int) -> ensobjlist["ENS_PART"]:
         """Select parts by the input dimension and return the parts found.
@@ -203,53 +431,119 @@ class Parts:
         self,
         tag: Optional[str] = None,
         value: Optional[str] = None,
-        tagdict: Optional[Dict[str, str]] = None,
+        tagdict: Optional[Union[Dict[str, Optional[str]], List[Dict[str, Optional[str]]]]] = None,
     ) -> ensobjlist["ENS_PART"]:
         """Select parts by the input dimension and return the parts found.
 
+        The metadata of the parts is matched by EnSight, and only the matching
+        parts are returned.
+
         Parameters
         ----------
         tag : str, optional
             Tag for finding the parts.
         value : str, optional
             Value for finding the parts.
-        tagdict : dict, optional
+        tagdict : dict, list, optional
             Dictionary containing the key and value pairs for finding
             the parts. Only the parts that have all the keys and corresponding
-            values are returned. If a value for this parameter is supplied, it
-            takes precedence over the values supplied for the ``tag`` and
-            ``value`` parameters.
+            values are returned. A value of ``None`` matches any value of the key.
+            A list of such dictionaries returns the parts that match any of them.
+            If a value for this parameter is supplied, it takes precedence over
+            the values supplied for the ``tag`` and ``value`` parameters.
 
         Returns
         -------
         ensobjlist["ENS_PART"]
             List of parts found. If no arguments are given, all parts are returned.
 
+        Examples
+        --------
+        Select the parts that are walls of the "fluid" zone or that are inlets.
+
+        >>> s = LocalLauncher().start()
+        >>> parts = s.ensight.utils.parts
+        >>> parts.select_parts_by_tag(tagdict=[{"zone": "fluid", "type": "wall"}, {"type": "inlet"}])
+
         """
-        parts = self.ensight.objs.core.PARTS
-        metadata = {p: p.METADATA for p in parts}
-        found = ensobjlist()
         if not tag and not value and not tagdict:
             self.ensight.part.select_all()
-            return parts
+            return self.ensight.objs.core.PARTS
+        conditions: List[List[Tuple[Optional[str], Optional[str]]]]
         if not tagdict:
-            if tag and value:
-                found = ensobjlist([p for p, met in metadata.items() if met.get(tag) == value])
-            elif value and not tag:
-                found = ensobjlist([p for p, met in metadata.items() if value in met.values()])
-            elif tag and not value:  # pragma: no cover
-                found = ensobjlist([p for p, met in metadata.items() if tag in met.keys()])
+            conditions = [[(tag, value)]]
+        elif isinstance(tagdict, dict):
+            conditions = [list(tagdict.items())]
         else:
-            found = ensobjlist(
-                [
-                    p
-                    for p, met in metadata.items()
-                    if all(met.get(k) == v for k, v in tagdict.items())
-                ]
-            )
+            conditions = [list(d.items()) for d in tagdict]
+        if self._remote.has("_select_parts_by_tag_remote"):
+            return ensobjlist(self._remote.call("_select_parts_by_tag_remote", conditions))
+        rows = self._part_index().rows.values()  # pragma: no cover
+        found = ensobjlist(
+            [row[0] for row in rows if self._match_metadata(row[3], conditions)]
+        )  # pragma: no cover
+        if found:  # pragma: no cover
+            found.set_attr("SELECTED", True)  # pragma: no cover
+        return found  # pragma: no cover
+
+    @staticmethod
+    def _match_metadata(
+        metadata: Dict[str, Any], conditions: List[List[Tuple[Optional[str], Optional[str]]]]
+    ) -> bool:
+        """Check the metadata of a part against a list of conditions.
+
+        Parameters
+        ----------
+        metadata : dict
+            The metadata of the part.
+        conditions : list
+            Lists of ``(tag, value)`` pairs. The metadata matches if all the pairs of
+            any of the lists match. A ``None`` tag matches any tag, and a ``None``
+            value matches any value.
+
+        Returns
+        -------
+        bool
+            ``True`` if the metadata matches.
+        """
+        for condition in conditions:
+            for tag, value in condition:
+                if tag is None:
+                    if value not in metadata.values():
+                        break
+                elif tag not in metadata:
+                    break
+                elif value is not None and metadata[tag] != value:
+                    break
+            else:
+                return True
+        return False
+
+    def _select_parts_by_tag_remote(
+        self, conditions: List[List[Tuple[Optional[str], Optional[str]]]]
+    ) -> List["ENS_PART"]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        conditions : list
+            The conditions, as described for the ``_match_metadata()`` method.
+
+        Returns
+        -------
+        list
+            The parts that match the conditions. They are also selected.
+        """
+        found = ensobjlist(
+            [
+                p
+                for p in self.ensight.objs.core.PARTS
+                if self._match_metadata(p.METADATA, conditions)
+            ]
+        )
         if found:
             found.set_attr("SELECTED", True)
-        return found
+        return list(found)
 
     _EMIT_POINT: int = 0
     _EMIT_LINE: int = 1
@@ -348,6 +642,136 @@ class Parts:
             )  # pragma: no cover
         return new_emitters
 
+    _EMITTER_SHAPES: Dict[int, Tuple[int, ...]] = {0: (3,), 1: (2, 3), 2: (3, 3)}
+
+    def _add_emitters_bulk(
+        self,
+        particle_trace_part: "ENS_PART_PARTICLE_TRACE",
+        emitter_type: int,
+        coords: Any,
+        num_points: Optional[int] = 100,
+        num_points_x: Optional[int] = 25,
+        num_points_y: Optional[int] = 25,
+        palette: Optional[str] = None,
+        clean: Optional[bool] = False,
+    ) -> "ENS_PART_PARTICLE_TRACE":
+        """Private utility to add many point, line or plane emitters with a single request.
+
+        The coordinates are sent to EnSight as one base64 encoded buffer of doubles
+        and all the emitters are created there.
+
+        Parameters
+        ----------
+        particle_trace_part : ENS_PART_PARTICLE_TRACE
+            The particle trace part to add the emitters to.
+        emitter_type : int
+            One of ``_EMIT_POINT``, ``_EMIT_LINE`` or ``_EMIT_PLANE``.
+        coords : Any
+            Array-like of shape (N,3) for points, (N,2,3) for lines and
+            (N,3,3) for planes.
+        num_points : int, optional
+            The number of seed points of each line.
+        num_points_x : int, optional
+            The number of points on the ``X`` direction of each plane.
+        num_points_y : int, optional
+            The number of points on the ``Y`` direction of each plane.
+        palette : str, optional
+            The palette to color the particle trace part by.
+        clean : bool, optional
+            Whether to replace the existing emitters of the particle trace part.
+        """
+        shape = self._EMITTER_SHAPES[emitter_type]
+        array = numpy.ascontiguousarray(coords, dtype="<f8")
+        if array.ndim == len(shape):
+            array = array.reshape((1,) + shape)
+        if array.shape[1:] != shape or not array.shape[0]:
+            raise RuntimeError(
+                f"Emitter coordinates must have shape (N, {', '.join(str(n) for n in shape)})"
+            )
+        if self._remote.has("_add_emitters_remote"):
+            payload = dict(
+                shape=list(array.shape), data=base64.b64encode(array.tobytes()).decode("ascii")
+            )
+            options = dict(
+                num_points=num_points, num_points_x=num_points_x, num_points_y=num_points_y
+            )
+            self._remote.call(
+                "_add_emitters_remote", particle_trace_part, emitter_type, payload, options, clean
+            )
+            if palette:
+                particle_trace_part.COLORBYPALETTE = palette
+            return particle_trace_part
+        # older EnSight: one emitter constructor for each point, line or plane
+        new_emitters: List[Any] = []  # pragma: no cover
+        for item in array.tolist():  # pragma: no cover
+            if emitter_type == self._EMIT_POINT:  # pragma: no cover
+                new_emitters.extend(self._create_emitters(emitter_type, points=[item]))
+            else:  # pragma: no cover
+                new_emitters.extend(
+                    self._create_emitters(
+                        emitter_type,
+                        point1=item[0],
+                        point2=item[1],
+                        point3=item[2] if len(item) > 2 else None,
+                        num_points=num_points,
+                        num_points_x=num_points_x,
+                        num_points_y=num_points_y,
+                    )
+                )
+        return self._add_emitters_to_particle_trace_part(
+            particle_trace_part, new_emitters, palette=palette, clean=clean
+        )  # pragma: no cover
+
+    def _add_emitters_remote(
+        self,
+        particle_trace_part: "ENS_PART_PARTICLE_TRACE",
+        emitter_type: int,
+        payload: Dict[str, Any],
+        options: Dict[str, Any],
+        clean: Optional[bool] = False,
+    ) -> None:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        particle_trace_part : ENS_PART_PARTICLE_TRACE
+            The particle trace part to add the emitters to.
+        emitter_type : int
+            One of ``_EMIT_POINT``, ``_EMIT_LINE`` or ``_EMIT_PLANE``.
+        payload : dict
+            The shape of the coordinates array and its base64 encoded doubles.
+        options : dict
+            The ``num_points``, ``num_points_x`` and ``num_points_y`` values.
+        clean : bool, optional
+            Whether to replace the existing emitters of the particle trace part.
+        """
+        coords = numpy.frombuffer(base64.b64decode(payload["data"]), dtype="<f8")
+        coords = coords.reshape(payload["shape"]).tolist()
+        if emitter_type == self._EMIT_POINT:
+            new_emitters = [self._EnSEmitterPoint(self.ensight, point1=p) for p in coords]
+        elif emitter_type == self._EMIT_LINE:
+            new_emitters = [
+                self._EnSEmitterLine(
+                    self.ensight, point1=p1, point2=p2, num_points=options["num_points"]
+                )
+                for p1, p2 in coords
+            ]
+        else:
+            new_emitters = [
+                self._EnSEmitterGrid(
+                    self.ensight,
+                    point1=p1,
+                    point2=p2,
+                    point3=p3,
+                    num_points_x=options["num_points_x"],
+                    num_points_y=options["num_points_y"],
+                )
+                for p1, p2, p3 in coords
+            ]
+        emitters = [] if clean else particle_trace_part.EMITTERS.copy()
+        emitters.extend(new_emitters)
+        particle_trace_part.EMITTERS = emitters
+
     def _create_particle_trace_part(
         self,
         name: str,
@@ -494,7 +918,7 @@ class Parts:
         self,
         name: str,
         variable: Union[str, int, "ENS_VAR"],
-        points: List[List[float]],
+        points: Union[List[List[float]], "numpy.ndarray"],
         direction: Optional[str] = None,
         pathlines: Optional[bool] = False,
         source_parts: Optional[List[Union[str, int, "ENS_PART"]]] = None,
@@ -531,7 +955,8 @@ class Parts:
         pathlines: bool
             True if the particle traces need to be pathlines
         points: list
-            List of coordinates for the seed points.
+            List of coordinates for the seed points, or a numpy array of shape (N,3).
+            All the emitters are created with a single request.
         source_parts: list
             A list of parts to create the particle trace in. For instance, in a CFD
             simulation this might be the fluid zone.
@@ -571,10 +996,9 @@ class Parts:
             delta_time=delta_time,
             total_time=total_time,
         )
-        new_emitters = self._create_emitters(emitter_type=emitter_type, points=points)
         palette = self._find_palette(color_by=color_by)
-        return self._add_emitters_to_particle_trace_part(
-            particle_trace_part, new_emitters=new_emitters, palette=palette, clean=True
+        return self._add_emitters_bulk(
+            particle_trace_part, emitter_type, points, palette=palette, clean=True
         )
 
     def create_particle_trace_from_line(
@@ -665,12 +1089,14 @@ class Parts:
             delta_time=delta_time,
             total_time=total_time,
         )
-        new_emitters = self._create_emitters(
-            emitter_type=emitter_type, point1=point1, point2=point2, num_points=num_points
-        )
         palette = self._find_palette(color_by=color_by)
-        return self._add_emitters_to_particle_trace_part(
-            particle_trace_part, new_emitters=new_emitters, palette=palette, clean=True
+        return self._add_emitters_bulk(
+            particle_trace_part,
+            emitter_type,
+            [point1, point2],
+            num_points=num_points,
+            palette=palette,
+            clean=True,
         )
 
     def create_particle_trace_from_plane(
@@ -769,17 +1195,15 @@ class Parts:
             delta_time=delta_time,
             total_time=total_time,
         )
-        new_emitters = self._create_emitters(
-            emitter_type=emitter_type,
-            point1=point1,
-            point2=point2,
-            point3=point3,
+        palette = self._find_palette(color_by=color_by)
+        return self._add_emitters_bulk(
+            particle_trace_part,
+            emitter_type,
+            [point1, point2, point3],
             num_points_x=num_points_x,
             num_points_y=num_points_y,
-        )
-        palette = self._find_palette(color_by=color_by)
-        return self._add_emitters_to_particle_trace_part(
-            particle_trace_part, new_emitters=new_emitters, palette=palette, clean=True
+            palette=palette,
+            clean=True,
         )
 
     def create_particle_trace_from_parts(
@@ -903,7 +1327,7 @@ class Parts:
     def add_emitter_points_to_particle_trace_part(
         self,
         particle_trace_part: Union[str, int, "ENS_PART"],
-        points: List[List[float]],
+        points: Union[List[List[float]], "numpy.ndarray"],
     ) -> "ENS_PART_PARTICLE_TRACE":
         """
         Add point emitters to an existing particle trace. The function will return the updated
@@ -916,7 +1340,8 @@ class Parts:
             The particle trace part to be added emitters to.
             Can be the name, the ID or the ``ENS_PART`` object
         points: list
-            List of list containing the coordinates for the seed points.
+            List of list containing the coordinates for the seed points, or a
+            numpy array of shape (N,3). All the emitters are created with a single request.
 
         Examples
         --------
@@ -929,8 +1354,7 @@ class Parts:
         """
         emitter_type = self._EMIT_POINT
         particle_trace_part = self._cure_particle_trace_part(particle_trace_part)
-        new_emitters = self._create_emitters(emitter_type=emitter_type, points=points)
-        return self._add_emitters_to_particle_trace_part(particle_trace_part, new_emitters)
+        return self._add_emitters_bulk(particle_trace_part, emitter_type, points)
 
     def add_emitter_line_to_particle_trace_part(
         self,
@@ -967,10 +1391,9 @@ class Parts:
         """
         emitter_type = self._EMIT_LINE
         particle_trace_part = self._cure_particle_trace_part(particle_trace_part)
-        new_emitters = self._create_emitters(
-            emitter_type=emitter_type, point1=point1, point2=point2, num_points=num_points
+        return self._add_emitters_bulk(
+            particle_trace_part, emitter_type, [point1, point2], num_points=num_points
         )
-        return self._add_emitters_to_particle_trace_part(particle_trace_part, new_emitters)
 
     def add_emitter_plane_to_particle_trace_part(
         self,
@@ -1015,15 +1438,100 @@ class Parts:
         """
         emitter_type = self._EMIT_PLANE
         particle_trace_part = self._cure_particle_trace_part(particle_trace_part)
-        new_emitters = self._create_emitters(
-            emitter_type=emitter_type,
-            point1=point1,
-            point2=point2,
-            point3=point3,
+        return self._add_emitters_bulk(
+            particle_trace_part,
+            emitter_type,
+            [point1, point2, point3],
+            num_points_x=num_points_x,
+            num_points_y=num_points_y,
+        )
+
+    def add_emitter_lines_to_particle_trace_part(
+        self,
+        particle_trace_part: Union[str, int, "ENS_PART"],
+        lines: Union[List[List[List[float]]], "numpy.ndarray"],
+        num_points: Optional[int] = 100,
+    ) -> "ENS_PART_PARTICLE_TRACE":
+        """
+        Add several line emitters to an existing particle trace with a single request.
+        The function will return the updated ``ENS_PART`` object.
+
+        Parameters
+        ----------
+
+        particle_trace_part:
+            The particle trace part to be added emitters to.
+            Can be the name, the ID or the ``ENS_PART`` object.
+        lines: list
+            The coordinates of the two points of each line, as a list or a
+            numpy array of shape (N,2,3).
+        num_points: int
+            The number of seed points of each line. Defaults to 100.
+
+        Examples
+        --------
+        >>> s = LocalLauncher().start()
+        >>> cas_file = s.download_pyansys_example("mixing_elbow.cas.h5","pyfluent/mixing_elbow")
+        >>> dat_file = s.download_pyansys_example("mixing_elbow.dat.h5","pyfluent/mixing_elbow")
+        >>> s.load_data(cas_file, result_file=dat_file)
+        >>> p = s.ensight.utils.parts.create_particle_trace_from_points("mytraces", "Velocity", points=[[-0.02,-0.123,0.01576]], source_parts=parts.select_parts_by_dimension(3))
+        >>> lines = numpy.zeros((10, 2, 3))
+        >>> lines[:, 0] = [-0.02, -0.123, 0.01576]
+        >>> lines[:, 1, 0] = numpy.linspace(0.0, 0.1, 10)
+        >>> p = s.ensight.utils.parts.add_emitter_lines_to_particle_trace_part(p, lines, num_points=10)
+        """
+        emitter_type = self._EMIT_LINE
+        particle_trace_part = self._cure_particle_trace_part(particle_trace_part)
+        return self._add_emitters_bulk(
+            particle_trace_part, emitter_type, lines, num_points=num_points
+        )
+
+    def add_emitter_planes_to_particle_trace_part(
+        self,
+        particle_trace_part: Union[str, int, "ENS_PART"],
+        planes: Union[List[List[List[float]]], "numpy.ndarray"],
+        num_points_x: Optional[int] = 25,
+        num_points_y: Optional[int] = 25,
+    ) -> "ENS_PART_PARTICLE_TRACE":
+        """
+        Add several plane emitters to an existing particle trace with a single request.
+        The function will return the updated ``ENS_PART`` object.
+
+        Parameters
+        ----------
+
+        particle_trace_part:
+            The particle trace part to be added emitters to.
+            Can be the name, the ID or the ``ENS_PART`` object.
+        planes: list
+            The coordinates of three corners of each plane, as a list or a
+            numpy array of shape (N,3,3).
+        num_points_x: int
+            The number of points on the ``X`` direction of each emission plane.
+            Defaults to 25.
+        num_points_y: int
+            The number of points on the ``Y`` direction of each emission plane.
+            Defaults to 25.
+
+        Examples
+        --------
+        >>> s = LocalLauncher().start()
+        >>> cas_file = s.download_pyansys_example("mixing_elbow.cas.h5","pyfluent/mixing_elbow")
+        >>> dat_file = s.download_pyansys_example("mixing_elbow.dat.h5","pyfluent/mixing_elbow")
+        >>> s.load_data(cas_file, result_file=dat_file)
+        >>> p = s.ensight.utils.parts.create_particle_trace_from_points("mytraces", "Velocity", points=[[-0.02,-0.123,0.01576]], source_parts=parts.select_parts_by_dimension(3))
+        >>> planes = [[[-0.02, -0.123, 0.01576], [0.109876, -0.123, 0.0123], [0.1, 0, 0.05]], [[-0.02, -0.1, 0.01576], [0.109876, -0.1, 0.0123], [0.1, 0, 0.05]]]
+        >>> p = s.ensight.utils.parts.add_emitter_planes_to_particle_trace_part(p, planes, num_points_x=10, num_points_y=10)
+        """
+        emitter_type = self._EMIT_PLANE
+        particle_trace_part = self._cure_particle_trace_part(particle_trace_part)
+        return self._add_emitters_bulk(
+            particle_trace_part,
+            emitter_type,
+            planes,
             num_points_x=num_points_x,
             num_points_y=num_points_y,
         )
-        return self._add_emitters_to_particle_trace_part(particle_trace_part, new_emitters)
 
     def add_emitter_parts_to_particle_trace_part(
         self,
@@ -1161,8 +1669,10 @@ class Parts:
         # so I need to check its value now
         if not ret_flag:
             return None
+        indexed = False
         if not plist:
-            plist = [p for p in self.ensight.objs.core.PARTS]
+            plist = self._part_index().parts
+            indexed = True
         pobj_list: List["ENS_PART"] = []
         #
         #  Basically figure out what plist is, then convert it to a list of ENS_PARTs
@@ -1189,34 +1699,34 @@ class Parts:
             error = "First member is neither ENS_PART, int, nor string"  # pragma: no cover
             error += f"{p_list[0]} type = {type(p_list[0])}; aborting"  # pragma: no cover
             raise RuntimeError(error)  # pragma: no cover
-        pobjs: List["ENS_PART"]
+        if isinstance(p_list[0], (int, str)) and not indexed:
+            self._part_index()
+            indexed = True
+        index = self._index
         if isinstance(p_list[0], int):
             # list of ints must be part ids
             for pid in p_list:
-                pobjs = [p for p in self.ensight.objs.core.PARTS if p.PARTNUMBER == pid]
-                for prt in pobjs:
-                    pobj_list.append(prt)
+                pobj_list.extend(index.by_id.get(int(pid), []))
         elif isinstance(p_list[0], str):
             if not p_list[0].isdigit():
                 for pname in p_list:
-                    pobjs = [p for p in self.ensight.objs.core.PARTS if p.DESCRIPTION == pname]
-                    for prt in pobjs:
-                        pobj_list.append(prt)
+                    pobj_list.extend(index.by_name.get(str(pname), []))
             else:  # digits, must be a string list of part ids?
                 for pid_str in p_list:
-                    pobjs = [
-                        p for p in self.ensight.objs.core.PARTS if p.PARTNUMBER == int(pid_str)
-                    ]
-                    for prt in pobjs:
-                        pobj_list.append(prt)
+                    pobj_list.extend(index.by_id.get(int(pid_str), []))
         else:
             for prt in p_list:
                 pobj_list.append(prt)
-        if ret_flag == "name":
-            val_strings = [str(p.DESCRIPTION) for p in pobj_list]
-            return val_strings
         if ret_flag == "obj":
             val_objs = [p for p in pobj_list]
             return val_objs
-        val_ints = [int(p.PARTNUMBER) for p in pobj_list]
+        if indexed:
+            rows = [index.rows[p.__OBJID__] for p in pobj_list]
+        else:
+            # ENS_PART input: fetch the attributes of just these parts
+            rows = self._remote.call("_part_rows_remote", [p.__OBJID__ for p in pobj_list])
+        if ret_flag == "name":
+            val_strings = [row[2] for row in rows]
+            return val_strings
+        val_ints = [row[1] for row in rows]
         return val_ints
@@ -20,7 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from ansys.pyensight.core.utils.support import RemoteMethods
+import numpy
 
 if TYPE_CHECKING:
     try:
@@ -53,6 +56,9 @@ class Query:
 
     def __init__(self, interface: Union["ensight_api.ensight", "ensight"]):
         self._ensight = interface
+        self._remote = RemoteMethods(interface, "query", self)
+        # Variable names, cached while creating a batch of queries
+        self._variable_names: Optional[List[str]] = None
 
     DISTANCE_PART1D: str = "1d_part"
     DISTANCE_LINE: str = "line_tool"
@@ -395,11 +401,126 @@ class Query:
             query.addtoplot(plot)
         return query
 
+    def create_queries(self, specs: List[Dict[str, Any]]) -> List["ENS_QUERY"]:
+        """Create several distance and temporal queries with a single request.
+
+        Each spec is a dictionary with the keyword arguments of ``create_distance()``
+        or ``create_temporal()``. The method is selected from the ``query_type`` value.
+
+        Parameters
+        ----------
+        specs : list[dict]
+            The query specifications. Each one must include at least
+            the ``name``, ``query_type``, ``part_list`` and ``variable1`` keys.
+
+        Returns
+        -------
+        list[ENS_QUERY]
+            The ``ENS_QUERY`` instances, in the order of the specs. An exception is
+            raised if any of the queries cannot be created.
+
+        Examples
+        --------
+        >>> s = LocalLauncher().start()
+        >>> s.load_data(f"{s.cei_home}/ensight{s.cei_suffix}/data/cube/cube.case")
+        >>> parts = s.ensight.objs.core.PARTS["Computational mesh"]
+        >>> specs = [
+        >>>     dict(name=f"Line {z}", query_type=s.ensight.utils.query.DISTANCE_LINE,
+        >>>          part_list=parts, variable1="temperature",
+        >>>          point1=[-1.0, 0.5, z], point2=[2.0, 0.5, z])
+        >>>     for z in numpy.linspace(0.0, 1.0, 100)
+        >>> ]
+        >>> queries = s.ensight.utils.query.create_queries(specs)
+        >>> data = s.ensight.utils.query.get_query_data(queries)
+
+        """
+        distance_types = [self.DISTANCE_PART1D, self.DISTANCE_LINE, self.DISTANCE_SPLINE]
+        temporal_types = [
+            self.TEMPORAL_NODE,
+            self.TEMPORAL_ELEMENT,
+            self.TEMPORAL_IJK,
+            self.TEMPORAL_XYZ,
+            self.TEMPORAL_MINIMUM,
+            self.TEMPORAL_MAXIMUM,
+        ]
+        for spec in specs:
+            if spec.get("query_type") not in distance_types + temporal_types:
+                raise RuntimeError(f"Invalid query type: {spec.get('query_type')} specified.")
+        return self._remote.call("_create_queries_remote", specs)
+
+    def _create_queries_remote(self, specs: List[Dict[str, Any]]) -> List["ENS_QUERY"]:
+        """Create the queries described by the input specs.
+
+        This method is meant to run in the EnSight interpreter, so that all the
+        ``query_ent_var`` commands for all the queries cost a single round trip.
+
+        Parameters
+        ----------
+        specs : list[dict]
+            The query specifications, see ``create_queries()``.
+
+        Returns
+        -------
+        list[ENS_QUERY]
+            The ``ENS_QUERY`` instances, in the order of the specs.
+
+        """
+        distance_types = [self.DISTANCE_PART1D, self.DISTANCE_LINE, self.DISTANCE_SPLINE]
+        queries = []
+        self._variable_names = self._ensight.objs.core.VARIABLES.get_attr("DESCRIPTION")
+        try:
+            for spec in specs:
+                if spec["query_type"] in distance_types:
+                    queries.append(self.create_distance(**spec))
+                else:
+                    queries.append(self.create_temporal(**spec))
+        finally:
+            self._variable_names = None
+        return queries
+
+    def get_query_data(self, queries: List["ENS_QUERY"]) -> List[numpy.ndarray]:
+        """Get the data of several queries with a single request.
+
+        Parameters
+        ----------
+        queries : list[ENS_QUERY]
+            The queries to get the data of.
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            For each query, the ``QUERY_DATA["xydata"]`` values as an
+            array of shape (samples, 2).
+
+        """
+        xydata = self._remote.call("_get_query_data_remote", queries)
+        return [numpy.array(data, dtype=numpy.float64).reshape(-1, 2) for data in xydata]
+
+    def _get_query_data_remote(self, queries: List["ENS_QUERY"]) -> List[List[List[float]]]:
+        """Get the ``xydata`` values of the input queries.
+
+        This method is meant to run in the EnSight interpreter.
+
+        Parameters
+        ----------
+        queries : list[ENS_QUERY]
+            The queries to get the data of.
+
+        Returns
+        -------
+        list
+            For each query, the list of [x, y] values as plain floats.
+
+        """
+        return [[[float(x), float(y)] for x, y in query.QUERY_DATA["xydata"]] for query in queries]
+
     def _create_query_core_end(self) -> "ENS_QUERY":
         """Complete a query operation.
 
-        Execute the "end()" and "query()" calls to finalize the query.  Return the latest
-        ENS_QUERY object.
+        Execute the "end()" and "query()" calls to finalize the query.  Return the
+        ENS_QUERY object that was just created.  The new object has an id of at least
+        ``next_id()``, and it is searched from the end of ``QUERIES``, where EnSight
+        appends it, so that creating many queries does not scan the whole list each time.
 
         Returns
         -------
@@ -410,17 +531,12 @@ class Query:
         nextid = self._ensight.objs.next_id()
         self._ensight.query_ent_var.end()
         self._ensight.query_ent_var.query()
-        error_msg = None
-        try:
-            query = max(self._ensight.objs.core.QUERIES)
-            # no new id allocated
-            if query.__OBJID__ < nextid:  # pragma: no cover
-                error_msg = "Unable to create the specified query."  # pragma: no cover
-        except ValueError:  # pragma: no cover
-            error_msg = "Unable to create the specified query."  # pragma: no cover
-        if error_msg:  # pragma: no cover
-            raise RuntimeError(error_msg)  # pragma: no cover
-        return query
+        queries = self._ensight.objs.core.QUERIES
+        for index in range(len(queries) - 1, -1, -1):
+            if queries[index].__OBJID__ >= nextid:
+                return queries[index]
+        # no new id allocated
+        raise RuntimeError("Unable to create the specified query.")  # pragma: no cover
 
     def _create_query_core_begin(self, name: str, parts: Optional[List[int]], single=False) -> None:
         """Common query setup
@@ -480,7 +596,10 @@ class Query:
         if v is None:
             return default
         elif type(v) is str:
-            if v not in self._ensight.objs.core.VARIABLES.get_attr("DESCRIPTION"):
+            names = self._variable_names
+            if names is None:
+                names = self._ensight.objs.core.VARIABLES.get_attr("DESCRIPTION")
+            if v not in names:
                 raise ValueError("The variable supplied does not exist.")
             return v
         else:
@@ -20,7 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import TYPE_CHECKING, Any, ContextManager, Union
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Union
 
 if TYPE_CHECKING:
     try:
@@ -126,3 +127,119 @@ class ScopedName:
         if self._old_raise is not None:
             # if the restore value is set, restore it here
             self._ensight.sendmesgoptions(exception=self._old_raise)
+
+
+class RemoteMethods:
+    """Run the methods of an ``ensight.utils`` class on the EnSight side.
+
+    Several ``ensight.utils`` classes implement an operation as a method that runs
+    in the EnSight interpreter, so that PyEnSight can perform it with a single
+    command.  This class builds those commands for one ``ensight.utils`` module.
+    Inside EnSight, the methods are simply called.
+
+    Parameters
+    ----------
+    interface :
+        Entity that provides the ``ensight`` namespace.
+    module : str
+        Name of the ``ensight.utils`` module, for example ``"parts"``.
+    owner : Any
+        The instance of the ``ensight.utils`` class, used to run the methods locally.
+    local_fallback : bool, optional
+        Whether to run a method locally, through the proxy objects, if the EnSight
+        session does not provide it.  If ``False``, the method is always called in
+        EnSight and the caller checks its availability with ``has()`` where needed.
+        The default is ``True``.
+    """
+
+    def __init__(
+        self,
+        interface: Union["ensight_api.ensight", "ensight"],
+        module: str,
+        owner: Any,
+        local_fallback: bool = True,
+    ):
+        self._ensight = interface
+        self._module = module
+        self._owner = owner
+        self._local_fallback = local_fallback
+        # Availability of the remote methods, probed once per method name
+        self._available: Dict[str, bool] = {}
+
+    def has(self, name: str) -> bool:
+        """Determine if the EnSight session provides a method.
+
+        The check is performed only once for each method.
+
+        Parameters
+        ----------
+        name : str
+            Name of the method.
+
+        Returns
+        -------
+        bool
+            ``True`` if the method is available.
+        """
+        # if a module, then we are inside EnSight
+        if isinstance(self._ensight, ModuleType):  # pragma: no cover
+            return True  # pragma: no cover
+        if name not in self._available:
+            cmd = f"hasattr(ensight.utils.{self._module}, {name!r})"
+            try:
+                self._available[name] = bool(self._ensight._session.cmd(cmd))
+            except RuntimeError:  # pragma: no cover
+                self._available[name] = False  # pragma: no cover
+        return self._available[name]
+
+    def call(self, name: str, *args: Any) -> Any:
+        """Run a method in the EnSight interpreter with a single command.
+
+        Parameters
+        ----------
+        name : str
+            Name of the method.
+        *args : Any
+            Positional arguments for the method.  See ``repr()``.
+
+        Returns
+        -------
+        Any
+            Value returned by the method.
+        """
+        if isinstance(self._ensight, ModuleType):  # pragma: no cover
+            return getattr(self._owner, name)(*args)  # pragma: no cover
+        if self._local_fallback and not self.has(name):
+            return getattr(self._owner, name)(*args)  # pragma: no cover
+        cmd = f"ensight.utils.{self._module}.{name}("
+        cmd += ", ".join(self.repr(a) for a in args) + ")"
+        return self._ensight._session.cmd(cmd)
+
+    @staticmethod
+    def repr(value: Any) -> str:
+        """Convert a value into a string that evaluates to the same value in EnSight.
+
+        ``ENSOBJ`` proxies are converted into their ``ensight.objs.wrap_id()`` form.
+        Lists, tuples and dictionaries are converted recursively.
+
+        Parameters
+        ----------
+        value : Any
+            The value to convert.
+
+        Returns
+        -------
+        str
+            The string to use in the remote command.
+        """
+        if isinstance(value, dict):
+            items = (f"{RemoteMethods.repr(k)}: {RemoteMethods.repr(v)}" for k, v in value.items())
+            return "{" + ", ".join(items) + "}"
+        if isinstance(value, list):
+            return "[" + ", ".join(RemoteMethods.repr(v) for v in value) + "]"
+        if isinstance(value, tuple):
+            inner = ", ".join(RemoteMethods.repr(v) for v in value)
+            return "(" + inner + ("," if len(value) == 1 else "") + ")"
+        if hasattr(value, "_remote_obj"):
+            return value._remote_obj()
+        return repr(value)
@@ -28,10 +28,11 @@ This module provides simplified interface to compute specific variables via PyEn
 
 import math
 import os
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from ansys.api.pyensight.calc_funcs import ens_calculator
 from ansys.pyensight.core.utils.parts import convert_variable
+from ansys.pyensight.core.utils.support import RemoteMethods
 import numpy as np
 
 try:
@@ -74,6 +75,7 @@ class Variables:
     def __init__(self, ensight: Union["ensight_api.ensight", "ensight"]):
         self.ensight = ensight
         self._calculator = ens_calculator(self.ensight)
+        self._remote = RemoteMethods(ensight, "variables", self)
 
     @property
     def calculator(self) -> "ens_calculator":
@@ -168,9 +170,6 @@ class Variables:
             A list containing either the original variable if already elemental,
             or the computed nodal equivalent variable
         """
-        # get the last created var obj to use as a test to see if a new one is created
-        last_var_obj = max(self.ensight.objs.core.VARIABLES)
-        #
         var_name = var_obj.DESCRIPTION
         calc_var_name = ""
         if self.ensight.objs.enums.ENS_VAR_ELEM != var_obj.LOCATION:
@@ -189,12 +188,47 @@ class Variables:
                     "Using elemental variable that already exists: {}".format(ret_val.DESCRIPTION)
                 )
                 return [ret_val]
+            # look the new, elemental variable up by name
+            vlist = self.ensight.objs.core.VARIABLES.find(var_name + calc_var_name)
+            if len(vlist) > 0:
+                return [vlist[0]]
+        # return the input value as a new one wasn't created
+        return [var_obj]
+
+    def pipeline(self, prefix: str = "ENS_Pipe") -> "CalculatorPipeline":
+        """
+        Create a calculator pipeline that reuses the variables it has already computed.
+
+        Parameters
+        ----------
+        prefix: str
+            the prefix for the names of the variables created by the pipeline
+
+        Returns
+        -------
+        CalculatorPipeline
+            the new pipeline
+
+        Examples
+        --------
+        >>> with session.ensight.utils.variables.pipeline() as calc:
+        >>>     norm = calc.evaluate("Normal(plist)", ["wall"])
+        >>>     press = calc.elemental("pressure", ["wall"])
+        """
+        return CalculatorPipeline(self, prefix=prefix)
 
-        new_var_obj = max(self.ensight.objs.core.VARIABLES)
-        if new_var_obj != last_var_obj:  # a new, elemental one was created!
-            return [new_var_obj]
-        else:  # return the input value as a new one wasn't created
-            return [var_obj]
+    def _destroy_variables_remote(self, var_list: List["ENS_VAR"]) -> None:
+        """
+        Destroy the input variables. This method is meant to run in the EnSight
+        interpreter, so that all the variables are removed with a single round trip.
+
+        Parameters
+        ----------
+        var_list: list
+            the variables to destroy
+        """
+        for var in var_list:
+            var.destroy()
 
     def _calc_var(
         self, pobj_list: Optional[List["ENS_PART"]] = None, calc_string: Optional[str] = None
@@ -732,6 +766,24 @@ class Variables:
         """
         if not var_type:
             var_type = self.ensight.objs.enums.ENS_VAR_CONSTANT
+        return self._remote.call("_get_const_vars_remote", var_type)
+
+    def _get_const_vars_remote(self, var_type: int) -> List["ENS_VAR"]:
+        """
+        Get all the variables of the input type. This method is meant to run
+        in the EnSight interpreter, so that the VARTYPE of each variable
+        is not fetched with a separate round trip.
+
+        Parameters
+        ----------
+        var_type: int
+            enums.ENS_VAR_CONSTANT or enums.ENS_VAR_CONSTANT_PER_PART
+
+        Returns
+        -------
+        list
+            List containing ENS_VAR objects
+        """
         return [v for v in self.ensight.objs.core.VARIABLES if v.VARTYPE == var_type]
 
     def get_const_var_names(self, v_type: Optional[int] = None) -> List[str]:
@@ -751,12 +803,133 @@ class Variables:
         """
         if not v_type:
             v_type = self.ensight.objs.enums.ENS_VAR_CONSTANT
+        return self._remote.call("_get_const_var_names_remote", v_type)
+
+    def _get_const_var_names_remote(self, v_type: int) -> List[str]:
+        """
+        Get the names of all the variables of the input type. This method is meant
+        to run in the EnSight interpreter.
+
+        Parameters
+        ----------
+        v_type: int
+            enums.ENS_VAR_CONSTANT or enums.ENS_VAR_CONSTANT_PER_PART
+
+        Returns
+        -------
+        list
+            List containing names of constants
+        """
         name_list = []
-        vars = self.get_const_vars(var_type=v_type)
+        vars = self._get_const_vars_remote(v_type)
         for var in vars:
-            name_list.append(var.DESCRIPTION)
+            name_list.append(str(var.DESCRIPTION))
         return name_list
 
+    def get_const_table(
+        self,
+        part_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        all_timesteps: bool = False,
+        undef_nan: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the values of all the constant and per part constant variables
+        with a single request to EnSight.
+
+        Parameters
+        ----------
+        part_list: list
+            The list of part objects to get the per part constant values on. It can either be
+            a list of names a list of IDs (integers or strings) or directly a list of ENS_PART
+            objects. If not provided, all the parts will be considered.
+        all_timesteps: bool
+            if True, return the values for every timestep of the current case instead of
+            only the current timestep. The current timestep is restored at the end.
+        undef_nan: bool
+            if True, undefined values (ensight.Undefined) are replaced by numpy.nan
+
+        Returns
+        -------
+        dict
+            A dictionary keyed by constant name. Each value is a dictionary with the
+            variable "type" (enums.ENS_VAR_CONSTANT or enums.ENS_VAR_CONSTANT_PER_PART) and
+            the "values". These are a float for a constant, an array with one value per part
+            for a per part constant, with an extra leading timestep axis if all_timesteps is True.
+
+        Examples
+        --------
+        >>> table = session.ensight.utils.variables.get_const_table(all_timesteps=True)
+        >>> residuals = table["Residual"]["values"]
+        """
+        timesteps = None
+        if all_timesteps:
+            limits = self.ensight.objs.core.TIMESTEP_LIMITS
+            timesteps = list(range(limits[0], limits[1] + 1))
+        table = self._remote.call("_get_const_table_remote", part_list, timesteps)
+        for entry in table.values():
+            values = np.array(entry["values"], dtype=np.float64)
+            if undef_nan:
+                values[np.isclose(values, self.ensight.Undefined, rtol=1e-6, atol=1e-16)] = np.nan
+            entry["values"] = values if timesteps else values[0]
+        return table
+
+    def _get_const_table_remote(
+        self,
+        part_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        timesteps: Optional[List[int]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the values of all the constant and per part constant variables.
+        This method is meant to run in the EnSight interpreter.
+
+        Parameters
+        ----------
+        part_list: list
+            The list of part objects to get the per part constant values on.
+            If not provided, all the parts will be considered.
+        timesteps: list
+            The timesteps to get the values at. If not provided, the current timestep is used
+
+        Returns
+        -------
+        dict
+            A dictionary keyed by constant name, with the variable "type" and the list of
+            "values", one entry per timestep
+        """
+        enums = self.ensight.objs.enums
+        const_types = (enums.ENS_VAR_CONSTANT, enums.ENS_VAR_CONSTANT_PER_PART)
+        const_vars = [
+            (str(v.DESCRIPTION), int(v.VARTYPE))
+            for v in self.ensight.objs.core.VARIABLES
+            if v.VARTYPE in const_types
+        ]
+        plist = self.ensight.utils.parts.get_part_id_obj_name(part_list, "obj") or []
+        table: Dict[str, Dict[str, Any]] = {
+            name: {"type": vtype, "values": []} for name, vtype in const_vars
+        }
+        current_timestep = self.ensight.objs.core.TIMESTEP
+        try:
+            for step in timesteps if timesteps else [None]:
+                if step is not None:
+                    self.ensight.objs.core.TIMESTEP = step
+                for name, vtype in const_vars:
+                    self.ensight.variables.activate(name)
+                    if vtype == enums.ENS_VAR_CONSTANT_PER_PART:
+                        values = []
+                        for prt in plist:
+                            val_dict = prt.get_values([name])
+                            if val_dict:
+                                values.append(float(val_dict[name][0]))
+                            else:  # pragma: no cover
+                                values.append(float(self.ensight.Undefined))  # pragma: no cover
+                        table[name]["values"].append(values)
+                    else:
+                        table[name]["values"].append(float(self.ensight.ensvariable(name)[0]))
+        finally:
+            if timesteps:
+                self.ensight.objs.core.TIMESTEP = current_timestep
+        return table
+
     def get_const_val(
         self,
         cname: str,
@@ -1719,6 +1892,34 @@ class Variables:
         sf = np.dot(f_np_vec[:3], side_vec)
         return [lf, df, sf]
 
+    @staticmethod
+    def _lds_basis(velocity: List[Any], up_vector: str) -> List[np.array]:
+        """
+        Compute the lift, drag and side directions for the input reference velocity
+        and up vector
+
+        Parameters
+        ----------
+        velocity: list
+            the X, Y, Z components of the reference velocity
+        up_vector: str
+            the up_vector string
+
+        Returns
+        -------
+        list
+            The normalized lift, drag and side direction vectors
+        """
+        temp_np_vec = np.array(velocity)
+        drag_vec = temp_np_vec / np.sqrt(np.dot(temp_np_vec, temp_np_vec))
+        up_vec = Variables._get_up_vec(up_vector)
+        temp_np_vec = np.cross(drag_vec, up_vec)
+        side_vec = temp_np_vec / np.sqrt(np.dot(temp_np_vec, temp_np_vec))
+        # Lift vec normalized
+        temp_np_vec = np.cross(side_vec, drag_vec)
+        lift_vec = temp_np_vec / np.sqrt(np.dot(temp_np_vec, temp_np_vec))
+        return [lift_vec, drag_vec, side_vec]
+
     SHEAR_VAR_TYPE_STRESS = 0
     SHEAR_VAR_TYPE_FORCE = 1
     UP_VECTOR_PLUS_X = "+X"
@@ -1728,6 +1929,112 @@ class Variables:
     UP_VECTOR_MINUS_Y = "-Y"
     UP_VECTOR_MINUS_Z = "-Z"
 
+    def _force_components_remote(
+        self,
+        pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        press_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_or_force_flag: Optional[str] = "Shear stress",
+        frame_index: Optional[int] = 0,
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Compute the per part pressure and shear force components.
+        This method is meant to run in the EnSight interpreter, so that
+        the whole calculator pipeline costs a single round trip to PyEnSight.
+
+        Parameters
+        ----------
+        pobj_list: list
+            The list of part objects to compute the forces on. It can either be a list of names
+            a list of IDs (integers or strings) or directly a list of ENS_PART objects
+        press_var_obj: str, ENS_VAR or int
+            The pressure variable. If not supplied, the pressure forces are not computed
+        shear_var_obj: str, ENS_VAR or int
+            The shear variable. If not supplied, the shear forces are not computed
+        shear_or_force_flag: str
+            It can either be "Shear stress" or "Shear force" to indicate the kind of shear variable
+            supplied
+        frame_index: int
+            The eventual frame index on which to compute the cylindrical components of the forces
+
+        Returns
+        -------
+        dict
+            A dictionary with the "part_names" of the selected parts and the per part
+            "pressure_forces" and "shear_forces" components. None if the computation failed.
+        """
+        _pobj_list = self.ensight.utils.parts.select_parts(pobj_list)
+        press_forces: List[List[float]] = []
+        shear_forces: List[List[float]] = []
+        if press_var_obj:  # pragma: no cover
+            if not self._press_force_xyz_rtz(
+                pobj_list=pobj_list, press_var_obj=press_var_obj, frame_index=frame_index
+            ):
+                return None  # pragma: no cover
+            temp = self._sum_pressure_forces_xyz_rtz(pobj_list=pobj_list, frame_index=frame_index)
+            if not temp:  # pragma: no cover
+                return None  # pragma: no cover
+            press_forces = temp
+        if shear_var_obj:  # pragma: no cover
+            if not self._shear_force_xyz_rtz(
+                pobj_list=pobj_list,
+                shear_var_obj=shear_var_obj,
+                shear_or_force_flag=shear_or_force_flag,
+                frame_index=frame_index,
+            ):
+                return None
+            temp = self._sum_shear_forces_xyz_rtz(pobj_list=pobj_list, frame_index=frame_index)
+            if not temp:
+                return None
+            shear_forces = temp
+        # Plain Python types only, the reply is evaluated on the PyEnSight side
+        return {
+            "part_names": [str(p.DESCRIPTION) for p in _pobj_list],
+            "pressure_forces": [[float(v) for v in f] for f in press_forces],
+            "shear_forces": [[float(v) for v in f] for f in shear_forces],
+        }
+
+    def _force_components(
+        self,
+        pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        press_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_or_force_flag: Optional[str] = "Shear stress",
+        frame_index: Optional[int] = 0,
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Compute the per part pressure and shear force components, running
+        _force_components_remote in the EnSight session with a single command.
+
+        Parameters
+        ----------
+        pobj_list: list
+            The list of part objects to compute the forces on. It can either be a list of names
+            a list of IDs (integers or strings) or directly a list of ENS_PART objects
+        press_var_obj: str, ENS_VAR or int
+            The pressure variable. If not supplied, the pressure forces are not computed
+        shear_var_obj: str, ENS_VAR or int
+            The shear variable. If not supplied, the shear forces are not computed
+        shear_or_force_flag: str
+            It can either be "Shear stress" or "Shear force" to indicate the kind of shear variable
+            supplied
+        frame_index: int
+            The eventual frame index on which to compute the cylindrical components of the forces
+
+        Returns
+        -------
+        dict
+            The dictionary returned by _force_components_remote
+        """
+        return self._remote.call(
+            "_force_components_remote",
+            pobj_list,
+            press_var_obj,
+            shear_var_obj,
+            shear_or_force_flag,
+            frame_index,
+        )
+
     def compute_forces(
         self,
         pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
@@ -1829,7 +2136,6 @@ class Variables:
         }
         if not up_vector:  # pragma: no cover
             up_vector = self.UP_VECTOR_PLUS_Z  # pragma: no cover
-        _pobj_list = self.ensight.utils.parts.select_parts(pobj_list)
         computed_press_forces: List[List[float]] = []
         computed_shear_forces: List[List[float]] = []
         computed_press_force_coeffs: List[List[float]] = []
@@ -1838,29 +2144,18 @@ class Variables:
         computed_shear_forces_lds: List[List[float]] = []
         computed_press_forces_lds_coeffs: List[List[float]] = []
         computed_shear_forces_lds_coeffs: List[List[float]] = []
-        if press_var_obj:  # pragma: no cover
-            success = self._press_force_xyz_rtz(
-                pobj_list=pobj_list, press_var_obj=press_var_obj, frame_index=frame_index
-            )
-            if not success:  # pragma: no cover
-                return None  # pragma: no cover
-            temp = self._sum_pressure_forces_xyz_rtz(pobj_list=pobj_list, frame_index=frame_index)
-            if not temp:  # pragma: no cover
-                return None  # pragma: no cover
-            computed_press_forces = temp.copy()
-        if shear_var_obj:
-            success = self._shear_force_xyz_rtz(
-                pobj_list=pobj_list,
-                shear_var_obj=shear_var_obj,
-                shear_or_force_flag=shear_map.get(shear_var_type),
-                frame_index=frame_index,
-            )
-            if not success:
-                return None
-            temp = self._sum_shear_forces_xyz_rtz(pobj_list=pobj_list, frame_index=frame_index)
-            if not temp:
-                return None
-            computed_shear_forces = temp.copy()
+        components = self._force_components(
+            pobj_list=pobj_list,
+            press_var_obj=press_var_obj,
+            shear_var_obj=shear_var_obj,
+            shear_or_force_flag=shear_map.get(shear_var_type),
+            frame_index=frame_index,
+        )
+        if not components:
+            return None
+        part_names: List[str] = components["part_names"]
+        computed_press_forces = components["pressure_forces"]
+        computed_shear_forces = components["shear_forces"]
         coeffs_computation = all(
             [
                 x is not None
@@ -1892,14 +2187,9 @@ class Variables:
             [x is not None for x in [up_vector, velocity_x_ref, velocity_y_ref, velocity_z_ref]]
         )
         if lds:  # pragma: no cover
-            temp_np_vec = np.array([velocity_x_ref, velocity_y_ref, velocity_z_ref])
-            drag_vec = temp_np_vec / np.sqrt(np.dot(temp_np_vec, temp_np_vec))
-            up_vec = self._get_up_vec(up_vector)
-            temp_np_vec = np.cross(drag_vec, up_vec)
-            side_vec = temp_np_vec / np.sqrt(np.dot(temp_np_vec, temp_np_vec))
-            # Lift vec normalized
-            temp_np_vec = np.cross(side_vec, drag_vec)
-            lift_vec = temp_np_vec / np.sqrt(np.dot(temp_np_vec, temp_np_vec))
+            lift_vec, drag_vec, side_vec = self._lds_basis(
+                [velocity_x_ref, velocity_y_ref, velocity_z_ref], up_vector
+            )
             if computed_press_forces:  # pragma: no cover
                 for part_force in computed_press_forces:
                     computed_press_forces_lds.append(
@@ -1967,7 +2257,7 @@ class Variables:
 
                 self._write_out_force_data(
                     export_filename,
-                    _pobj_list,
+                    self.ensight.utils.parts.select_parts(pobj_list),
                     params=params,
                     press_force_list=computed_press_forces,
                     shear_force_list=computed_shear_forces,
@@ -1980,43 +2270,459 @@ class Variables:
                 )
         return {
             "pressure_forces": {
-                p.DESCRIPTION: computed_press_forces[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_press_forces[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_press_forces)
             },
             "shear_forces": {
-                p.DESCRIPTION: computed_shear_forces[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_shear_forces[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_shear_forces)
             },
             "normalized_pressure_forces": {
-                p.DESCRIPTION: computed_press_force_coeffs[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_press_force_coeffs[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_press_force_coeffs)
             },
             "normalized_shear_forces": {
-                p.DESCRIPTION: computed_shear_force_coeffs[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_shear_force_coeffs[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_shear_force_coeffs)
             },
             "pressure_forces_lds_direction": {
-                p.DESCRIPTION: computed_press_forces_lds[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_press_forces_lds[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_press_forces_lds)
             },
             "shear_forces_lds_direction": {
-                p.DESCRIPTION: computed_shear_forces_lds[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_shear_forces_lds[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_shear_forces_lds)
             },
             "normalized_pressure_forces_lds_direction": {
-                p.DESCRIPTION: computed_press_forces_lds_coeffs[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_press_forces_lds_coeffs[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_press_forces_lds_coeffs)
             },
             "normalized_shear_forces_lds_direction": {
-                p.DESCRIPTION: computed_shear_forces_lds[idx]
-                for idx, p in enumerate(_pobj_list)
+                name: computed_shear_forces_lds[idx]
+                for idx, name in enumerate(part_names)
                 if idx < len(computed_shear_forces_lds_coeffs)
             },
         }
+
+    _SWEEP_COLUMNS = {
+        "pressure_forces": ("Pressure Force", ["X", "Y", "Z", "Radial", "Theta", "Axial"]),
+        "shear_forces": ("Shear Force", ["X", "Y", "Z", "Radial", "Theta", "Axial"]),
+        "normalized_pressure_forces": ("Coeff Press", ["X", "Y", "Z", "Radial", "Theta", "Axial"]),
+        "normalized_shear_forces": ("Coeff Shear", ["X", "Y", "Z", "Radial", "Theta", "Axial"]),
+        "pressure_forces_lds_direction": ("Pressure Force", ["Lift", "Drag", "Side"]),
+        "shear_forces_lds_direction": ("Shear Force", ["Lift", "Drag", "Side"]),
+        "normalized_pressure_forces_lds_direction": ("Coeff Press", ["Lift", "Drag", "Side"]),
+        "normalized_shear_forces_lds_direction": ("Coeff Shear", ["Lift", "Drag", "Side"]),
+    }
+
+    def _force_sweep_remote(
+        self,
+        pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        press_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_or_force_flag: Optional[str] = "Shear stress",
+        frame_index: Optional[int] = 0,
+        timesteps: Optional[List[int]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Compute the per part pressure and shear force components over a list
+        of timesteps. This method is meant to run in the EnSight interpreter.
+        The current timestep is restored at the end.
+
+        Parameters
+        ----------
+        pobj_list: list
+            The list of part objects to compute the forces on. It can either be a list of names
+            a list of IDs (integers or strings) or directly a list of ENS_PART objects
+        press_var_obj: str, ENS_VAR or int
+            The pressure variable. If not supplied, the pressure forces are not computed
+        shear_var_obj: str, ENS_VAR or int
+            The shear variable. If not supplied, the shear forces are not computed
+        shear_or_force_flag: str
+            It can either be "Shear stress" or "Shear force" to indicate the kind of shear variable
+            supplied
+        frame_index: int
+            The eventual frame index on which to compute the cylindrical components of the forces
+        timesteps: list
+            The timesteps to compute the forces on
+
+        Returns
+        -------
+        dict
+            A dictionary with the "part_names", the solution "times" and the
+            "pressure_forces" and "shear_forces" components, one entry per timestep
+        """
+        sweep: Dict[str, List[Any]] = {
+            "part_names": [],
+            "times": [],
+            "pressure_forces": [],
+            "shear_forces": [],
+        }
+        if not timesteps:  # pragma: no cover
+            return sweep  # pragma: no cover
+        current_timestep = self.ensight.objs.core.TIMESTEP
+        try:
+            for step in timesteps:
+                self.ensight.objs.core.TIMESTEP = step
+                components = self._force_components_remote(
+                    pobj_list, press_var_obj, shear_var_obj, shear_or_force_flag, frame_index
+                )
+                if not components:  # pragma: no cover
+                    raise RuntimeError(f"Error computing the forces at timestep {step}")
+                sweep["part_names"] = components["part_names"]
+                sweep["times"].append(float(self.ensight.objs.core.SOLUTIONTIME))
+                sweep["pressure_forces"].append(components["pressure_forces"])
+                sweep["shear_forces"].append(components["shear_forces"])
+        finally:
+            self.ensight.objs.core.TIMESTEP = current_timestep
+        return sweep
+
+    @staticmethod
+    def _sweep_arrays(
+        sweep: Dict[str, List[Any]],
+        dyn_pressure: Optional[float] = None,
+        lds_basis: Optional[np.ndarray] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert the reply of _force_sweep_remote into arrays of shape
+        (steps, parts, components), adding the force coefficients and the
+        lift, drag and side components if requested
+
+        Parameters
+        ----------
+        sweep: dict
+            the dictionary returned by _force_sweep_remote
+        dyn_pressure: float
+            the reference dynamic pressure times the reference area. If None,
+            the force coefficients are not computed
+        lds_basis: numpy.ndarray
+            the 3x3 matrix whose columns are the lift, drag and side directions.
+            If None, the lift, drag and side components are not computed
+
+        Returns
+        -------
+        dict
+            The arrays, keyed like the dictionary returned by compute_forces
+        """
+        forces = {
+            key: np.array(sweep[key], dtype=np.float64)
+            for key in ("pressure_forces", "shear_forces")
+            if sweep[key] and sweep[key][0]
+        }
+        arrays = dict(forces)
+        if dyn_pressure is not None:
+            for key, value in forces.items():
+                # Same convention as _force_coeffs
+                if dyn_pressure > 0:
+                    arrays["normalized_" + key] = value / dyn_pressure
+                else:  # pragma: no cover
+                    arrays["normalized_" + key] = np.zeros_like(value)  # pragma: no cover
+        if lds_basis is not None:
+            for key in list(arrays):
+                # Same as _lds_forces, for all the timesteps and parts at once
+                arrays[key + "_lds_direction"] = arrays[key][..., :3] @ lds_basis
+        return arrays
+
+    def _write_sweep_rows(
+        self,
+        fp: Any,
+        timesteps: List[int],
+        sweep: Dict[str, List[Any]],
+        arrays: Dict[str, np.ndarray],
+        header: bool = False,
+    ) -> None:
+        """
+        Write the force sweep values to the input file, one row per timestep and part
+
+        Parameters
+        ----------
+        fp: Any
+            the open file to write to
+        timesteps: list
+            the timesteps of the values
+        sweep: dict
+            the dictionary returned by _force_sweep_remote
+        arrays: dict
+            the dictionary returned by _sweep_arrays
+        header: bool
+            True to write the header line first
+        """
+        if header:
+            columns = ["Timestep", "Time", "Part Name"]
+            for key in arrays:
+                label, components = self._SWEEP_COLUMNS[key]
+                columns.extend(f"{label} {comp}" for comp in components)
+            fp.write(" , ".join(columns) + "\n")
+        for ii, step in enumerate(timesteps):
+            for jj, name in enumerate(sweep["part_names"]):
+                row = [str(step), str(sweep["times"][ii]), name]
+                for value in arrays.values():
+                    row.extend(str(v) for v in value[ii, jj])
+                fp.write(" , ".join(row) + "\n")
+        fp.flush()
+
+    def compute_forces_sweep(
+        self,
+        pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        press_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_var_obj: Optional[Union["ENS_VAR", str, int]] = None,
+        shear_var_type: Optional[int] = None,
+        area_ref: Optional[float] = None,
+        density_ref: Optional[float] = None,
+        velocity_x_ref: Optional[float] = None,
+        velocity_y_ref: Optional[float] = None,
+        velocity_z_ref: Optional[float] = None,
+        up_vector: Optional[str] = None,
+        timesteps: Optional[List[int]] = None,
+        export_filename: Optional[str] = None,
+        frame_index: Optional[int] = 0,
+        chunk_size: int = 16,
+    ) -> Dict[str, Any]:
+        """
+        Compute the force values over a range of timesteps.
+        The parameters have the same meaning as in compute_forces. The forces are computed
+        by EnSight, ``chunk_size`` timesteps per request, and the coefficients and the
+        lift, drag and side components are computed in PyEnSight on all the timesteps at once.
+        If an export_filename is supplied, the rows for each chunk of timesteps are appended
+        to the .csv file as soon as they are available.
+
+        Parameters
+        ----------
+        pobj_list: list
+            The list of part objects to compute the forces on. It can either be a list of names
+            a list of IDs (integers or strings) or directly a list of ENS_PART objects.
+            The list must contain 2D surfaces.
+        press_var_obj: str, ENS_VAR or int
+            The variable to use for the pressure force computation.
+        shear_var_obj: str, ENS_VAR or int
+            The variable to use for the shear force computation.
+        shear_var_type: int
+            The kind of shear variable supplied, SHEAR_VAR_TYPE_STRESS (default)
+            or SHEAR_VAR_TYPE_FORCE
+        area_ref: float
+            the area reference value for the force coefficients computation
+        density_ref: float
+            the density reference value for the force coefficients computation
+        velocity_x_ref: float
+            the X velocity reference component
+        velocity_y_ref: float
+            the Y velocity reference component
+        velocity_z_ref: float
+            the Z velocity reference component
+        up_vector: str
+            Define the "up vector" for the lift/drag/side decomposition. If not provided,
+            it will default to +Z
+        timesteps: list
+            The timesteps to compute the forces on. If not provided, all the timesteps
+            of the current case are used
+        export_filename: str
+            The filename for the .csv export file. If not provided, no file will be exported.
+            The file will be exported relative to the PyEnSight session, not to the EnSight session.
+        frame_index: int
+            The eventual frame index on which to compute the cylindrical components of the forces.
+        chunk_size: int
+            The number of timesteps computed for each request to EnSight
+
+        Returns
+        -------
+        dict:
+            A dictionary containing the "part_names", the "timesteps" and the solution "times",
+            and, for each kind of force computed, a numpy array of shape (steps, parts, components).
+            The force kinds use the same keys of the dictionary returned by compute_forces.
+
+        Examples
+        --------
+        >>> forces = session.ensight.utils.variables.compute_forces_sweep(
+        >>>     ["wing"], press_var_obj="staticPressure", export_filename="forces.csv"
+        >>> )
+        >>> drag_history = forces["pressure_forces"][:, 0, 0]
+        """
+        if not frame_index:
+            frame_index = 0
+        if not shear_var_type:  # pragma: no cover
+            shear_var_type = self.SHEAR_VAR_TYPE_STRESS
+        shear_map = {
+            self.SHEAR_VAR_TYPE_STRESS: "Shear stress",
+            self.SHEAR_VAR_TYPE_FORCE: "Shear force",
+        }
+        if not up_vector:  # pragma: no cover
+            up_vector = self.UP_VECTOR_PLUS_Z
+        if timesteps is None:
+            limits = self.ensight.objs.core.TIMESTEP_LIMITS
+            timesteps = list(range(limits[0], limits[1] + 1))
+        if not timesteps:
+            raise RuntimeError("Error, no timestep provided")
+        if chunk_size < 1:
+            raise RuntimeError("Error, chunk_size must be a positive number")
+        velocity: Optional[List[float]] = None
+        if velocity_x_ref is not None and velocity_y_ref is not None and velocity_z_ref is not None:
+            velocity = [velocity_x_ref, velocity_y_ref, velocity_z_ref]
+        dyn_pressure = None
+        if area_ref is not None and density_ref is not None and velocity is not None:
+            dyn_pressure = area_ref * vec_mag(velocity) ** 2 * density_ref / 2.0
+        lds_basis = None
+        if velocity is not None:
+            lds_basis = np.stack(self._lds_basis(velocity, up_vector), axis=1)
+        part_names: List[str] = []
+        times: List[float] = []
+        chunks: Dict[str, List[np.ndarray]] = {}
+        fp = open(export_filename, "w") if export_filename else None
+        try:
+            for start in range(0, len(timesteps), chunk_size):
+                steps = timesteps[start : start + chunk_size]
+                sweep = self._remote.call(
+                    "_force_sweep_remote",
+                    pobj_list,
+                    press_var_obj,
+                    shear_var_obj,
+                    shear_map.get(shear_var_type),
+                    frame_index,
+                    steps,
+                )
+                arrays = self._sweep_arrays(sweep, dyn_pressure, lds_basis)
+                part_names = sweep["part_names"]
+                times.extend(sweep["times"])
+                for key, value in arrays.items():
+                    chunks.setdefault(key, []).append(value)
+                if fp:
+                    self._write_sweep_rows(fp, steps, sweep, arrays, header=start == 0)
+        finally:
+            if fp:
+                fp.close()
+        result: Dict[str, Any] = {
+            "part_names": part_names,
+            "timesteps": np.array(timesteps),
+            "times": np.array(times),
+        }
+        result.update({key: np.concatenate(value) for key, value in chunks.items()})
+        return result
+
+
+class CalculatorPipeline:
+    """Evaluate EnSight calculator expressions, reusing the variables already computed.
+
+    Each variable created by the pipeline is remembered, keyed by the calculator
+    expression and the set of parts it was computed on. Evaluating the same expression
+    on the same parts again returns the existing variable without running the calculator.
+    All the variables created by the pipeline are destroyed by ``clear()``, or
+    when leaving the ``with`` block if the pipeline is used as a context manager.
+
+    This class is instantiated via ``ensight.utils.variables.pipeline()``.
+
+    Parameters
+    ----------
+    variables: Variables
+        the ``ensight.utils.variables`` instance of the session
+    prefix: str
+        the prefix for the names of the variables created by the pipeline
+    """
+
+    def __init__(self, variables: "Variables", prefix: str = "ENS_Pipe"):
+        self._variables = variables
+        self.ensight = variables.ensight
+        self._prefix = prefix
+        self._counter = 0
+        self._cache: Dict[Tuple[str, FrozenSet[Any]], "ENS_VAR"] = {}
+        self._created: List["ENS_VAR"] = []
+
+    def __enter__(self) -> "CalculatorPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_trace) -> None:
+        self.clear()
+
+    @property
+    def variables(self) -> List["ENS_VAR"]:
+        """The variables created by the pipeline, in creation order."""
+        return list(self._created)
+
+    def evaluate(
+        self,
+        expression: str,
+        pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+        output_varname: Optional[str] = None,
+    ) -> "ENS_VAR":
+        """
+        Compute a calculator variable on the input parts, unless the same expression
+        was already computed by the pipeline on the same parts.
+
+        Parameters
+        ----------
+        expression: str
+            the calculator expression, using ``plist`` for the parts. For example
+            "NodeToElem(plist,pressure)"
+        pobj_list: list
+            The list of parts to compute the variable on. It can either be a list of names
+            a list of IDs (integers or strings) or directly a list of ENS_PART objects.
+            If not provided, all the parts will be used
+        output_varname: str
+            the name of the new variable. If not provided, a name is generated from
+            the pipeline prefix
+
+        Returns
+        -------
+        ENS_VAR
+            the computed variable
+        """
+        parts = self.ensight.utils.parts.get_part_id_obj_name(pobj_list, "obj")
+        if not parts:  # pragma: no cover
+            raise RuntimeError("Error, no part provided")  # pragma: no cover
+        key = ("".join(expression.split()), frozenset(parts))
+        var = self._cache.get(key)
+        if var is not None:
+            return var
+        if not output_varname:
+            output_varname = f"{self._prefix}_{self._counter}"
+            self._counter += 1
+        var = self.ensight.objs.core.create_variable(output_varname, expression, sources=parts)
+        if not var:  # pragma: no cover
+            raise RuntimeError(f"Error calculating {output_varname} = {expression}")
+        self._cache[key] = var
+        self._created.append(var)
+        return var
+
+    def elemental(
+        self,
+        var_obj: Union["ENS_VAR", str],
+        pobj_list: Optional[List[Union[str, int, "ENS_PART"]]] = None,
+    ) -> "ENS_VAR":
+        """
+        Return the elemental version of the input variable on the input parts,
+        computing it via NodeToElem only the first time a nodal variable is requested.
+
+        Parameters
+        ----------
+        var_obj: str or ENS_VAR
+            the variable, or its name
+        pobj_list: list
+            The list of parts to compute the variable on. It can either be a list of names
+            a list of IDs (integers or strings) or directly a list of ENS_PART objects.
+            If not provided, all the parts will be used
+
+        Returns
+        -------
+        ENS_VAR
+            the input variable if already elemental, the computed elemental variable otherwise
+        """
+        if isinstance(var_obj, str):
+            vlist = self.ensight.objs.core.VARIABLES.find(var_obj)
+            if len(vlist) == 0:
+                raise RuntimeError(f"Error, variable {var_obj} not found")
+            var_obj = vlist[0]
+        if var_obj.LOCATION == self.ensight.objs.enums.ENS_VAR_ELEM:
+            return var_obj
+        return self.evaluate(f"NodeToElem(plist,{var_obj.DESCRIPTION})", pobj_list)
+
+    def clear(self) -> None:
+        """Destroy all the variables created by the pipeline, with a single request to EnSight."""
+        if self._created:
+            self._variables._remote.call("_destroy_variables_remote", self._created)
+        self._cache = {}
+        self._created = []
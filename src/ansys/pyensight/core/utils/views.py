@@ -41,9 +41,11 @@ Example to set an isometric view:
 """
 
 from functools import wraps
+import json
 import math
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
+from ansys.pyensight.core.utils.support import RemoteMethods
 import numpy as np
 
 if TYPE_CHECKING:
@@ -492,6 +494,7 @@ class Views:
         self.ensight = ensight
         self._views_dict: Dict[str, Tuple[int, List[float]]] = {}
         self._simba = _Simba(ensight, self)
+        self._remote = RemoteMethods(ensight, "views", self)
 
     @staticmethod
     def _normalize_vector(direction: List[float]) -> List[float]:
@@ -652,6 +655,9 @@ class Views:
     def views_dict(self) -> Dict[str, Tuple[int, List[float]]]:
         """Dictionary holding the stored views.
 
+        Each view is stored as a ``(vportindex, coretransform)`` tuple of plain
+        Python values, so the dictionary can be saved with the ``save_views()`` method.
+
         Returns
         -------
         dict
@@ -690,6 +696,21 @@ class Views:
             Coordinates of the model centroid.
 
         """
+        return self._remote.call("_model_centroid_remote", vportindex)
+
+    def _model_centroid_remote(self, vportindex: int) -> List[float]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        vportindex : int
+            Viewport to compute the centroid for.
+
+        Returns
+        -------
+        list
+            Coordinates of the model centroid.
+        """
         vport = self.ensight.objs.core.VPORTS[vportindex]
         try:
             # Available from release 24.1. The order is:
@@ -719,7 +740,7 @@ class Views:
         xavg = (xmax + xmin) / 2
         yavg = (ymax + ymin) / 2
         zavg = (zmax + zmin) / 2
-        values = [xavg, yavg, zavg]
+        values = [float(xavg), float(yavg), float(zavg)]
         return values
 
     def set_view_direction(
@@ -780,8 +801,7 @@ class Views:
         vportindex : int, optional
             Viewport to set the view direction for. The default is ``0``.
         """
-        vport = self.ensight.objs.core.VPORTS[vportindex]
-        coretransform = vport.CORETRANSFORM
+        coretransform = self._remote.call("_view_state_remote", vportindex)
         if not name:
             count = 0
             while True and count < 100:
@@ -807,8 +827,70 @@ class Views:
         found = self.views_dict.get(name)
         if found:  # pragma: no cover
             viewport, coretransform = found
-            vport = self.ensight.objs.core.VPORTS[viewport]
-            vport.CORETRANSFORM = coretransform
+            self._remote.call("_restore_view_remote", viewport, list(coretransform))
+
+    def _view_state_remote(self, vportindex: int) -> List[float]:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        vportindex : int
+            Viewport to get the view of.
+
+        Returns
+        -------
+        list
+            The core transform of the viewport.
+        """
+        return [float(v) for v in self.ensight.objs.core.VPORTS[vportindex].CORETRANSFORM]
+
+    def _restore_view_remote(self, vportindex: int, coretransform: List[float]) -> None:
+        """EnSight-side implementation.
+
+        Parameters
+        ----------
+        vportindex : int
+            Viewport to set the view of.
+        coretransform : list
+            The core transform to set.
+        """
+        self.ensight.objs.core.VPORTS[vportindex].CORETRANSFORM = coretransform
+
+    def save_views(self, filename: str) -> None:
+        """Save the stored views to a JSON file.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the local file to save the views to.
+
+        """
+        views = {
+            name: [int(viewport), [float(v) for v in coretransform]]
+            for name, (viewport, coretransform) in self.views_dict.items()
+        }
+        with open(filename, "w") as fp:
+            json.dump(views, fp, indent=1)
+
+    def load_views(self, filename: str, replace: bool = False) -> None:
+        """Load views saved by the ``save_views()`` method.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the local file to load the views from.
+        replace : bool, optional
+            Whether to remove the currently stored views first. The default is
+            ``False``, in which case the loaded views are added to them, replacing
+            the ones with the same name.
+
+        """
+        with open(filename, "r") as fp:
+            views = json.load(fp)
+        if replace:
+            self.views_dict.clear()
+        for name, (viewport, coretransform) in views.items():
+            self.views_dict[name] = (int(viewport), [float(v) for v in coretransform])
 
     def restore_center_of_transform(self) -> None:
         """Restore the center of the transform to the model centroid."""
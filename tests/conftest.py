@@ -152,6 +152,7 @@ def mocked_session(mocker, tmpdir, enshell_mock) -> "Session":
     remote = session_dir.join("remote_filename")
     remote.write("test_html")
     mocker.patch.object(atexit, "register")
+    mocker.patch.dict(os.environ, {"PYENSIGHT_METADATA_CACHE": str(tmpdir.mkdir("cache"))})
     session = Session(
         host="superworkstation",
         install_path="/path/to/darkness",
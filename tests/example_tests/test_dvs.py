@@ -77,7 +77,8 @@ def build_numpy_conn_simba_format(conn):
     return face_array
 
 
-def test_dvs_data(tmpdir, pytestconfig: pytest.Config):
+@pytest.mark.parametrize("partition_nodes", [False, True])
+def test_dvs_data(tmpdir, pytestconfig: pytest.Config, partition_nodes):
     data_dir = tmpdir.mkdir("datadir")
     use_local = pytestconfig.getoption("use_local_launcher")
     install_path = pytestconfig.getoption("install_path")
@@ -161,7 +162,9 @@ def test_dvs_data(tmpdir, pytestconfig: pytest.Config):
     )
     dvs.end_initialization()
     dvs.begin_updates(session.ensight.objs.core.TIMEVALUES[0][1])
-    dvs.send_connectivity(part.PARTNUMBER, offsets, update_handler._conn)
+    dvs.send_connectivity(
+        part.PARTNUMBER, offsets, update_handler._conn, partition_nodes=partition_nodes
+    )
     dvs.send_coordinates(part.PARTNUMBER, update_handler._coords)
     dvs.send_variable_data(variable.ID, part.PARTNUMBER, update_handler._tcoords)
     dvs.end_updates()
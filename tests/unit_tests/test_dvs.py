@@ -0,0 +1,165 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Unit tests for dvs.py"""
+
+import threading
+import time
+from unittest import mock
+
+from ansys.api.pyensight.dvs_api import dvs_base
+from ansys.pyensight.core.dvs import DVS
+import numpy
+import pytest
+
+
+@pytest.fixture
+def dvs_clients():
+    with mock.patch.object(DVS, "__init__", return_value=None):
+        dvs = DVS()
+    dvs_base.__init__(dvs)
+    dvs._total_ranks = 3
+    dvs._client_count = 3
+    dvs._clients = {c: {"client_id": 100 + c, "rank": c, "update_started": True} for c in range(3)}
+    dvs._parts = {1: {"id": 1}}
+    dvs._elem_type_map = {3: dvs.ELEMTYPE_TRIANGLE}
+    dvs._max_send_workers = 4
+    dvs._max_poll_interval = 0.1
+    dvs._update_condition = threading.Condition()
+    dvs._wait_stats = {}
+    dvs._update_num = 0
+    dvs._server_ids = [1, 2]
+    dvs.update_elements = mock.MagicMock("update_elements")
+    dvs.update_elements_polygon = mock.MagicMock("update_elements_polygon")
+    dvs.update_nodes = mock.MagicMock("update_nodes")
+    dvs.update_var_node_vector = mock.MagicMock("update_var_node_vector")
+    dvs.update_var_element_scalar = mock.MagicMock("update_var_element_scalar")
+    return dvs
+
+
+def calls_by_client(method):
+    return {c.args[0] - 100: c.kwargs for c in method.call_args_list}
+
+
+def test_send_connectivity_polygons(dvs_clients):
+    dvs = dvs_clients
+    counts = numpy.array([3, 4, 5, 3, 6, 4, 3])
+    offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+    faces = numpy.arange(offsets[-1])
+    dvs.send_connectivity(1, offsets, faces)
+    calls = calls_by_client(dvs.update_elements_polygon)
+    assert len(calls) == 3
+    # 7 faces over 3 ranks: 3, 2, 2 faces
+    expected = [(0, 3), (3, 5), (5, 7)]
+    for c, (start, end) in enumerate(expected):
+        kwargs = calls[c]
+        assert kwargs["elem_type"] == dvs.ELEMTYPE_N_SIDED_POLYGON
+        assert numpy.array_equal(kwargs["nodes_per_polygon"], counts[start:end])
+        assert numpy.array_equal(kwargs["indices"], faces[offsets[start] : offsets[end]])
+    assert dvs._parts[1]["dvs_elem_type"] == dvs.ELEMTYPE_N_SIDED_POLYGON
+
+
+def test_send_connectivity_triangles(dvs_clients):
+    dvs = dvs_clients
+    offsets = numpy.arange(0, 3 * 4 + 1, 3)
+    faces = numpy.arange(12)
+    dvs.send_connectivity(1, offsets, faces, ghost=True)
+    calls = calls_by_client(dvs.update_elements)
+    assert [len(calls[c]["indices"]) for c in range(3)] == [6, 3, 3]
+    assert calls[0]["elem_type"] == dvs.ELEMTYPE_TRIANGLE + 1
+
+
+def test_send_partitioned(dvs_clients):
+    dvs = dvs_clients
+    dvs._vars = {
+        5: {"type": dvs.VARTYPE_VECTOR, "location": dvs.LOCATION_NODE},
+        6: {"type": dvs.VARTYPE_SCALAR, "location": dvs.LOCATION_ELEMENT},
+    }
+    # a strip of 6 triangles over 8 vertices
+    faces = numpy.array([0, 1, 4, 1, 5, 4, 1, 2, 5, 2, 6, 5, 2, 3, 6, 3, 7, 6])
+    offsets = numpy.arange(0, len(faces) + 1, 3)
+    vertices = numpy.arange(8 * 3, dtype=numpy.float32)
+    dvs.send_connectivity(1, offsets, faces, partition_nodes=True)
+    dvs.send_coordinates(1, vertices)
+    dvs.send_variable_data(5, 1, vertices * 2)
+    dvs.send_variable_data(6, 1, numpy.arange(6))
+    conn = calls_by_client(dvs.update_elements)
+    nodes = calls_by_client(dvs.update_nodes)
+    node_vars = calls_by_client(dvs.update_var_node_vector)
+    elem_vars = calls_by_client(dvs.update_var_element_scalar)
+    xyz = vertices.reshape(-1, 3)
+    for c in range(3):
+        used = numpy.unique(faces[6 * c : 6 * c + 6])
+        assert numpy.array_equal(nodes[c]["x"], xyz[used, 0])
+        assert numpy.array_equal(nodes[c]["z"], xyz[used, 2])
+        # the local connectivity maps back to the original vertices
+        assert numpy.array_equal(used[conn[c]["indices"]], faces[6 * c : 6 * c + 6])
+        assert numpy.array_equal(node_vars[c]["values"], (xyz[used] * 2).reshape(-1))
+        assert numpy.array_equal(elem_vars[c]["values"], [2 * c, 2 * c + 1])
+    # sending again without partitioning restores full coordinate sends
+    dvs.send_connectivity(1, offsets, faces)
+    dvs.update_nodes.reset_mock()
+    dvs.send_coordinates(1, vertices)
+    assert all(len(k["x"]) == 8 for k in calls_by_client(dvs.update_nodes).values())
+
+
+def test_wait_for_updates(dvs_clients):
+    dvs = dvs_clients
+
+    def begin_update(client_id, update_num, time_value, rank, chunk):
+        time.sleep(0.05 * rank)
+        if client_id == 999:
+            raise RuntimeError("server gone")
+
+    dvs.begin_update = begin_update
+    start = time.time()
+    dvs.begin_updates(0.0)
+    dvs._check_updates_started()
+    assert time.time() - start < 0.5
+    stats = dvs.wait_statistics["updates_started"]
+    assert stats["count"] == 1
+    assert stats["max"] >= 0.09
+    dvs._clients[1]["client_id"] = 999
+    dvs.begin_updates(0.0)
+    start = time.time()
+    with pytest.raises(RuntimeError) as exec_info:
+        dvs._check_updates_started(timeout=10)
+    assert "server gone" in str(exec_info)
+    assert time.time() - start < 1
+
+
+def test_wait_for_timesteps(dvs_clients):
+    dvs = dvs_clients
+    pending = [3]
+
+    def server_timestep_count(server_id):
+        pending[0] = max(pending[0] - 1, 0)
+        return pending[0], 0
+
+    dvs.server_timestep_count = server_timestep_count
+    start = time.time()
+    dvs._check_timestep_count()
+    assert time.time() - start < 0.25
+    pending[0] = 1000000
+    with pytest.raises(RuntimeError):
+        dvs._check_timestep_count(timeout=0.2)
+    assert dvs.wait_statistics["timestep_count"]["count"] == 2
@@ -0,0 +1,214 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Unit tests for libuserd.py, using a multi-rank stand-in for the gRPC server"""
+
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+from ansys.pyensight.core import libuserd
+import numpy
+import pytest
+
+# Two ranks, each holding two quads of a 4x1 strip.  The nodes on x=2 are shared.
+RANK_NODES = {
+    0: numpy.array(
+        [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0]], dtype=numpy.float32
+    ),
+    1: numpy.array(
+        [[2, 0, 0], [3, 0, 0], [4, 0, 0], [2, 1, 0], [3, 1, 0], [4, 1, 0]], dtype=numpy.float32
+    ),
+}
+RANK_CONN = {
+    0: numpy.array([1, 2, 5, 4, 2, 3, 6, 5], dtype=numpy.uint32),
+    1: numpy.array([1, 2, 5, 4, 2, 3, 6, 5], dtype=numpy.uint32),
+}
+
+
+class MultiRankStub(object):
+    """Stand-in for LibUSERDServiceStub serving a dataset decomposed over ranks.
+
+    Every rank blocks in ``Part_nodes`` until all ranks have been asked, so a
+    client that reads the ranks serially times out.
+    """
+
+    def __init__(self, number_of_ranks: int) -> None:
+        self._barrier = threading.Barrier(number_of_ranks, timeout=10)
+
+    @staticmethod
+    def _chunks(values, field):
+        values = values.reshape(-1)
+        half = len(values) // 2
+        for offset in (0, half):
+            chunk = values[offset : half if offset == 0 else len(values)]
+            yield SimpleNamespace(total_size=len(values), offset=offset, **{field: chunk})
+
+    def Part_nodes(self, pb, metadata=None):
+        self._barrier.wait()
+        return self._chunks(RANK_NODES[pb.rank], "xyz")
+
+    def Part_element_conn(self, pb, metadata=None):
+        return self._chunks(RANK_CONN[pb.rank], "connectivity")
+
+    def Part_variable_values(self, pb, metadata=None):
+        values = RANK_NODES[pb.rank][:, 0].copy()
+        return self._chunks(values, "values")
+
+    def Part_num_elements(self, pb, metadata=None):
+        return SimpleNamespace(element_count={int(libuserd.ElementType.QUAD04): 2})
+
+    def Reader_is_geometry_changing(self, pb, metadata=None):
+        return SimpleNamespace(is_geometry_changing=False)
+
+    def Reader_set_timestep(self, pb, metadata=None):
+        return None
+
+    def Libuserd_shutdown(self, pb, metadata=None):
+        return None
+
+
+def make_userd(number_of_ranks):
+    with mock.patch.object(libuserd.LibUserd, "__init__", return_value=None):
+        userd = libuserd.LibUserd()
+    userd._security_token = ""
+    userd._number_of_ranks = number_of_ranks
+    userd._server_process = None
+    userd._container = None
+    userd._channel = mock.MagicMock("channel")
+    userd._stub = MultiRankStub(number_of_ranks)
+    return userd
+
+
+@pytest.fixture
+def multi_rank_userd():
+    userd = make_userd(2)
+    yield userd
+    userd._channel = None
+
+
+def make_part(userd):
+    pb = SimpleNamespace(index=0, id=1, name="strip", reader_id=1, hints=0, metadata={})
+    return libuserd.Part(userd, pb)
+
+
+def test_nodes_by_rank(multi_rank_userd):
+    part = make_part(multi_rank_userd)
+    nodes = part.nodes_by_rank()
+    assert sorted(nodes.keys()) == [0, 1]
+    for rank in (0, 1):
+        assert numpy.array_equal(nodes[rank], RANK_NODES[rank].reshape(-1))
+    with pytest.raises(RuntimeError):
+        part.nodes_by_rank(ranks=[2])
+
+
+def test_partitions_merge(multi_rank_userd):
+    part = make_part(multi_rank_userd)
+    pieces = part.partitions(libuserd.ElementType.QUAD04)
+    nodes, conn = pieces.merge()
+    nodes.shape = (len(nodes) // 3, 3)
+    # the two shared nodes are collapsed
+    assert len(nodes) == 10
+    assert len(conn) == 16
+    quads = numpy.take(nodes, conn.astype(numpy.int64) - 1, axis=0).reshape(4, 4, 3)
+    assert numpy.array_equal(quads[:, 0, 0], [0, 1, 2, 3])
+    values = pieces.merge_variable_values(part.variable_values_by_rank(mock.Mock(id=3)))
+    assert numpy.array_equal(values, nodes[:, 0])
+    # vector values, flat or (n, 3), keep their layout and dtype
+    flat = {r: numpy.asarray(pieces.nodes[r], dtype=numpy.float64) for r in pieces.ranks}
+    values = pieces.merge_variable_values(flat)
+    assert values.dtype == numpy.float64
+    assert numpy.array_equal(values, nodes.reshape(-1))
+    values = pieces.merge_variable_values({r: v.reshape(-1, 3) for r, v in flat.items()})
+    assert numpy.array_equal(values, nodes)
+    # without merging, the node arrays are concatenated
+    nodes, conn = pieces.merge(merge_duplicates=False)
+    assert len(nodes) == 36
+    assert conn.max() == 12
+    # merging on global node ids
+    ids = {0: numpy.array([0, 1, 2, 5, 6, 7]), 1: numpy.array([2, 3, 4, 7, 8, 9])}
+    nodes, _ = pieces.merge(node_ids=ids)
+    assert len(nodes) == 30
+    assert numpy.array_equal(pieces.node_map[1], [2, 6, 7, 5, 8, 9])
+
+
+@pytest.mark.parametrize("store_format", ["npy", "npz", "hdf5"])
+def test_export_store(tmpdir, store_format):
+    if store_format == "hdf5":
+        pytest.importorskip("h5py")
+    userd = make_userd(1)
+    with mock.patch.object(libuserd.Reader, "__init__", return_value=None):
+        reader = libuserd.Reader()
+    reader._userd = userd
+    reader._timesets = [numpy.array([0.0, 1.0]), numpy.array([0.0, 1.0])]
+    var = libuserd.Variable(
+        userd,
+        SimpleNamespace(
+            id=3,
+            name="x",
+            unit_label="",
+            unit_dims="",
+            location=libuserd.VariableLocation.NODE,
+            type=libuserd.VariableType.SCALAR,
+            time_varying=True,
+            complex=False,
+            interleave_flag=0,
+            number_of_components=1,
+            metadata={},
+        ),
+    )
+    static_var = libuserd.Variable(
+        userd, SimpleNamespace(**dict(vars(var), id=4, name="y", time_varying=False))
+    )
+    part = make_part(userd)
+    progress = []
+    path = str(tmpdir.join(f"store.{store_format}"))
+    reader.export_store(
+        path,
+        store_format=store_format,
+        parts=[part],
+        variables=[var, static_var],
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    userd._channel = None
+    assert progress == [(1, 2), (2, 2)]
+    with libuserd.DatasetStore(path) as store:
+        assert store.format == store_format
+        assert numpy.array_equal(store.timevalues, [0.0, 1.0])
+        assert store.parts == [dict(id=1, name="strip")]
+        # the geometry is not changing, so it is shared by all timesteps
+        assert "nodes" not in store._arrays["t0001/p1"]
+        nodes = store.nodes(1, timestep=1)
+        assert numpy.array_equal(nodes[:], RANK_NODES[0].reshape(-1))
+        conn = store.element_conn(1, libuserd.ElementType.QUAD04)
+        assert numpy.array_equal(conn[:], RANK_CONN[0])
+        values = store.variable_values(1, "x", timestep=1)
+        assert numpy.array_equal(values[:], RANK_NODES[0][:, 0])
+        # so are the variables that are not time varying
+        assert store._arrays["t0001/p1"] == ["var_3_c0"]
+        values = store.variable_values(1, "y", timestep=1)
+        assert numpy.array_equal(values[:], RANK_NODES[0][:, 0])
+        assert store.keys(1, timestep=1) == ["conn_QUAD04", "nodes", "var_3_c0", "var_4_c0"]
+        with pytest.raises(KeyError):
+            store.variable_values(1, "z")
+    with pytest.raises(RuntimeError):
+        reader.export_store(path, store_format="csv")
@@ -20,11 +20,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import io
 import os
+import threading
 from unittest import mock
 import zipfile
 
+from PIL import Image
 from ansys.pyensight.core.enscontext import EnsContext, _capture_context, _restore_context
+from ansys.pyensight.core.utils.variables import Variables
+import numpy
+import pytest
 
 
 def test_utils(mocked_session, tmpdir):
@@ -90,3 +96,600 @@ def test_utils(mocked_session, tmpdir):
         _file.write(b"# Object MetaData commands")
         _file.write(b"# End Object MetaData commands")
     c._fix_context_file(os.path.join(data_dir, "ctx.ctx"))
+
+
+def test_compute_forces_remote(mocked_session, mocker):
+    reply = {
+        "part_names": ["wing", "flap"],
+        "pressure_forces": [[1.0, 2.0, 3.0, 0.0, 0.0, 0.0], [4.0, 5.0, 6.0, 0.0, 0.0, 0.0]],
+        "shear_forces": [],
+    }
+    commands = []
+
+    def cmd(value, do_eval=True):
+        commands.append(value)
+        if value.startswith("hasattr("):
+            return True
+        return reply
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    variables = mocked_session.ensight.utils.variables
+    forces = variables.compute_forces(["wing", 2], press_var_obj="p", frame_index=3)
+    assert commands == [
+        "hasattr(ensight.utils.variables, '_force_components_remote')",
+        "ensight.utils.variables._force_components_remote(['wing', 2], 'p', None, "
+        + "'Shear stress', 3)",
+    ]
+    assert forces["pressure_forces"] == {
+        "wing": [1.0, 2.0, 3.0, 0.0, 0.0, 0.0],
+        "flap": [4.0, 5.0, 6.0, 0.0, 0.0, 0.0],
+    }
+    assert forces["shear_forces"] == {}
+    # The remote support check is cached
+    variables.compute_forces(["wing"], press_var_obj="p")
+    assert len(commands) == 3
+
+
+def test_compute_forces_sweep(mocked_session, mocker, tmpdir):
+    commands = []
+
+    def cmd(value, do_eval=True):
+        commands.append(value)
+        if value.startswith("hasattr("):
+            return True
+        steps = eval(value[value.rindex("[") : value.rindex("]") + 1])
+        return {
+            "part_names": ["wing", "flap"],
+            "times": [0.5 * s for s in steps],
+            "pressure_forces": [
+                [[s, 2.0 * s, 0.0, 0.0, 0.0, 0.0], [s, 0.0, 0.0, 0.0, 0.0, 0.0]] for s in steps
+            ],
+            "shear_forces": [[] for _ in steps],
+        }
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    variables = mocked_session.ensight.utils.variables
+    filename = str(tmpdir.join("sweep.csv"))
+    forces = variables.compute_forces_sweep(
+        ["wing", "flap"],
+        press_var_obj="p",
+        area_ref=1.0,
+        density_ref=2.0,
+        velocity_x_ref=1.0,
+        velocity_y_ref=0.0,
+        velocity_z_ref=0.0,
+        up_vector=variables.UP_VECTOR_PLUS_Y,
+        timesteps=[1, 2, 3],
+        export_filename=filename,
+        chunk_size=2,
+    )
+    # One support check, then one request per chunk of timesteps
+    assert len(commands) == 3
+    assert forces["part_names"] == ["wing", "flap"]
+    assert forces["timesteps"].tolist() == [1, 2, 3]
+    assert forces["times"].tolist() == [0.5, 1.0, 1.5]
+    assert "shear_forces" not in forces
+    assert forces["pressure_forces"].shape == (3, 2, 6)
+    assert forces["pressure_forces"][2, 0, 1] == 6.0
+    assert forces["normalized_pressure_forces"][2, 0, 1] == 6.0
+    # lift is +Y and drag is +X
+    lds = forces["pressure_forces_lds_direction"]
+    assert lds.shape == (3, 2, 3)
+    assert lds[1, 0].tolist() == [4.0, 2.0, 0.0]
+    with open(filename) as fp:
+        lines = fp.read().splitlines()
+    assert len(lines) == 7
+    assert lines[0].startswith("Timestep , Time , Part Name , Pressure Force X")
+    assert lines[-1].startswith("3 , 1.5 , flap , 3.0")
+
+
+def test_calculator_pipeline(mocker):
+    ensight = mock.MagicMock()
+    ensight.utils.parts.get_part_id_obj_name = lambda plist, flag: list(plist)
+    ensight.objs.core.create_variable.side_effect = lambda name, expr, sources: f"var:{name}"
+    variables = Variables(ensight)
+    call_remote = mocker.patch.object(variables._remote, "call")
+    with variables.pipeline(prefix="Tmp") as calc:
+        var = calc.evaluate("Normal(plist)", ["wing", "flap"])
+        assert var == "var:Tmp_0"
+        # same expression and part set, in any order, is not evaluated again
+        assert calc.evaluate("Normal( plist )", ["flap", "wing"]) == var
+        assert calc.evaluate("Normal(plist)", ["wing"]) == "var:Tmp_1"
+        assert ensight.objs.core.create_variable.call_count == 2
+        assert calc.variables == ["var:Tmp_0", "var:Tmp_1"]
+    call_remote.assert_called_once_with("_destroy_variables_remote", ["var:Tmp_0", "var:Tmp_1"])
+    assert calc.variables == []
+
+
+def test_const_table(mocker):
+    ensight = mock.MagicMock()
+    ensight.objs.enums.ENS_VAR_CONSTANT = 1
+    ensight.objs.enums.ENS_VAR_CONSTANT_PER_PART = 2
+    ensight.Undefined = -1.2345e-10
+    variables_list = []
+    for name, vartype in (("Rho", 1), ("Area", 2), ("Pressure", 0)):
+        var = mock.MagicMock()
+        var.DESCRIPTION = name
+        var.VARTYPE = vartype
+        variables_list.append(var)
+    ensight.objs.core.VARIABLES = variables_list
+    ensight.objs.core.TIMESTEP = 4
+    ensight.objs.core.TIMESTEP_LIMITS = [0, 2]
+    parts = [mock.MagicMock(), mock.MagicMock()]
+    parts[0].get_values = lambda names: {names[0]: [1.0]}
+    parts[1].get_values = lambda names: {names[0]: [ensight.Undefined]}
+    ensight.utils.parts.get_part_id_obj_name = lambda plist, flag: parts
+    ensight.ensvariable = lambda name: (1.5, 1, -1)
+    variables = Variables(ensight)
+    table = variables._get_const_table_remote(None, [0, 1, 2])
+    assert table == {
+        "Rho": {"type": 1, "values": [1.5, 1.5, 1.5]},
+        "Area": {"type": 2, "values": [[1.0, ensight.Undefined]] * 3},
+    }
+    assert ensight.objs.core.TIMESTEP == 4
+    mocker.patch.object(variables._remote, "call", side_effect=lambda name, *args: table)
+    table = variables.get_const_table(all_timesteps=True, undef_nan=True)
+    assert table["Rho"]["values"].shape == (3,)
+    assert table["Area"]["values"].shape == (3, 2)
+    assert numpy.isnan(table["Area"]["values"][:, 1]).all()
+
+
+def test_create_queries(mocked_session, mocker):
+    commands = []
+
+    def cmd(value, do_eval=True):
+        commands.append(value)
+        if value.startswith("hasattr("):
+            return True
+        if "_get_query_data_remote" in value:
+            return [[[0.0, 1.0], [1.0, 2.0]], [[0.0, 3.0]]]
+        return ["query1", "query2"]
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    query = mocked_session.ensight.utils.query
+    part = mock.MagicMock()
+    part._remote_obj = lambda: "ensight.objs.wrap_id(12)"
+    specs = [
+        dict(
+            name="Line",
+            query_type=query.DISTANCE_LINE,
+            part_list=[part],
+            variable1="temperature",
+            point1=[0.0, 0.0, 0.0],
+            point2=[1.0, 0.0, 0.0],
+        ),
+        dict(name="Max", query_type=query.TEMPORAL_MAXIMUM, part_list=[1], variable1="p"),
+    ]
+    queries = query.create_queries(specs)
+    assert queries == ["query1", "query2"]
+    assert "'part_list': [ensight.objs.wrap_id(12)]" in commands[1]
+    data = query.get_query_data(queries)
+    assert [d.shape for d in data] == [(2, 2), (1, 2)]
+    with pytest.raises(RuntimeError):
+        query.create_queries([dict(name="Bad", query_type="bad")])
+
+
+def test_create_queries_remote():
+    from ansys.pyensight.core.utils.query import Query
+
+    ensight = mock.MagicMock()
+    core = ensight.objs.core
+    core.VARIABLES.get_attr.return_value = ["temperature", "p"]
+    core.QUERIES = [mock.MagicMock(__OBJID__=objid) for objid in (1, 2, 3)]
+    ensight.objs.next_id.side_effect = lambda: 100 + len(core.QUERIES)
+
+    def create():
+        core.QUERIES.append(mock.MagicMock(__OBJID__=100 + len(core.QUERIES)))
+
+    ensight.query_ent_var.query.side_effect = create
+    query = Query(ensight)
+    specs = [
+        dict(
+            name=f"Line {i}",
+            query_type=query.DISTANCE_LINE,
+            part_list=[1],
+            variable1="temperature",
+            point1=[0.0, 0.0, 0.0],
+            point2=[1.0, 0.0, 0.0],
+        )
+        for i in range(3)
+    ]
+    specs.append(dict(name="Max", query_type=query.TEMPORAL_MAXIMUM, part_list=[1], variable1="p"))
+    queries = query._create_queries_remote(specs)
+    assert queries == core.QUERIES[3:]
+    # the variable names are only fetched once for the whole batch
+    core.VARIABLES.get_attr.assert_called_once_with("DESCRIPTION")
+
+
+def test_geometry_stream(mocked_session, mocker, tmpdir):
+    content = {"/tmp/a/geom.glb": b"0123456789"}
+    removed = []
+    export = mocked_session.ensight.utils.export
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr(") or value.startswith("dir("):
+            return True
+        name, args = value[len("ensight.utils.export.") :].split("(", 1)
+        args = eval(f"[{args[:-1]}]")
+        if name == "_geometry_step_remote":
+            return "/tmp/a", [("/tmp/a/geom.glb", 10)]
+        if name == "_read_chunk_remote":
+            filename, offset, numbytes = args
+            return content[filename][offset : offset + numbytes]
+        if name == "_remove_remote":
+            removed.append(args[0])
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    mocker.patch.object(mocked_session, "ensight_version_check")
+    mocker.patch.object(export, "STREAM_CHUNK_SIZE", 4)
+    progress = mock.MagicMock()
+    filename = str(tmpdir.join("out.glb"))
+    names = list(export.geometry_stream(filename, starting_timestep=0, frames=3, progress=progress))
+    assert names == [str(tmpdir.join(f"out{idx:03d}.glb")) for idx in range(3)]
+    for name in names:
+        with open(name, "rb") as fp:
+            assert fp.read() == b"0123456789"
+    assert removed == ["/tmp/a"] * 3
+    assert progress.call_args_list == [mock.call(i, 3) for i in range(1, 4)]
+    export.geometry(filename, starting_timestep=0, frames=1)
+    with open(filename, "rb") as fp:
+        assert fp.read() == b"0123456789"
+
+
+def test_animation_stream(mocked_session, mocker, tmpdir):
+    frame = io.BytesIO()
+    Image.new("RGB", (4, 2)).save(frame, format="png")
+    content = {"/tmp/a/anim.mp4": b"mpeg4data", "/tmp/a/f0.png": frame.getvalue()}
+    remote_calls = []
+    export = mocked_session.ensight.utils.export
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr(") or value.startswith("dir("):
+            return True
+        name, args = value[len("ensight.utils.export.") :].split("(", 1)
+        args = eval(f"[{args[:-1]}]")
+        remote_calls.append(name)
+        if name == "_animation_file_remote":
+            if args[-1] == "png":
+                return "/tmp/a", [("/tmp/a/f0.png", len(content["/tmp/a/f0.png"]))] * 3
+            return "/tmp/a", [("/tmp/a/anim.mp4", 9)]
+        if name == "_animation_remote":
+            return content["/tmp/a/anim.mp4"]
+        if name == "_read_chunk_remote":
+            filename, offset, numbytes = args
+            return content[filename][offset : offset + numbytes]
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    mocker.patch.object(export, "STREAM_CHUNK_SIZE", 4)
+    mocked_session._ensight.objs.core.WINDOWSIZE = 800, 600
+    progress = mock.MagicMock()
+    filename = str(tmpdir.join("out.mp4"))
+    export.animation(filename, width=80, height=60, frames=10, progress=progress)
+    with open(filename, "rb") as fp:
+        assert fp.read() == b"mpeg4data"
+    assert progress.call_args_list == [mock.call(4, 9), mock.call(8, 9), mock.call(9, 9)]
+    assert remote_calls[-1] == "_remove_remote"
+    # frames rendered by EnSight, encoded here
+    writer = mock.MagicMock()
+    imageio = mock.MagicMock()
+    imageio.get_writer.return_value = writer
+    encode = type(export)._animation_encode_locally
+    mocker.patch.dict(encode.__globals__, {"_import_imageio": lambda: imageio})
+    progress.reset_mock()
+    export.animation(
+        filename, width=80, height=60, frames=3, progress=progress, encode_locally=True
+    )
+    assert writer.append_data.call_count == 3
+    assert writer.append_data.call_args[0][0].shape == (2, 4, 3)
+    writer.close.assert_called_once()
+    assert progress.call_args_list == [mock.call(i, 3) for i in range(1, 4)]
+    assert remote_calls[-1] == "_remove_remote"
+    # EnSight sessions without chunked reads fall back to a single reply
+    content["/tmp/a/anim.mp4"] = b"single"
+    available = {"_animation_file_remote": True, "_read_chunk_remote": False}
+    mocker.patch.dict(export._remote._available, available, clear=True)
+    remote_calls.clear()
+    export.animation(filename, width=80, height=60, frames=3, encode_locally=True)
+    assert remote_calls == ["_animation_remote"]
+    with open(filename, "rb") as fp:
+        assert fp.read() == b"single"
+
+
+def test_image_buffers(mocked_session, mocker, tmpdir):
+    export = mocked_session.ensight.utils.export
+    img = mock.MagicMock()
+    img.pixeldata = numpy.arange(24, dtype=numpy.uint8).reshape(2, 4, 3)
+    img.pickdata = numpy.arange(8, dtype=numpy.uint8).reshape(2, 4)
+    img.variabledata = numpy.arange(8, dtype=numpy.float32).reshape(2, 4)
+    img.metadata = "{}"
+    mocker.patch.object(export, "_render_remote", return_value=img)
+    reply = export._image_buffers_remote(4, 2, 4, True, False)
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr(") or value.startswith("dir("):
+            return True
+        assert value.startswith("ensight.utils.export._image_buffers_remote(")
+        return reply
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    mocked_session._ensight.objs.core.WINDOWSIZE = 800, 600
+    planes = export.image_data(4, 2, enhanced=True)
+    assert numpy.array_equal(planes["pixeldata"], img.pixeldata[::-1])
+    assert numpy.array_equal(planes["pickdata"], img.pickdata[::-1])
+    assert numpy.array_equal(planes["variabledata"], img.variabledata[::-1])
+    assert planes["variabledata"].dtype == numpy.float32
+    filename = str(tmpdir.join("out.tif"))
+    export.image(filename, width=4, height=2, enhanced=True)
+    with Image.open(filename) as image:
+        assert image.n_frames == 3
+        assert numpy.array_equal(numpy.asarray(image), img.pixeldata[::-1])
+
+
+def test_render_batch(mocked_session, mocker):
+    export = mocked_session.ensight.utils.export
+    core = mocked_session._ensight.objs.core
+    core.WINDOWSIZE = 8, 6
+    core.TIMESTEP = 0
+    vport = mock.MagicMock()
+    vport.CORETRANSFORM = [0.0] * 4
+    core.VPORTS = [vport]
+    mocked_session.ensight.utils.views.views_dict["iso"] = (0, [1.0] * 4)
+    rendered = []
+
+    def render(width, height, passes, enhanced, raytrace):
+        rendered.append((vport.CORETRANSFORM, core.TIMESTEP, width))
+        img = mock.MagicMock()
+        img.pixeldata = numpy.full((height, width, 3), core.TIMESTEP, dtype=numpy.uint8)
+        img.pickdata = img.variabledata = None
+        img.metadata = "{}"
+        return img
+
+    mocker.patch.object(export, "_render_remote", side_effect=render)
+    requests = []
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr(") or value.startswith("dir("):
+            return True
+        assert value.startswith("ensight.utils.export._render_batch_remote(")
+        jobs = eval(value[len("ensight.utils.export._render_batch_remote(") : -1])
+        requests.append(len(jobs))
+        return eval(repr(export._render_batch_remote(jobs)))
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    jobs = [dict(view="iso", timestep=t) for t in range(5)] + [dict(width=4, height=2)]
+    results = list(export.render_batch(jobs, chunk_size=4))
+    assert requests == [4, 2]
+    assert [index for index, _ in results] == list(range(6))
+    assert results[3][1][0].size == (8, 6)
+    assert results[3][1][0].getpixel((0, 0)) == (3, 3, 3)
+    assert results[5][1][0].size == (4, 2)
+    assert rendered[0] == ([1.0] * 4, 0, 8)
+    assert rendered[3] == ([1.0] * 4, 3, 8)
+    # the view and the timestep are restored after each chunk
+    assert rendered[4] == ([1.0] * 4, 4, 8)
+    assert rendered[5] == ([0.0] * 4, 0, 4)
+    assert vport.CORETRANSFORM == [0.0] * 4
+    assert core.TIMESTEP == 0
+    # spread the chunks across a pool of sessions
+    requests.clear()
+    results = list(export.render_batch(jobs, chunk_size=1, sessions=[mocked_session] * 3))
+    assert sorted(index for index, _ in results) == list(range(6))
+    assert requests == [1] * 6
+    # closing the generator early stops the workers and joins them
+    requests.clear()
+    gate = threading.Event()
+
+    def gated_cmd(value, do_eval=True):
+        if requests:
+            gate.wait()
+        return cmd(value, do_eval)
+
+    mocked_session.cmd.side_effect = gated_cmd
+    batch = export.render_batch(jobs, chunk_size=1, sessions=[mocked_session])
+    next(batch)
+    threading.Timer(0.1, gate.set).start()
+    batch.close()
+    assert requests == [1, 1]
+    mocked_session.cmd.side_effect = cmd
+    with pytest.raises(RuntimeError):
+        list(export.render_batch([dict(view="missing")]))
+    with pytest.raises(RuntimeError):
+        list(export.render_batch([dict(size=3)]))
+
+
+def test_views_snapshot(mocked_session, mocker, tmpdir):
+    views = mocked_session.ensight.utils.views
+    vport = mock.MagicMock()
+    vport.CORETRANSFORM = [0.5] * 4
+    vport.BOUNDINGBOX = [0.0, 0.0, 0.0, 2.0, 4.0, 6.0]
+    mocked_session._ensight.objs.core.VPORTS = [vport]
+    commands = []
+
+    def cmd(value, do_eval=True):
+        commands.append(value)
+        if value.startswith("hasattr("):
+            return True
+        return eval(repr(eval(value, {"ensight": mocked_session.ensight})))
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    views.save_current_view("first")
+    assert commands[-1] == "ensight.utils.views._view_state_remote(0)"
+    assert views.views_dict["first"] == (0, [0.5] * 4)
+    assert views.compute_model_centroid() == [1.0, 2.0, 3.0]
+    vport.CORETRANSFORM = [0.0] * 4
+    commands.clear()
+    views.restore_view("first")
+    assert [c for c in commands if not c.startswith("hasattr(")] == [
+        "ensight.utils.views._restore_view_remote(0, [0.5, 0.5, 0.5, 0.5])"
+    ]
+    assert vport.CORETRANSFORM == [0.5] * 4
+    filename = str(tmpdir.join("views.json"))
+    views.save_views(filename)
+    views.views_dict.clear()
+    views.views_dict["other"] = (0, [1.0] * 4)
+    views.load_views(filename)
+    assert views.views_dict == {"other": (0, [1.0] * 4), "first": (0, [0.5] * 4)}
+    views.load_views(filename, replace=True)
+    assert list(views.views_dict) == ["first"]
+
+
+def test_part_index(mocked_session, mocker):
+    class FakePart:
+        def __init__(self, objid, partnumber, description, metadata):
+            self.__OBJID__ = objid
+            self.PARTNUMBER = partnumber
+            self.DESCRIPTION = description
+            self.METADATA = metadata
+
+    parts = [
+        FakePart(100 + i, i + 1, f"part{i % 3}", {"kind": "wall" if i % 2 else "inlet"})
+        for i in range(6)
+    ]
+    objs = mocked_session._ensight.objs
+    objs.core.PARTS = parts
+    objs.ENS_PART = FakePart
+    objs.wrap_id = lambda objid: next(p for p in parts if p.__OBJID__ == objid)
+    callbacks = {}
+    objs.addcallback = lambda target, obj, method, attrs: callbacks.update({target: method})
+    utils = mocked_session.ensight.utils.parts
+    requests = []
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr("):
+            return True
+        requests.append(value)
+        return eval(value, {"ensight": mocked_session.ensight})
+
+    def rename(part, description):
+        part.DESCRIPTION = description
+        callbacks[FakePart](part, "DESCRIPTION")
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    assert utils.get_part_id_obj_name(["part1", "part2"], "id") == [2, 5, 3, 6]
+    assert utils.get_part_id_obj_name([4, 1], "name") == ["part0", "part0"]
+    assert utils.get_part_id_obj_name(["3"], "obj") == [parts[2]]
+    assert utils.get_part_id_obj_name(None, "id") == [1, 2, 3, 4, 5, 6]
+    # one request per lookup, and the rows are only sent once
+    assert (
+        requests
+        == ["ensight.utils.parts._part_changes_remote(-1)"]
+        + ["ensight.utils.parts._part_changes_remote(0)"] * 3
+    )
+    assert set(callbacks) == {objs.core, FakePart}
+    assert utils._part_changes_remote(0) == (0, None, [])
+    # ENS_PART input does not use the index
+    requests.clear()
+    assert utils.get_part_id_obj_name(parts[1], "obj") == [parts[1]]
+    assert requests == []
+    parts[1].DESCRIPTION = "other"
+    assert utils.get_part_id_obj_name(parts[1:3], "name") == ["other", "part2"]
+    assert requests == ["ensight.utils.parts._part_rows_remote([101, 102])"]
+    parts[1].DESCRIPTION = "part1"
+    # a renamed part is picked up by the next lookup, and only its row is sent
+    rename(parts[0], "renamed")
+    rename(parts[0], "renamed")
+    assert utils._part_changes_remote(0) == (2, None, [utils._part_row(parts[0])])
+    assert utils.get_part_id_obj_name("renamed", "id") == [1]
+    assert utils._index_generation == 2
+    # a new part and a deleted one
+    parts.append(FakePart(200, 7, "part1", {"kind": "outlet"}))
+    del parts[1]
+    callbacks[objs.core](objs.core, "PARTS")
+    generation, order, rows = utils._part_changes_remote(2)
+    assert order == [p.__OBJID__ for p in parts]
+    assert rows == [utils._part_row(parts[-1])]
+    assert utils.get_part_id_obj_name("part1", "id") == [5, 7]
+    assert utils.get_part_id_obj_name(None, "obj") == parts
+    found = utils.select_parts_by_tag("kind", "wall")
+    assert [p.PARTNUMBER for p in found] == [4, 6]
+    assert requests[-1] == "ensight.utils.parts._select_parts_by_tag_remote([[('kind', 'wall')]])"
+    # a caller older than the change log gets all the parts again
+    mocker.patch.object(utils, "PART_CHANGE_LOG_SIZE", 4)
+    for _ in range(5):
+        rename(parts[0], "renamed")
+    assert utils._log_start > generation
+    assert utils._part_changes_remote(generation)[1:] == (
+        [p.__OBJID__ for p in parts],
+        [utils._part_row(p) for p in parts],
+    )
+    rename(parts[0], "part0")
+    assert utils.get_part_id_obj_name("part0", "id") == [1, 4]
+
+
+def test_select_parts_by_tag(mocked_session, mocker):
+    part_list = []
+    for i in range(8):
+        part = mock.MagicMock()
+        part.PARTNUMBER = i
+        part.METADATA = {"zone": "fluid" if i < 4 else "solid", "type": ["wall", "inlet"][i % 2]}
+        if i == 7:
+            part.METADATA["extra"] = "inlet"
+        part_list.append(part)
+    mocked_session._ensight.objs.core.PARTS = part_list
+    utils = mocked_session.ensight.utils.parts
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr("):
+            return True
+        return eval(value, {"ensight": mocked_session.ensight})
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+
+    def numbers(**kwargs):
+        return [p.PARTNUMBER for p in utils.select_parts_by_tag(**kwargs)]
+
+    assert numbers(tagdict={"zone": "fluid", "type": "wall"}) == [0, 2]
+    assert numbers(tagdict=[{"zone": "solid", "type": "wall"}, {"type": "inlet"}]) == [
+        1,
+        3,
+        4,
+        5,
+        6,
+        7,
+    ]
+    assert numbers(tagdict={"extra": None}) == [7]
+    assert numbers(value="solid") == [4, 5, 6, 7]
+    assert numbers(tag="extra") == [7]
+
+
+def test_bulk_emitters(mocked_session, mocker):
+    utils = mocked_session.ensight.utils.parts
+    trace = mock.MagicMock()
+    trace._remote_obj = lambda: "ensight.objs.wrap_id(42)"
+    trace.EMITTERS = ["old"]
+    mocked_session._ensight.objs.wrap_id = lambda objid: trace
+    mocker.patch.object(mocked_session, "ensight_version_check")
+    mocker.patch.object(
+        type(utils), "_EnSEmitterPoint", side_effect=lambda ensight, point1: tuple(point1)
+    )
+    mocker.patch.object(
+        type(utils),
+        "_EnSEmitterLine",
+        side_effect=lambda ensight, point1, point2, num_points: (point1, point2, num_points),
+    )
+    commands = []
+
+    def cmd(value, do_eval=True):
+        if value.startswith("hasattr("):
+            return True
+        commands.append(value)
+        return eval(value, {"ensight": mocked_session.ensight})
+
+    mocker.patch.object(mocked_session, "cmd", side_effect=cmd)
+    points = numpy.arange(3000, dtype=numpy.float32).reshape(1000, 3)
+    assert utils.add_emitter_points_to_particle_trace_part(trace, points) is trace
+    assert len(commands) == 1
+    assert commands[0].startswith(
+        "ensight.utils.parts._add_emitters_remote(ensight.objs.wrap_id(42), 0,"
+    )
+    assert len(trace.EMITTERS) == 1001
+    assert trace.EMITTERS[:2] == ["old", (0.0, 1.0, 2.0)]
+    assert trace.EMITTERS[-1] == (2997.0, 2998.0, 2999.0)
+    lines = [[[0, 0, 0], [1, 0, 0]], [[0, 1, 0], [1, 1, 0]]]
+    utils.add_emitter_lines_to_particle_trace_part(trace, lines, num_points=5)
+    assert trace.EMITTERS[-1] == ([0.0, 1.0, 0.0], [1.0, 1.0, 0.0], 5)
+    utils.add_emitter_line_to_particle_trace_part(trace, [0, 0, 0], [0, 0, 1], num_points=7)
+    assert trace.EMITTERS[-1] == ([0.0, 0.0, 0.0], [0.0, 0.0, 1.0], 7)
+    assert len(trace.EMITTERS) == 1004
+    with pytest.raises(RuntimeError):
+        utils.add_emitter_points_to_particle_trace_part(trace, [[0, 0]])
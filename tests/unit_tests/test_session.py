@@ -23,11 +23,16 @@
 """Unit tests for session.py"""
 
 import fnmatch
+import gc
+import json
 import platform
+import threading
 from unittest import mock
 import webbrowser
 
 import ansys.pyensight.core
+from ansys.pyensight.core.ensobj import ENSOBJ
+from ansys.pyensight.core.listobj import ensobjlist
 import ansys.pyensight.core.renderable
 from ansys.pyensight.core.session import Session  # noqa: F401
 import pytest
@@ -235,7 +240,128 @@ def test_callbacks(mocked_session, mocker):
     session._event_callback(url)
     url = "grpc://abcd1234-5678efgh/?tag&vport?enum=1&uid=0"
     session._event_callback(url)
+    # events are dispatched to the callback with the longest matching tag
+    events = []
+    session.add_callback("test", "part", ["a"], lambda url: events.append(("part", url)))
+    session.add_callback("test", "partx", ["a"], lambda url: events.append(("partx", url)))
+    session._event_callback("grpc://abcd1234-5678efgh/partx?enum=1&uid=0")
+    session._event_callback("grpc://abcd1234-5678efgh/partlis?enum=1&uid=0")
+    session.remove_callback("partx")
+    session._event_callback("grpc://abcd1234-5678efgh/partx?enum=1&uid=0")
+    assert [name for name, _ in events] == ["partx", "part", "part"]
+    assert session._callbacks.match("partlist") == session._callbacks["partlist"]
     session._callbacks.clear()
+    assert session._callbacks.match("partlist") is None
+
+
+def test_subscriptions(mocked_session, mocker):
+    session = mocked_session
+    cmd = mocker.patch.object(session, "cmd", return_value=[5, 6])
+    session._grpc.event_stream_enable = mock.MagicMock("stream")
+    session._grpc.prefix = lambda: ""
+    parts = ensobjlist([ENSOBJ(session, 10), ENSOBJ(session, 11)])
+    parts[0].attrinfo = mock.MagicMock(return_value={"name": "COLORBYRGB"})
+    events = []
+    tag = parts.subscribe(["VISIBLE", 42], lambda *args: events.append(args))
+    command = cmd.call_args[0][0]
+    assert "'pyensight_subscription_0?VISIBLE={{VISIBLE}}&COLORBYRGB={{COLORBYRGB}}'" in command
+    assert command.endswith(" for _id in [10, 11]]")
+    assert session._callbacks[tag][0] == [5, 6]
+    url = "grpc://abcd1234-5678efgh/" + tag
+    url += "?VISIBLE=False&COLORBYRGB=%5B1.0%2C%200.0%2C%200.0%5D?enum=VISIBLE&uid=11"
+    session._event_callback(url)
+    assert events == [(parts[1], "VISIBLE", {"VISIBLE": False, "COLORBYRGB": [1.0, 0.0, 0.0]})]
+    session.remove_callback(tag)
+    assert cmd.call_args[0][0] == "for _id in [5, 6]: ensight.objs.removecallback(_id)"
+    tag = parts[0].subscribe(["DESCRIPTION"], print)
+    assert tag == "pyensight_subscription_1"
+    assert session._decode_macro("hood") == "hood"
+    with pytest.raises(RuntimeError):
+        ensobjlist([1, 2]).subscribe(["VISIBLE"], print)
+    session._callbacks.clear()
+
+
+def test_metadata_cache(mocked_session, mocker):
+    from ansys.pyensight.core import session as session_module
+
+    session = mocked_session
+    # the fixture changed the version after the session start
+    session._load_metadata()
+    pathname = session._metadata_cache_pathname()
+    with open(pathname) as fp:
+        metadata = json.load(fp)
+    assert metadata["enums"] == {"a": 1, "b": 2, "c": 3}
+    assert metadata["subtype_tables"]["ENS_TOOL"]["6"] == "ENS_TOOL_SPHERE"
+    assert session._obj_attr_subtype("ENS_TOOL")[1][6] == "ENS_TOOL_SPHERE"
+    # later sessions load the metadata from memory or from disk
+    cmd = mocker.patch.object(session, "cmd", return_value={"a": 1, "b": 5})
+    assert session._load_metadata()["enums"]["b"] == 2
+    session_module._METADATA_MEMO.clear()
+    assert session._load_metadata()["enums"]["b"] == 2
+    cmd.assert_not_called()
+    # the cache is checked against EnSight on request
+    assert not session.validate_metadata_cache()
+    assert session.ensight.objs.enums.b == 5
+    session_module._METADATA_MEMO.clear()
+    assert session._load_metadata()["enums"] == {"a": 1, "b": 5}
+    assert session.validate_metadata_cache()
+    # another build of the same EnSight version uses its own cache file
+    session._ensight_build = "another build"
+    assert session._metadata_cache_pathname() != pathname
+    mocker.patch.dict("os.environ", {"PYENSIGHT_METADATA_CACHE": ""})
+    assert session.metadata_cache_dir() is None
+    assert session._load_metadata()["enums"] == {"a": 1, "b": 5}
+
+
+def test_establish_connection(mocked_session, mocker):
+    session = mocked_session
+    timings = session.startup_timings
+    assert set(timings) >= {"grpc_probe", "rest_probe", "metadata", "core"}
+    # the channel becomes ready on the second connect, the service on the third probe
+    ready = iter([False, False, True, True, True, True])
+    session._grpc.is_connected = lambda: next(ready)
+    session._grpc.connect = mock.MagicMock("connect")
+    cmd = mocker.patch.object(
+        session, "cmd", side_effect=[IOError("not ready"), IOError("not ready"), "/ansys", "261"]
+    )
+    sleep = mocker.patch("time.sleep")
+    session._establish_connection(validate=True)
+    assert session._grpc.connect.call_count == 2
+    assert cmd.call_count == 4
+    assert session.cei_home == "/ansys"
+    assert session.cei_suffix == "261"
+    # the phases are only timed while the session starts
+    assert session.startup_timings == timings
+    # jittered exponential backoff between the probes
+    delays = [args[0][0] for args in sleep.call_args_list]
+    assert len(delays) == 2
+    assert 0.025 <= delays[0] <= 0.05
+    assert 0.05 <= delays[1] <= 0.1
+    # the deadline bounds the retries
+    session._grpc.is_connected = lambda: False
+    session.timeout = 0.0
+    with pytest.raises(RuntimeError):
+        session._establish_connection()
+
+
+def test_event_queue():
+    from ansys.pyensight.core.ensight_grpc import EnSightGRPC
+
+    grpc = EnSightGRPC()
+    grpc.event_queue_configure(size=2)
+    for tag in ("a", "b", "c"):
+        grpc._put_event(mock.MagicMock(tag=tag))
+    assert grpc.events_dropped == 1
+    assert [grpc.get_event(), grpc.get_event(), grpc.get_event()] == ["b", "c", None]
+    grpc.event_queue_configure(overflow="drop_newest", coalesce=True)
+    for tag in ("a", "a", "b", "a", "c"):
+        grpc._put_event(mock.MagicMock(tag=tag))
+    assert grpc.events_dropped == 2
+    assert [grpc.get_event(), grpc.get_event(), grpc.get_event()] == ["a", "b", None]
+    with pytest.raises(RuntimeError):
+        grpc.event_queue_configure(size=0)
+    with pytest.raises(RuntimeError):
+        grpc.event_queue_configure(overflow="block")
 
 
 def test_convert_ctor(mocked_session, mocker):
@@ -260,9 +386,25 @@ def test_convert_ctor(mocked_session, mocker):
     assert fnmatch.fnmatch(
         value, "session.ensight.objs.ENS_TOOL_SPHERE(session, 763,attr_id=*, attr_value=6)"
     )
-    session._ensobj_hash = {i: i for i in range(10000000)}
+    # the least recently used proxies are dropped once the cache is full
+    session.proxy_cache_size = 2
+    proxies = [mock.MagicMock(__OBJID__=i) for i in (221, 222, 223)]
+    for proxy in proxies:
+        session.add_ensobj_instance(proxy)
+    assert len(session._ensobj_hash) == 2
+    # a dropped proxy still in use keeps its identity
+    value = session._convert_ctor("Class: ENS_GLOBALS, CvfObjID: 221, cached:yes")
+    assert value == "session.obj_instance(221)"
+    assert session.obj_instance(221) is proxies[0]
+    assert session.obj_instance(222) is None or session.obj_instance(222) is proxies[1]
+    del proxies
+    session._ensobj_hash.clear()
+    gc.collect()
     value = session._convert_ctor("Class: ENS_GLOBALS, CvfObjID: 221, cached:yes")
     assert value == "session.ensight.objs.ENS_GLOBALS(session, 221)"
+    with pytest.raises(RuntimeError):
+        session.proxy_cache_size = 0
+    session.proxy_cache_size = session.DEFAULT_PROXY_CACHE_SIZE
     session._convert_ctor("test")
     session._convert_ctor("CvfObjID: 221, Class: ENS_GLOBALS, cached:yes")
     session._convert_ctor("CvfObjID: 221, Class: ENS_GLOBALS, cachedcachedcached:yes")
@@ -280,6 +422,52 @@ def test_close(mocked_session, mocker):
     session.close()
 
 
+def test_release_batches(mocked_session, mocker):
+    session = mocked_session
+    session._grpc.shutdown = mock.MagicMock("shutdown")
+    session._grpc.command = mock.MagicMock("command")
+    session.RELEASE_BATCH_SIZE = 3
+    session.RELEASE_INTERVAL = 60.0
+    session._dsg_session = mock.MagicMock()
+    session._dsg_session._pyensight_grpc_coming = False
+    released = threading.Event()
+    coming = []
+
+    def command(*args, **kwargs):
+        coming.append(session._dsg_session._pyensight_grpc_coming)
+        released.set()
+
+    session._grpc.command.side_effect = command
+    proxies = [ENSOBJ(session, objid, owned=True) for objid in (10, 11, 12, 13)]
+    del proxies[:3]
+    # the batch is sent by the background thread
+    assert released.wait(5.0)
+    command = session._grpc.command.call_args[0][0]
+    assert command.endswith(f": ensight.objs.release_id('{session.name}', _id)")
+    assert sorted(eval(command[len("for _id in ") : command.index(":")])) == [10, 11, 12]
+    # the thread stops when nothing is queued
+    thread = session._release_thread
+    session._release_event.set()
+    thread.join(5.0)
+    assert session._release_thread is None
+    # without a connection, the releases stay queued
+    checked = threading.Event()
+    session._grpc.is_connected = lambda: checked.set()
+    proxies.clear()
+    session._release_event.set()
+    assert checked.wait(5.0)
+    assert list(session._release_queue) == [13]
+    # the remaining releases are sent when the session is closed
+    session.close()
+    command = session._grpc.command.call_args[0][0]
+    assert command == f"for _id in [13]: ensight.objs.release_id('{session.name}', _id)"
+    assert session._grpc.command.call_count == 2
+    # the DSG session is told about the release commands
+    assert coming == [True, True]
+    assert session._dsg_session._pyensight_grpc_coming is False
+    assert not session._release_thread.is_alive()
+
+
 def test_render(mocked_session):
     mocked_session.grpc.render = mock.MagicMock("render")
     mocked_session.render(300, 400, 5)
@@ -317,3 +505,40 @@ def test_close(local_launcher_session) -> None:
     local_launcher_session.close()
     assert local_launcher_session.launcher is None
 """
+
+
+def test_convert_ctor_list(mocked_session):
+    session: "Session" = mocked_session
+    value = session._convert_ctor(
+        "[Class: ENS_GLOBALS, CvfObjID: 221, cached:yes, "
+        "Class: ENS_PART, desc: 'a, b', PartType: 0, CvfObjID: 1078, cached:no, "
+        "Class: ENS_GROUP, desc: '', Owned, CvfObjID: 1043, cached:no]"
+    )
+    assert value.startswith("ensobjlist([session.ensight.objs.ENS_GLOBALS(session, 221), ")
+    assert fnmatch.fnmatch(
+        value,
+        "*, session.ensight.objs.ENS_PART_MODEL(session, 1078,attr_id=*, attr_value=0), "
+        "session.ensight.objs.ENS_GROUP(session, 1043,owned=True)], session=session)",
+    )
+
+
+def test_decode_json(mocked_session):
+    session: "Session" = mocked_session
+    command = session._JSON_COMMAND.format("ensight.objs.core.PARTS")
+    assert command.startswith("__import__('json').dumps({'result': ensight.objs.core.PARTS}")
+    result = {
+        "result": [
+            {"__ensobj__": "Class: ENS_GLOBALS, CvfObjID: 221, cached:yes"},
+            {"__ensobj__": "Class: ENS_PART, desc: 'x', PartType: 0, CvfObjID: 9, cached:no"},
+        ]
+    }
+    # the reply can be the JSON encoding of the string built in EnSight or the value
+    for reply in (json.dumps(json.dumps(result)), json.dumps(result)):
+        session._ensobj_hash.clear()
+        value = session._decode_json(reply)
+        assert isinstance(value, ensobjlist)
+        assert [v.__OBJID__ for v in value] == [221, 9]
+        assert type(value[1]).__name__ == "ENS_PART_MODEL"
+        assert session._decode_json(reply)[0] is value[0]
+    value = session._decode_json(json.dumps({"result": {"a": [1, 2], "b": "x"}}))
+    assert value == {"a": [1, 2], "b": "x"}